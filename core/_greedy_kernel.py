@@ -0,0 +1,99 @@
+import functools
+import importlib.util
+
+import numpy as np
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from core.models import Fact, Rule
+
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def compile_rules(rules: List[Rule]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[Fact, int]]:
+
+
+
+
+
+    fact_ids: Dict[Fact, int] = {}
+    premise_ptr = np.zeros(len(rules) + 1, dtype=np.int64)
+    conclusion_ids = np.empty(len(rules), dtype=np.int64)
+    premise_ids: List[int] = []
+
+    for position, rule in enumerate(rules):
+        for premise in rule.premises:
+            premise_ids.append(fact_ids.setdefault(premise, len(fact_ids)))
+        premise_ptr[position + 1] = len(premise_ids)
+        conclusion_ids[position] = fact_ids.setdefault(rule.conclusion, len(fact_ids))
+
+    return premise_ptr, np.array(premise_ids, dtype=np.int64), conclusion_ids, fact_ids
+
+
+def _greedy_rounds(premise_ptr: np.ndarray, premise_ids: np.ndarray, conclusion_ids: np.ndarray,
+                   known: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+
+
+
+
+
+    n_rules = conclusion_ids.shape[0]
+    fired = np.empty(n_rules, dtype=np.int64)
+    round_ends = np.empty(n_rules, dtype=np.int64)
+    n_fired = 0
+    n_rounds = 0
+
+    while True:
+        start = n_fired
+        for r in range(n_rules):
+            if known[conclusion_ids[r]]:
+                continue
+            satisfied = True
+            for k in range(premise_ptr[r], premise_ptr[r + 1]):
+                if not known[premise_ids[k]]:
+                    satisfied = False
+                    break
+            if satisfied:
+                fired[n_fired] = r
+                n_fired += 1
+
+        if n_fired == start:
+            break
+        for k in range(start, n_fired):
+            known[conclusion_ids[fired[k]]] = True
+        round_ends[n_rounds] = n_fired
+        n_rounds += 1
+
+    return fired[:n_fired], round_ends[:n_rounds]
+
+
+@functools.lru_cache(maxsize=None)
+def _greedy_rounds_kernel():
+
+    if not NUMBA_AVAILABLE:
+        return _greedy_rounds
+
+    from numba import njit
+    return njit(cache=True)(_greedy_rounds)
+
+
+def greedy_rounds(rules: List[Rule], facts: Iterable[Fact]) -> Iterator[List[int]]:
+
+
+
+
+
+    premise_ptr, premise_ids, conclusion_ids, fact_ids = compile_rules(rules)
+    known = np.zeros(len(fact_ids), dtype=np.bool_)
+    for fact in facts:
+        fact_id = fact_ids.get(fact)
+        if fact_id is not None:
+            known[fact_id] = True
+
+    fired, round_ends = _greedy_rounds_kernel()(premise_ptr, premise_ids, conclusion_ids, known)
+    fired = fired.tolist()
+    start = 0
+    for end in round_ends.tolist():
+        yield fired[start:end]
+        start = end
+    yield []
@@ -14,6 +14,7 @@ from typing import List, Set, Dict, Tuple
 from dataclasses import dataclass
 import logging
 import numpy as np
+from scipy.sparse import csr_matrix
 from sklearn.cluster import AgglomerativeClustering, KMeans
 from collections import Counter
 
@@ -23,7 +24,7 @@ from core.models import Rule, Fact
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleCluster:
 
 
@@ -108,13 +109,10 @@ class RuleClusterer:
         logger.info(f"[CLUSTERING] Klasteryzacja {len(rules)} reguł na {n_clusters} klastrów (method={self.method}, centroid_method={self.centroid_method})")
 
 
-        similarity_matrix = self._compute_similarity_matrix(rules)
-
-
-        distance_matrix = 1.0 - similarity_matrix
-
-
         if self.method == 'agglomerative':
+            similarity_matrix = self._compute_similarity_matrix(rules)
+            distance_matrix = 1.0 - similarity_matrix
+
             clusterer = AgglomerativeClustering(
                 n_clusters=n_clusters,
                 metric='precomputed',
@@ -127,7 +125,7 @@ class RuleClusterer:
             clusterer = KMeans(
                 n_clusters=n_clusters,
                 random_state=self.random_state,
-                n_init=10
+                n_init=3
             )
             labels = clusterer.fit_predict(feature_vectors)
         else:
@@ -215,7 +213,7 @@ class RuleClusterer:
 
         return similarity_matrix
 
-    def _rules_to_feature_vectors(self, rules: List[Rule]) -> np.ndarray:
+    def _rules_to_feature_vectors(self, rules: List[Rule]) -> csr_matrix:
 
 
 
@@ -240,18 +238,16 @@ class RuleClusterer:
         fact_to_idx = {fact: idx for idx, fact in enumerate(sorted(all_facts))}
 
 
-        n_rules = len(rules)
-        n_facts = len(all_facts)
-        features = np.zeros((n_rules, n_facts), dtype=np.int8)
-
+        row = []
+        col = []
         for i, rule in enumerate(rules):
-            for premise in rule.premises:
-                fact = (premise.attribute, premise.value)
-                if fact in fact_to_idx:
-                    j = fact_to_idx[fact]
-                    features[i, j] = 1
+            for j in {fact_to_idx[(premise.attribute, premise.value)] for premise in rule.premises}:
+                row.append(i)
+                col.append(j)
+
+        data = np.ones(len(row), dtype=np.float64)
 
-        return features
+        return csr_matrix((data, (row, col)), shape=(len(rules), len(fact_to_idx)))
 
     def _compute_centroid(self, cluster_rules: List[Rule], cluster_id: int) -> Rule:
 
@@ -301,7 +297,7 @@ class RuleClusterer:
             for rule in cluster_rules
         )
         most_common_conclusion = conclusion_counter.most_common(1)[0][0]
-        conclusion = Fact(most_common_conclusion[0], most_common_conclusion[1])
+        conclusion = Fact.intern(most_common_conclusion[0], most_common_conclusion[1])
 
 
 
@@ -320,7 +316,7 @@ class RuleClusterer:
 
 
         centroid_premises = [
-            Fact(attr, val) for (attr, val) in sorted(common_premises)
+            Fact.intern(attr, val) for (attr, val) in sorted(common_premises)
         ]
 
 
@@ -331,7 +327,7 @@ class RuleClusterer:
                 for premise in rule.premises:
                     fact_counter[(premise.attribute, premise.value)] += 1
             most_common = fact_counter.most_common(1)[0][0]
-            centroid_premises = [Fact(most_common[0], most_common[1])]
+            centroid_premises = [Fact.intern(most_common[0], most_common[1])]
 
         centroid_id = 1_000_000 + cluster_id
 
@@ -363,7 +359,7 @@ class RuleClusterer:
             for rule in cluster_rules
         )
         most_common_conclusion = conclusion_counter.most_common(1)[0][0]
-        conclusion = Fact(most_common_conclusion[0], most_common_conclusion[1])
+        conclusion = Fact.intern(most_common_conclusion[0], most_common_conclusion[1])
 
 
         all_premises = set()
@@ -373,7 +369,7 @@ class RuleClusterer:
 
 
         centroid_premises = [
-            Fact(attr, val) for (attr, val) in sorted(all_premises)
+            Fact.intern(attr, val) for (attr, val) in sorted(all_premises)
         ]
 
         centroid_id = 1_000_000 + cluster_id
@@ -408,7 +404,7 @@ class RuleClusterer:
             for rule in cluster_rules
         )
         most_common_conclusion = conclusion_counter.most_common(1)[0][0]
-        conclusion = Fact(most_common_conclusion[0], most_common_conclusion[1])
+        conclusion = Fact.intern(most_common_conclusion[0], most_common_conclusion[1])
 
 
         fact_counter = Counter()
@@ -425,7 +421,7 @@ class RuleClusterer:
         for (attribute, value), count in fact_counter.items():
             frequency = count / n_rules
             if frequency >= threshold:
-                centroid_premises.append(Fact(attribute, value))
+                centroid_premises.append(Fact.intern(attribute, value))
 
 
         centroid_premises.sort(key=lambda f: (f.attribute, f.value))
@@ -434,7 +430,7 @@ class RuleClusterer:
 
         if not centroid_premises:
             most_common = fact_counter.most_common(1)[0][0]
-            centroid_premises = [Fact(most_common[0], most_common[1])]
+            centroid_premises = [Fact.intern(most_common[0], most_common[1])]
 
         centroid_id = 1_000_000 + cluster_id
 
@@ -645,7 +645,7 @@ class ExperimentRunner:
                 self.logger.info(f"[INFERENCE] Goal: any value of attribute '{goal_target}'")
             else:
 
-                goal_target = Fact(self.config.goal[0], str(self.config.goal[1]))
+                goal_target = Fact.intern(self.config.goal[0], str(self.config.goal[1]))
                 self.logger.info(f"[INFERENCE] Goal: {goal_target}")
 
 
@@ -727,7 +727,7 @@ class ExperimentRunner:
             value_str = str(value)
 
 
-            fact = Fact(attribute=column, value=value_str)
+            fact = Fact.intern(attribute=column, value=value_str)
             facts.add(fact)
 
         return facts
@@ -11,18 +11,24 @@
 
 
 from dataclasses import dataclass, field
-from typing import List, Set, Dict, Optional, Union
+from typing import Iterator, List, Set, Dict, Optional, Tuple, Union
 import time
 import logging
+from collections import defaultdict
 
+from core._greedy_kernel import NUMBA_AVAILABLE, greedy_rounds
 from core.models import Fact, Rule, KnowledgeBase
+from core.rete import PremiseNetwork
 from core.strategies import ConflictResolutionStrategy, RecencyStrategy
 
 
 default_logger = logging.getLogger(__name__)
 
 
-@dataclass
+NUMBA_MIN_RULES = 2_000
+
+
+@dataclass(slots=True)
 class InferenceResult:
 
 
@@ -49,6 +55,7 @@ class InferenceResult:
     rules_activated: int
     facts_count: int
     trace: List[str] = field(default_factory=list)
+    execution_time_ns: int = 0
 
 
 class ForwardChaining:
@@ -102,10 +109,10 @@ class ForwardChaining:
 
 
 
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
 
 
-        facts = kb.facts.copy()
+        facts = set(kb.facts)
         new_facts = []
         rules_fired = []
         iterations = 0
@@ -124,8 +131,15 @@ class ForwardChaining:
 
 
 
-        facts_with_recency: Dict[Fact, int] = {fact: 0 for fact in facts}
         is_recency_strategy = isinstance(self.strategy, RecencyStrategy)
+        facts_with_recency: Dict[Fact, int] = dict.fromkeys(facts, 0) if is_recency_strategy else {}
+
+
+
+
+        self._network = PremiseNetwork(kb.rules, facts)
+        candidates: Set[int] = set()
+        indexed_facts = 0
 
 
         def _goal_achieved(current_facts: Set[Fact], goal_target) -> bool:
@@ -138,6 +152,9 @@ class ForwardChaining:
 
                 return goal_target in current_facts
 
+        goal_reached = _goal_achieved(facts, goal)
+        checked_facts = 0
+
         mode_info = "[GREEDY MODE]" if greedy else f"[Strategy: {self.strategy.__class__.__name__}]"
         self.logger.info(f"=== Starting Forward Chaining Inference {mode_info} {f'(Run ID: {self.run_id})' if self.run_id else ''} ===")
 
@@ -155,13 +172,20 @@ class ForwardChaining:
 
 
 
+            self._network.assert_facts(new_facts[indexed_facts:])
+            indexed_facts = len(new_facts)
+            candidates |= self._network.take_activated()
+
             conflict_set = []
-            for rule in kb.rules:
-                rules_evaluated += 1
+            conflict_positions = set()
+            for position in sorted(candidates):
+                rule = kb.rules[position]
                 if (rule.id not in fired_rules_ids
-                    and rule.is_satisfied_by(facts)
                     and rule.conclusion not in facts):
                     conflict_set.append(rule)
+                    conflict_positions.add(position)
+            candidates = conflict_positions
+            rules_evaluated += len(kb.rules)
 
 
             rules_activated += len(conflict_set)
@@ -320,9 +344,11 @@ class ForwardChaining:
 
 
 
-                if _goal_achieved(facts, goal):
-                    end_time = time.perf_counter()
-                    execution_time_ms = (end_time - start_time) * 1000
+                goal_reached = goal_reached or _goal_achieved(new_facts[checked_facts:], goal)
+                checked_facts = len(new_facts)
+                if goal_reached:
+                    end_time = time.perf_counter_ns()
+                    execution_time_ms = (end_time - start_time) / 1_000_000
 
                     self.logger.info(f"=== Goal {goal} ACHIEVED in iteration {iterations} ===")
                     self.logger.info(f"Execution time: {execution_time_ms:.3f} ms")
@@ -340,6 +366,7 @@ class ForwardChaining:
                         rules_fired=rules_fired,
                         iterations=iterations,
                         execution_time_ms=execution_time_ms,
+                        execution_time_ns=end_time - start_time,
                         rules_evaluated=rules_evaluated,
                         rules_activated=rules_activated,
                         facts_count=len(facts),
@@ -347,13 +374,13 @@ class ForwardChaining:
                     )
 
 
-        end_time = time.perf_counter()
-        execution_time_ms = (end_time - start_time) * 1000
+        end_time = time.perf_counter_ns()
+        execution_time_ms = (end_time - start_time) / 1_000_000
 
 
 
         if goal is not None:
-            if _goal_achieved(facts, goal):
+            if goal_reached or _goal_achieved(new_facts[checked_facts:], goal):
                 success = True
                 self.logger.info(f"=== Goal {goal} ACHIEVED (found in final facts) ===")
             else:
@@ -383,6 +410,7 @@ class ForwardChaining:
             rules_fired=rules_fired,
             iterations=iterations,
             execution_time_ms=execution_time_ms,
+            execution_time_ns=end_time - start_time,
             rules_evaluated=rules_evaluated,
             rules_activated=rules_activated,
             facts_count=len(facts),
@@ -419,10 +447,10 @@ class GreedyForwardChaining:
 
 
 
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
 
 
-        facts = kb.facts.copy()
+        facts = set(kb.facts)
         new_facts = []
         rules_fired = []
         iterations = 0
@@ -440,65 +468,71 @@ class GreedyForwardChaining:
             else:
                 return goal_target in current_facts
 
+        goal_reached = _goal_achieved(facts, goal)
+        checked_facts = 0
+
+        if NUMBA_AVAILABLE and len(kb.rules) > NUMBA_MIN_RULES:
+            rounds = greedy_rounds(kb.rules, facts)
+        else:
+            rounds = self._mask_rounds(kb.rules, facts)
+
         default_logger.info(f"=== Starting Greedy Forward Chaining Inference ===")
         default_logger.info(f"Initial facts: {len(facts)}, Rules: {len(kb.rules)}, Goal: {goal}")
 
-        inferred = True
-        while inferred:
+        for positions in rounds:
             iterations += 1
-            inferred = False
 
             default_logger.debug(f"--- Iteration {iterations} ---")
 
 
-            conflict_set = []
-            for rule in kb.rules:
-                rules_evaluated += 1
-                if rule.is_satisfied_by(facts) and rule.conclusion not in facts:
-                    conflict_set.append(rule)
+            conflict_set = [kb.rules[position] for position in positions]
+            rules_evaluated += len(kb.rules)
 
             rules_activated += len(conflict_set)
 
             default_logger.debug(f"Conflict Set size: {len(conflict_set)}, Rule IDs: {[r.id for r in conflict_set]}")
 
 
-            if conflict_set:
-                for rule in conflict_set:
-                    facts.add(rule.conclusion)
-                    new_facts.append(rule.conclusion)
-                    rules_fired.append(rule)
-                    default_logger.info(f"Fired Rule {rule.id}, New Fact: {rule.conclusion}")
+            if not conflict_set:
+                break
 
-                inferred = True
+            for rule in conflict_set:
+                facts.add(rule.conclusion)
+                new_facts.append(rule.conclusion)
+                rules_fired.append(rule)
+                default_logger.info(f"Fired Rule {rule.id}, New Fact: {rule.conclusion}")
 
 
 
-                if _goal_achieved(facts, goal):
-                    end_time = time.perf_counter()
-                    execution_time_ms = (end_time - start_time) * 1000
+            goal_reached = goal_reached or _goal_achieved(new_facts[checked_facts:], goal)
+            checked_facts = len(new_facts)
+            if goal_reached:
+                end_time = time.perf_counter_ns()
+                execution_time_ms = (end_time - start_time) / 1_000_000
 
-                    default_logger.info(f"=== Goal {goal} ACHIEVED in iteration {iterations} ===")
+                default_logger.info(f"=== Goal {goal} ACHIEVED in iteration {iterations} ===")
 
-                    return InferenceResult(
-                        success=True,
-                        facts=facts,
-                        new_facts=new_facts,
-                        rules_fired=rules_fired,
-                        iterations=iterations,
-                        execution_time_ms=execution_time_ms,
-                        rules_evaluated=rules_evaluated,
-                        rules_activated=rules_activated,
-                        facts_count=len(facts)
-                    )
+                return InferenceResult(
+                    success=True,
+                    facts=facts,
+                    new_facts=new_facts,
+                    rules_fired=rules_fired,
+                    iterations=iterations,
+                    execution_time_ms=execution_time_ms,
+                    execution_time_ns=end_time - start_time,
+                    rules_evaluated=rules_evaluated,
+                    rules_activated=rules_activated,
+                    facts_count=len(facts)
+                )
 
 
-        end_time = time.perf_counter()
-        execution_time_ms = (end_time - start_time) * 1000
+        end_time = time.perf_counter_ns()
+        execution_time_ms = (end_time - start_time) / 1_000_000
 
 
 
         if goal is not None:
-            if _goal_achieved(facts, goal):
+            if goal_reached or _goal_achieved(new_facts[checked_facts:], goal):
                 success = True
                 default_logger.info(f"=== Goal {goal} ACHIEVED (found in final facts) ===")
             else:
@@ -518,11 +552,42 @@ class GreedyForwardChaining:
             rules_fired=rules_fired,
             iterations=iterations,
             execution_time_ms=execution_time_ms,
+            execution_time_ns=end_time - start_time,
             rules_evaluated=rules_evaluated,
             rules_activated=rules_activated,
             facts_count=len(facts)
         )
 
+    @staticmethod
+    def _mask_rounds(rules: List[Rule], facts: Set[Fact]) -> Iterator[List[int]]:
+
+
+
+
+        fact_bits: Dict[Fact, int] = {}
+        rule_masks: List[Tuple[int, int]] = []
+        for rule in rules:
+            mask = 0
+            for premise in rule.premises:
+                mask |= fact_bits.setdefault(premise, 1 << len(fact_bits))
+            conclusion_bit = fact_bits.setdefault(rule.conclusion, 1 << len(fact_bits))
+            rule_masks.append((mask, conclusion_bit))
+        facts_mask = 0
+        for fact in facts:
+            facts_mask |= fact_bits.get(fact, 0)
+
+        while True:
+            positions = []
+            conclusions_mask = 0
+            for position, (mask, conclusion_bit) in enumerate(rule_masks):
+                if facts_mask & mask == mask and not facts_mask & conclusion_bit:
+                    positions.append(position)
+                    conclusions_mask |= conclusion_bit
+            facts_mask |= conclusions_mask
+            yield positions
+            if not positions:
+                return
+
 
 class BackwardChaining:
 
@@ -576,22 +641,24 @@ class BackwardChaining:
 
 
 
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
 
 
-        facts = kb.facts.copy()
+        facts = set(kb.facts)
         new_facts = []
         rules_fired = []
 
 
         proof_path = set()
+        failed_goals = set()
 
 
         metrics = {
             'rules_evaluated': 0,
             'rules_activated': 0,
             'recursion_depth': 0,
-            'max_depth': 0
+            'max_depth': 0,
+            'cycles_cut': 0
         }
 
         self.logger.info(f"=== Starting Backward Chaining Inference {f'(Run ID: {self.run_id})' if self.run_id else ''} ===")
@@ -602,6 +669,10 @@ class BackwardChaining:
         self.logger.info(f"Initial facts: {len(facts)}, Rules: {len(kb.rules)}, Goal: {goal}")
 
 
+        self._conclusion_index: Dict[Fact, List[Rule]] = defaultdict(list)
+        for rule in kb.rules:
+            self._conclusion_index[rule.conclusion].append(rule)
+
         success = self._prove(
             goal=goal,
             rules=kb.rules,
@@ -609,12 +680,13 @@ class BackwardChaining:
             new_facts=new_facts,
             rules_fired=rules_fired,
             proof_path=proof_path,
+            failed_goals=failed_goals,
             metrics=metrics,
             depth=0
         )
 
-        end_time = time.perf_counter()
-        execution_time_ms = (end_time - start_time) * 1000
+        end_time = time.perf_counter_ns()
+        execution_time_ms = (end_time - start_time) / 1_000_000
 
         if success:
             self.logger.info(f"=== Goal {goal} PROVED ===")
@@ -633,6 +705,7 @@ class BackwardChaining:
             rules_fired=rules_fired,
             iterations=len(rules_fired),
             execution_time_ms=execution_time_ms,
+            execution_time_ns=end_time - start_time,
             rules_evaluated=metrics['rules_evaluated'],
             rules_activated=metrics['rules_activated'],
             facts_count=len(facts)
@@ -646,6 +719,7 @@ class BackwardChaining:
         new_facts: List[Fact],
         rules_fired: List[Rule],
         proof_path: Set[Fact],
+        failed_goals: Set[Fact],
         metrics: Dict[str, int],
         depth: int
     ) -> bool:
@@ -675,9 +749,15 @@ class BackwardChaining:
             return True
 
 
+        if goal in failed_goals:
+            self.logger.debug(f"{indent}[DEPTH {depth}] Goal {goal} already failed - skipping")
+            return False
+
+
         if goal in proof_path:
             self.logger.debug(f"{indent}[DEPTH {depth}] CYCLE DETECTED for goal {goal} - stopping recursion")
             self.logger.info(f"[BACKWARD] Cycle detected for {goal}, backtracking...")
+            metrics['cycles_cut'] += 1
             return False
 
 
@@ -687,17 +767,15 @@ class BackwardChaining:
         self.logger.debug(f"{indent}[DEPTH {depth}] Attempting to prove: {goal}")
 
 
-        competitive_rules = []
-        for rule in rules:
-            metrics['rules_evaluated'] += 1
-            if rule.conclusion == goal:
-                competitive_rules.append(rule)
+        metrics['rules_evaluated'] += len(rules)
+        competitive_rules = list(self._conclusion_index.get(goal, ()))
 
         if not competitive_rules:
 
             self.logger.debug(f"{indent}[DEPTH {depth}] No competitive rules for goal {goal} - FAIL")
             self.logger.info(f"[BACKWARD] No rules can prove {goal}")
             proof_path.remove(goal)
+            failed_goals.add(goal)
             return False
 
         metrics['rules_activated'] += len(competitive_rules)
@@ -715,6 +793,7 @@ class BackwardChaining:
             self.logger.debug(f"{indent}  [CANDIDATE] Rule {rule.id}: IF {premises_text} THEN {conclusion_text} | Complexity: {complexity}")
 
 
+        cycles_cut = metrics['cycles_cut']
         ordered_rules = self._order_rules_by_strategy(competitive_rules, facts)
         self.logger.debug(f"{indent}[DEPTH {depth}] Strategy ordered rules: {[r.id for r in ordered_rules]}")
 
@@ -736,6 +815,7 @@ class BackwardChaining:
                     new_facts=new_facts,
                     rules_fired=rules_fired,
                     proof_path=proof_path,
+                    failed_goals=failed_goals,
                     metrics=metrics,
                     depth=depth + 1
                 ):
@@ -765,6 +845,10 @@ class BackwardChaining:
         self.logger.debug(f"{indent}[DEPTH {depth}] All {len(competitive_rules)} rules exhausted for {goal} - FAIL")
         self.logger.info(f"[BACKWARD] All rules failed for {goal}, cannot prove")
         proof_path.remove(goal)
+
+
+        if metrics['cycles_cut'] == cycles_cut:
+            failed_goals.add(goal)
         return False
 
     def _order_rules_by_strategy(
@@ -92,9 +92,9 @@ class ClusteredForwardChaining(ForwardChaining):
         logger.info("=== Starting CLUSTERED Forward Chaining Inference (Algorithm 2 - argmax) ===")
         logger.info(f"Initial facts: {len(kb.facts)}, Clusters: {len(self.clusters)}, Goal: {goal}")
 
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
 
-        facts = kb.facts.copy()
+        facts = set(kb.facts)
         new_facts: List[Fact] = []
         rules_fired: List[Rule] = []
         fired_rules_ids: Set[int] = set()
@@ -177,8 +177,8 @@ class ClusteredForwardChaining(ForwardChaining):
             logger.info(f"New Fact inferred: {new_fact}")
 
 
-        end_time = time.perf_counter()
-        execution_time_ms = (end_time - start_time) * 1000
+        end_time = time.perf_counter_ns()
+        execution_time_ms = (end_time - start_time) / 1_000_000
 
         logger.info("=== Inference COMPLETED ===")
         logger.info(f"Total iterations: {iterations}, Facts: {len(facts)}, Rules fired: {len(rules_fired)}")
@@ -204,6 +204,7 @@ class ClusteredForwardChaining(ForwardChaining):
             rules_fired=rules_fired,
             iterations=iterations,
             execution_time_ms=execution_time_ms,
+            execution_time_ns=end_time - start_time,
             rules_evaluated=rules_evaluated,
             rules_activated=rules_activated,
             facts_count=len(facts)
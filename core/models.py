@@ -7,12 +7,16 @@
 
 
 
-from typing import List, Set, Iterable
+import sys
+import weakref
+from typing import List, Set, Iterable, Tuple
 
 
 class Fact:
 
+    __slots__ = ("attribute", "value", "_hash", "__weakref__")
 
+    _interned: "weakref.WeakValueDictionary[Tuple[str, str], Fact]" = weakref.WeakValueDictionary()
 
 
 
@@ -29,9 +33,9 @@ class Fact:
 
 
 
-    def __init__(self, attribute: str, value: str):
 
 
+    def __new__(cls, attribute: str, value: str):
 
 
 
@@ -40,13 +44,38 @@ class Fact:
 
 
 
+
+
+        key = (attribute, value)
+        fact = cls._interned.get(key)
+        if fact is not None:
+            return fact
+
         if not attribute:
             raise ValueError("Attribute cannot be empty")
         if not value:
             raise ValueError("Value cannot be empty")
 
-        self.attribute = attribute
-        self.value = value
+        fact = super().__new__(cls)
+        fact.attribute = sys.intern(attribute) if type(attribute) is str else attribute
+        fact.value = sys.intern(value) if type(value) is str else value
+        fact._hash = hash(key)
+        cls._interned[key] = fact
+        return fact
+
+    @classmethod
+    def intern(cls, attribute: str, value: str) -> "Fact":
+
+
+
+
+
+
+
+
+
+
+        return cls(attribute, value)
 
     def __eq__(self, other):
 
@@ -54,15 +83,24 @@ class Fact:
 
 
 
+        if self is other:
+            return True
         if not isinstance(other, Fact):
             return False
-        return self.attribute == other.attribute and self.value == other.value
+        return (self._hash == other._hash
+                and self.attribute == other.attribute and self.value == other.value)
 
     def __hash__(self):
 
 
 
-        return hash((self.attribute, self.value))
+        return self._hash
+
+    def __reduce__(self):
+
+
+
+        return (self.__class__, (self.attribute, self.value))
 
     def __repr__(self):
 
@@ -107,8 +145,10 @@ class Rule:
             raise ValueError("Conclusion cannot be None")
 
         self.id = id
-        self.premises = premises
+        self.premises: Tuple[Fact, ...] = tuple(premises)
         self.conclusion = conclusion
+        self._premises_len = len(self.premises)
+        self._premise_set = frozenset(self.premises)
 
     def is_satisfied_by(self, facts: Set[Fact]) -> bool:
 
@@ -120,13 +160,13 @@ class Rule:
 
 
 
-        return all(premise in facts for premise in self.premises)
+        return self._premise_set.issubset(facts)
 
     def __len__(self):
 
 
 
-        return len(self.premises)
+        return self._premises_len
 
     def __repr__(self):
 
@@ -160,9 +200,31 @@ class KnowledgeBase:
 
 
 
+        self._network = None
+        self._network_rules: List[Rule] = []
+        self._network_facts: Set[Fact] = set()
+        self._satisfied: Set[int] = set()
         self.rules = rules if rules is not None else []
         self.facts = facts if facts is not None else set()
 
+    @property
+    def rules(self) -> List[Rule]:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: List[Rule]) -> None:
+        self._rules = rules
+        self._network = None
+
+    @property
+    def facts(self) -> Set[Fact]:
+        return self._facts
+
+    @facts.setter
+    def facts(self, facts: Set[Fact]) -> None:
+        self._facts = facts
+        self._network = None
+
     def add_fact(self, fact: Fact) -> None:
 
 
@@ -170,7 +232,14 @@ class KnowledgeBase:
 
 
 
-        self.facts.add(fact)
+        if fact in self._facts:
+            return
+        if isinstance(self._facts, frozenset):
+            self._facts = set(self._facts)
+        self._facts.add(fact)
+        if self._network is not None and fact not in self._network_facts:
+            self._network_facts.add(fact)
+            self._network.assert_fact(fact)
 
     def add_facts(self, facts: Iterable[Fact]) -> None:
 
@@ -179,7 +248,20 @@ class KnowledgeBase:
 
 
 
-        self.facts.update(facts)
+        for fact in facts:
+            self.add_fact(fact)
+
+    def clone_facts_only(self) -> "KnowledgeBase":
+
+
+
+
+
+
+
+
+
+        return KnowledgeBase(rules=self.rules, facts=set(self.facts))
 
     def has_fact(self, fact: Fact) -> bool:
 
@@ -204,7 +286,19 @@ class KnowledgeBase:
 
 
 
+        facts = self._facts
+        if (self._network is None or facts != self._network_facts
+                or self._rules != self._network_rules):
+            from core.rete import PremiseNetwork
+
+            self._network_rules = list(self._rules)
+            self._network_facts = set(facts)
+            self._network = PremiseNetwork(self._network_rules, facts)
+            self._satisfied = set()
+        self._satisfied |= self._network.take_activated()
+
+        rules = self._network_rules
         return [
-            rule for rule in self.rules
-            if rule.is_satisfied_by(self.facts) and rule.conclusion not in self.facts
+            rules[position] for position in sorted(self._satisfied)
+            if rules[position].conclusion not in facts
         ]
@@ -0,0 +1,79 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set
+
+from core.models import Fact, Rule
+
+
+class PremiseNetwork:
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+    def __init__(self, rules: List[Rule], facts: Iterable[Fact]):
+
+
+
+
+
+
+        known = facts if isinstance(facts, (set, frozenset)) else set(facts)
+
+        self.rules = rules
+        self.alpha: Dict[Fact, List[int]] = defaultdict(list)
+        self.unmet: List[int] = []
+        self.activated: Set[int] = set()
+
+        for position, rule in enumerate(rules):
+            missing = 0
+            for premise in rule._premise_set:
+                self.alpha[premise].append(position)
+                if premise not in known:
+                    missing += 1
+            self.unmet.append(missing)
+            if not missing:
+                self.activated.add(position)
+
+    def assert_fact(self, fact: Fact) -> None:
+
+
+
+
+
+
+        unmet = self.unmet
+        for position in self.alpha.get(fact, ()):
+            unmet[position] -= 1
+            if not unmet[position]:
+                self.activated.add(position)
+
+    def assert_facts(self, facts: Iterable[Fact]) -> None:
+
+
+
+        for fact in facts:
+            self.assert_fact(fact)
+
+    def take_activated(self) -> Set[int]:
+
+
+
+
+
+
+        activated = self.activated
+        self.activated = set()
+        return activated
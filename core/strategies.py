@@ -12,12 +12,16 @@
 
 
 from abc import ABC, abstractmethod
-from typing import List, Set, Dict, Optional
+from operator import attrgetter
+from typing import List, Set, Dict, Optional, Tuple
 import random
 
 from core.models import Fact, Rule
 
 
+_premises_len = attrgetter("_premises_len")
+
+
 class ConflictResolutionStrategy(ABC):
 
 
@@ -131,7 +135,7 @@ class SpecificityStrategy(ConflictResolutionStrategy):
 
 
 
-        return max(conflict_set, key=len)
+        return max(conflict_set, key=_premises_len)
 
 
 class RecencyStrategy(ConflictResolutionStrategy):
@@ -154,6 +158,13 @@ class RecencyStrategy(ConflictResolutionStrategy):
 
 
 
+    def __init__(self):
+
+
+
+        self._clock_source: Optional[Dict[Fact, int]] = None
+        self._rule_max_clock: Dict[int, Tuple[Rule, int]] = {}
+
     def select(self, conflict_set: List[Rule], facts: Dict[Fact, int]) -> Rule:
 
 
@@ -165,8 +176,25 @@ class RecencyStrategy(ConflictResolutionStrategy):
 
 
 
-        def get_max_recency(rule: Rule) -> int:
 
-            return max(facts[premise] for premise in rule.premises)
+        if facts is not self._clock_source:
+            self._clock_source = facts
+            self._rule_max_clock = {}
+        cache = self._rule_max_clock
+
+        best_rule = None
+        best_clock = 0
+        for rule in conflict_set:
+            cached = cache.get(id(rule))
+            if cached is not None and cached[0] is rule:
+                clock = cached[1]
+            else:
+                clock = max(map(facts.__getitem__, rule.premises))
+                cache[id(rule)] = (rule, clock)
+
+            if best_rule is None or clock > best_clock:
+                best_rule, best_clock = rule, clock
 
-        return max(conflict_set, key=get_max_recency)
+        if best_rule is None:
+            raise ValueError("Zbiór konfliktowy jest pusty")
+        return best_rule
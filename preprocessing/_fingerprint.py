@@ -0,0 +1,13 @@
+import hashlib
+
+import pandas as pd
+
+
+def frame_fingerprint(frame: pd.DataFrame) -> str:
+
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(c), str(t)) for c, t in frame.dtypes.items()]).encode())
+    if frame.shape[1] > 0:
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
@@ -0,0 +1,100 @@
+import functools
+import importlib.util
+
+import numpy as np
+from typing import Tuple
+
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def _lloyd(sorted_values: np.ndarray, prefix: np.ndarray, centers: np.ndarray, max_iter: int) -> np.ndarray:
+
+
+
+
+    n = sorted_values.shape[0]
+    k = centers.shape[0]
+    ends = np.full(k, -1, dtype=np.int64)
+
+    for _ in range(max_iter):
+        thresholds = (centers[:-1] + centers[1:]) / 2.0
+        new_ends = np.empty(k, dtype=np.int64)
+        new_ends[:k - 1] = np.searchsorted(sorted_values, thresholds, side="right")
+        new_ends[k - 1] = n
+        if np.array_equal(new_ends, ends):
+            break
+        ends = new_ends
+
+        start = 0
+        for j in range(k):
+            end = ends[j]
+            if end > start:
+                centers[j] = (prefix[end] - prefix[start]) / (end - start)
+            start = end
+        centers.sort()
+
+    return centers
+
+
+@functools.lru_cache(maxsize=None)
+def _lloyd_kernel():
+
+    if not NUMBA_AVAILABLE:
+        return _lloyd
+
+    from numba import njit
+    return njit(cache=True)(_lloyd)
+
+
+def _kmeans_plus_plus(values: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+
+    centers = np.empty(k, dtype=np.float64)
+    centers[0] = values[rng.integers(values.size)]
+    closest = np.square(values - centers[0])
+    for j in range(1, k):
+        cumulative = np.cumsum(closest)
+        if cumulative[-1] == 0:
+            centers[j:] = centers[0]
+            break
+        pick = np.searchsorted(cumulative, rng.random() * cumulative[-1], side="right")
+        centers[j] = values[min(pick, values.size - 1)]
+        closest = np.minimum(closest, np.square(values - centers[j]))
+    return np.sort(centers)
+
+
+def kmeans1d(values: np.ndarray, k: int, max_iter: int = 50, n_init: int = 10,
+             random_state: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+
+
+
+
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        raise ValueError("Brak wartości do klasteryzacji")
+    if np.isnan(values).any():
+        raise ValueError("Wartości do klasteryzacji nie mogą zawierać NaN")
+
+    sorted_values = np.sort(values)
+    prefix = np.concatenate(([0.0], np.cumsum(sorted_values)))
+    rng = np.random.default_rng(random_state)
+
+    best_centers, best_inertia = None, np.inf
+    for attempt in range(n_init):
+        if attempt == 0:
+            init = np.quantile(sorted_values, (np.arange(k) + 0.5) / k)
+        else:
+            init = _kmeans_plus_plus(sorted_values, k, rng)
+        centers = _lloyd_kernel()(sorted_values, prefix, init, max_iter)
+        inertia = float(np.square(sorted_values - centers[assign_clusters(sorted_values, centers)]).sum())
+        if inertia < best_inertia:
+            best_centers, best_inertia = centers, inertia
+
+    return best_centers, assign_clusters(values, best_centers)
+
+
+def assign_clusters(values: np.ndarray, centers: np.ndarray) -> np.ndarray:
+
+
+
+    return np.searchsorted((centers[:-1] + centers[1:]) / 2.0, values, side="left")
@@ -19,7 +19,7 @@ import logging
 default_logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnStats:
 
     n: int
@@ -32,7 +32,7 @@ class ColumnStats:
     unique_ratio: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BinSuggestion:
 
     sturges: int
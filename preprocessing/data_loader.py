@@ -1,14 +1,15 @@
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Optional
+from typing import IO, List, Optional, Union
 import pandas as pd
 
 from preprocessing.validators import (
     ValidationResult, 
     validate_file_path, 
     validate_file_content,
+    validate_buffer_content,
     detect_csv_config
 )
 
@@ -20,6 +21,7 @@ class CSVConfig:
     decimal: str = "."
     has_header: bool = True
     encoding: str = "utf-8"
+    exclude_columns: List[str] = field(default_factory=list)
 
 
 class DataLoader:
@@ -37,7 +39,8 @@ class DataLoader:
 
 
     
-    def validate(self, path: Path, config: Optional[CSVConfig] = None) -> ValidationResult:
+    def validate(self, path: Union[Path, str, IO[str]],
+                 config: Optional[CSVConfig] = None) -> ValidationResult:
 
 
 
@@ -47,6 +50,16 @@ class DataLoader:
 
 
 
+        if config is None:
+            config = CSVConfig()
+
+        if hasattr(path, "read"):
+            return validate_buffer_content(
+                path,
+                separator=config.separator,
+                has_header=config.has_header
+            )
+
         if isinstance(path, str):
             path = Path(path)
         
@@ -55,10 +68,6 @@ class DataLoader:
         if not path_result.is_valid:
             return path_result
         
-
-        if config is None:
-            config = CSVConfig()
-        
         content_result = validate_file_content(
             path, 
             separator=config.separator,
@@ -68,7 +77,7 @@ class DataLoader:
         
         return content_result
     
-    def load(self, path: Path, config: Optional[CSVConfig] = None, 
+    def load(self, path: Union[Path, str, IO[str]], config: Optional[CSVConfig] = None, 
              autodetect: bool = False) -> pd.DataFrame:
 
 
@@ -89,7 +98,10 @@ class DataLoader:
         
 
         if autodetect:
-            config = detect_csv_config(path)
+            detected = detect_csv_config(path)
+            if config is not None:
+                detected = replace(detected, exclude_columns=config.exclude_columns)
+            config = detected
         elif config is None:
             config = CSVConfig()
         
@@ -111,8 +123,17 @@ class DataLoader:
                 sep=config.separator,
                 decimal=config.decimal,
                 header=0 if config.has_header else None,
-                encoding=config.encoding
+                encoding=config.encoding,
+                usecols=self._usecols(config)
             )
             return df
         except Exception as e:
             raise ValueError(f"Błąd podczas wczytywania pliku: {e}")
+
+    @staticmethod
+    def _usecols(config: CSVConfig):
+
+        if not config.exclude_columns:
+            return None
+        excluded = frozenset(config.exclude_columns)
+        return lambda column: column not in excluded
@@ -1,9 +1,59 @@
 
 
+import functools
+import importlib.util
+import threading
+from collections import OrderedDict
+
 import pandas as pd
 import numpy as np
-from typing import List, Optional
-from sklearn.cluster import KMeans
+from typing import Any, List, Optional
+
+from preprocessing._fingerprint import frame_fingerprint
+from preprocessing._kmeans1d import kmeans1d, assign_clusters
+
+JOBLIB_AVAILABLE = importlib.util.find_spec("joblib") is not None
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+FIT_CACHE_SIZE = 32
+
+
+MEMOIZED_METHODS = ("equal_frequency", "kmeans")
+
+_fit_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_fit_cache_lock = threading.Lock()
+
+
+NUMBA_MIN_CELLS = 10_000
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_equal_width_kernel():
+
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _numba_equal_width_codes(X, edges, bins_count):
+        out = np.empty(X.shape, dtype=np.int64)
+        for j in prange(X.shape[1]):
+            lo = edges[j, 0]
+            hi = edges[j, bins_count]
+            scale = bins_count / (hi - lo)
+            for i in range(X.shape[0]):
+                x = X[i, j]
+                if not (x >= lo and x <= hi):
+                    out[i, j] = bins_count
+                    continue
+                k = min(max(int((x - lo) * scale), 0), bins_count - 1)
+                while k > 0 and x <= edges[j, k]:
+                    k -= 1
+                while k < bins_count - 1 and x > edges[j, k + 1]:
+                    k += 1
+                out[i, j] = k
+        return out
+
+    return _numba_equal_width_codes
 
 
 class Discretizer:
@@ -26,9 +76,17 @@ class Discretizer:
 
 
 
-    def __init__(self):
+    def __init__(self, memory: Optional[Any] = None, categorical: bool = False):
 
+        if isinstance(memory, str):
+            if not JOBLIB_AVAILABLE:
+                raise ImportError("joblib jest wymagany do cache'owania dopasowania na dysku")
+            from joblib import Memory
+            memory = Memory(memory, verbose=0)
+        self._memory = memory
+        self._categorical = categorical
         self._bin_edges = {}
+        self._labels = {}
         self._method = None
         self._bins = None
         self._columns = None
@@ -83,20 +141,16 @@ class Discretizer:
             self._columns = columns
 
 
-        self._bin_edges = {}
-        for column in self._columns:
-
-            if skip_binary and df[column].nunique() <= 2:
-                continue
-
-
-            if method == "equal_width":
-                self._bin_edges[column] = self._fit_equal_width(df[column], bins)
-            elif method == "equal_frequency":
-                self._bin_edges[column] = self._fit_equal_frequency(df[column], bins)
-            elif method == "kmeans":
-                self._bin_edges[column] = self._fit_kmeans(df[column], bins)
+        frame = df[self._columns]
+        if self._memory is not None:
+            bin_edges = self._memory.cache(_fit_bin_edges)(frame, method, bins, skip_binary)
+        elif method in MEMOIZED_METHODS:
+            bin_edges = _fit_bin_edges_memoized(frame, method, bins, skip_binary)
+        else:
+            bin_edges = _fit_bin_edges(frame, method, bins, skip_binary)
 
+        self._bin_edges = {column: dict(info) for column, info in bin_edges.items()}
+        self._labels = {column: self._labels_for(method, info) for column, info in self._bin_edges.items()}
         self._fitted = True
         return self
 
@@ -117,22 +171,59 @@ class Discretizer:
             raise ValueError("Discretizer nie został dopasowany. Użyj fit() przed transform().")
 
         result = df.copy()
+        for column, codes in self._codes(df).items():
+            if self._categorical:
+                result[column] = pd.Categorical.from_codes(codes, categories=self._labels[column])
+            else:
+                result[column] = self._labels[column][codes]
+        return result
 
-        for column in self._bin_edges.keys():
-            if column not in df.columns:
-                continue
+    def bin_counts(self, df: pd.DataFrame) -> dict:
 
+
+
+
+
+
+
+
+        if not self._fitted:
+            raise ValueError("Discretizer nie został dopasowany. Użyj fit() przed transform().")
+
+        return {
+            column: self._bin_counts(codes, len(self._labels[column]))
+            for column, codes in self._codes(df).items()
+        }
+
+    def _codes(self, df: pd.DataFrame) -> dict:
+
+        columns = [column for column in self._bin_edges if column in df.columns]
+        if self._method == "equal_width":
+            if not columns:
+                return {}
+            codes = self._equal_width_codes(
+                df[columns].to_numpy(dtype=np.float64, na_value=np.nan),
+                np.vstack([self._bin_edges[column]["edges"] for column in columns]),
+                self._bins
+            )
+            return {column: codes[:, j] for j, column in enumerate(columns)}
+
+        result = {}
+        for column in columns:
             edge_info = self._bin_edges[column]
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
 
-            if self._method == "equal_width":
-                result[column] = self._transform_equal_width(df[column], edge_info)
-            elif self._method == "equal_frequency":
-                result[column] = self._transform_equal_frequency(df[column], edge_info)
+            if self._method == "equal_frequency":
+                result[column] = self._equal_frequency_codes(values, edge_info["edges"])
             elif self._method == "kmeans":
-                result[column] = self._transform_kmeans(df[column], edge_info)
-
+                result[column] = self._kmeans_codes(values, edge_info["centers"])
         return result
 
+    @staticmethod
+    def _bin_counts(codes: np.ndarray, labels_count: int) -> np.ndarray:
+
+        return np.bincount(codes, minlength=labels_count)[:labels_count - 1]
+
     def fit_transform(
         self,
         df: pd.DataFrame,
@@ -187,95 +278,228 @@ class Discretizer:
 
 
 
-        discretizer = Discretizer()
+        discretizer = Discretizer(memory=self._memory, categorical=self._categorical)
         return discretizer.fit_transform(
             df, method=method, bins=bins, columns=columns, skip_binary=skip_binary
         )
     
 
 
-    def _fit_equal_width(self, series: pd.Series, bins: int) -> dict:
+    @staticmethod
+    def _fit_equal_width(series: pd.Series, bins: int) -> dict:
+
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(values).all():
+            raise ValueError(f"Kolumna '{series.name}' nie zawiera wartości liczbowych")
+        mn, mx = np.nanmin(values), np.nanmax(values)
+        if np.isinf(mn) or np.isinf(mx):
+            raise ValueError("Nie można wyznaczyć przedziałów dla danych zawierających nieskończoność")
 
-        _, bin_edges = pd.cut(series, bins=bins, retbins=True)
+
+        if mn == mx:
+            mn -= 0.001 * abs(mn) if mn != 0 else 0.001
+            mx += 0.001 * abs(mx) if mx != 0 else 0.001
+            bin_edges = np.linspace(mn, mx, bins + 1)
+        else:
+            bin_edges = np.linspace(mn, mx, bins + 1)
+            bin_edges[0] -= (mx - mn) * 0.001
         return {"bins": bins, "edges": bin_edges}
 
-    def _fit_equal_frequency(self, series: pd.Series, bins: int) -> dict:
+    @staticmethod
+    def _fit_equal_frequency(series: pd.Series, bins: int) -> dict:
 
-        try:
-            _, bin_edges = pd.qcut(series, q=bins, retbins=True, duplicates="drop")
-        except ValueError:
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            raise ValueError(f"Kolumna '{series.name}' nie zawiera wartości liczbowych")
 
-            result = pd.qcut(series, q=bins, duplicates="drop", retbins=False)
-            bin_edges = [result.min().left] + [cat.right for cat in result.cat.categories]
-            bin_edges = np.array(bin_edges)
+        bin_edges = np.quantile(values, np.linspace(0, 1, bins + 1))
+
+
+        if len(bin_edges) != 2:
+            bin_edges = np.unique(bin_edges)
         return {"bins": bins, "edges": bin_edges}
 
-    def _fit_kmeans(self, series: pd.Series, bins: int) -> dict:
+    @staticmethod
+    def _fit_kmeans(series: pd.Series, bins: int) -> dict:
+
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            raise ValueError(f"Kolumna '{series.name}' nie zawiera wartości liczbowych")
 
-        values = series.values.reshape(-1, 1)
-        kmeans = KMeans(n_clusters=bins, random_state=42, n_init=10)
-        kmeans.fit(values)
-        return {"bins": bins, "centers": kmeans.cluster_centers_.flatten()}
+        centers, _ = kmeans1d(values, bins)
+        return {"bins": bins, "centers": centers}
 
 
 
     def _transform_equal_width(self, series: pd.Series, edge_info: dict) -> pd.Series:
 
         bins_count = edge_info["bins"]
-        edges = edge_info["edges"]
-        labels = [f"bin_{i+1}" for i in range(bins_count)]
+        codes = self._equal_width_codes(
+            series.to_numpy(dtype=np.float64, na_value=np.nan).reshape(-1, 1),
+            edge_info["edges"].reshape(1, -1),
+            bins_count
+        )
+        return pd.Series(self._bin_labels(bins_count)[codes[:, 0]], index=series.index)
 
+    @staticmethod
+    def _equal_width_codes(X: np.ndarray, edges: np.ndarray, bins_count: int) -> np.ndarray:
 
-        result = pd.cut(series, bins=edges, labels=labels, include_lowest=True)
-        return result.astype(str)
+
+
+
+
+        if NUMBA_AVAILABLE and X.size > NUMBA_MIN_CELLS:
+            return _numba_equal_width_kernel()(X, np.ascontiguousarray(edges), bins_count)
+
+        lo, hi = edges[:, 0], edges[:, -1]
+        valid = (X >= lo) & (X <= hi)
+        X = np.where(valid, X, lo)
+        idx = np.clip(((X - lo) * (bins_count / (hi - lo))).astype(np.int64), 0, bins_count - 1)
+
+
+
+        cols = np.arange(edges.shape[0])
+        while True:
+            down = (idx > 0) & (X <= edges[cols, idx])
+            up = (idx < bins_count - 1) & (X > edges[cols, idx + 1])
+            if not (down.any() or up.any()):
+                break
+            idx = idx - down + up
+
+        return np.where(valid, idx, bins_count)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _bin_labels(bins_count: int) -> np.ndarray:
+
+        labels = np.array([f"bin_{i+1}" for i in range(bins_count)] + ["nan"], dtype=object)
+        labels.setflags(write=False)
+        return labels
+
+    def _labels_for(self, method: str, edge_info: dict) -> np.ndarray:
+
+        if method == "kmeans":
+            return self._cluster_labels(len(edge_info["centers"]))
+        if method == "equal_frequency":
+            return self._bin_labels(len(edge_info["edges"]) - 1)
+        return self._bin_labels(edge_info["bins"])
 
     def _transform_equal_frequency(self, series: pd.Series, edge_info: dict) -> pd.Series:
 
-        bins_count = edge_info["bins"]
         edges = edge_info["edges"]
+        return self._assign_bins(series, edges, len(edges) - 1)
+
+    def _assign_bins(self, series: pd.Series, edges: np.ndarray, bins_count: int) -> pd.Series:
+
+        codes = self._equal_frequency_codes(series.to_numpy(dtype=np.float64, na_value=np.nan), edges)
+        return pd.Series(self._bin_labels(bins_count)[codes], index=series.index)
 
+    @staticmethod
+    def _equal_frequency_codes(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
 
-        actual_bins = len(edges) - 1
-        labels = [f"bin_{i+1}" for i in range(actual_bins)]
 
-        result = pd.cut(series, bins=edges, labels=labels, include_lowest=True)
-        return result.astype(str)
+
+        if len(np.unique(edges)) < len(edges) and len(edges) != 2:
+            raise ValueError(f"Krawędzie binów muszą być unikalne: {edges!r}")
+
+
+        ids = np.searchsorted(edges, values, side="left")
+        ids[values == edges[0]] = 1
+        valid = (ids > 0) & (ids < len(edges))
+        return np.where(valid, ids - 1, len(edges) - 1)
 
     def _transform_kmeans(self, series: pd.Series, edge_info: dict) -> pd.Series:
 
         centers = edge_info["centers"]
-        values = series.values.reshape(-1, 1)
+        codes = self._kmeans_codes(series.to_numpy(dtype=np.float64, na_value=np.nan), centers)
+        return pd.Series(self._cluster_labels(len(centers))[codes], index=series.index)
 
+    @staticmethod
+    def _kmeans_codes(values: np.ndarray, centers: np.ndarray) -> np.ndarray:
 
-        distances = np.abs(values - centers.reshape(1, -1))
-        cluster_labels = np.argmin(distances, axis=1)
+        return np.where(np.isnan(values), len(centers), assign_clusters(values, centers))
 
-        result = pd.Series([f"cluster_{l+1}" for l in cluster_labels], index=series.index)
-        return result
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _cluster_labels(clusters_count: int) -> np.ndarray:
+
+        labels = np.array([f"cluster_{i}" for i in range(1, clusters_count + 1)] + ["nan"], dtype=object)
+        labels.setflags(write=False)
+        return labels
 
 
 
     def _equal_width(self, series: pd.Series, bins: int) -> pd.Series:
 
-        labels = [f"bin_{i+1}" for i in range(bins)]
-        result = pd.cut(series, bins=bins, labels=labels)
-        return result.astype(str)
+        return self._transform_equal_width(series, self._fit_equal_width(series, bins))
 
     def _equal_frequency(self, series: pd.Series, bins: int) -> pd.Series:
 
-        labels = [f"bin_{i+1}" for i in range(bins)]
-        try:
-            result = pd.qcut(series, q=bins, labels=labels, duplicates="drop")
-        except ValueError:
-            result = pd.qcut(series, q=bins, duplicates="drop")
-            mapping = {cat: f"bin_{i+1}" for i, cat in enumerate(result.cat.categories)}
-            result = result.map(mapping)
-        return result.astype(str)
+        return self._transform_equal_frequency(series, self._fit_equal_frequency(series, bins))
 
     def _kmeans(self, series: pd.Series, bins: int) -> pd.Series:
 
-        values = series.values.reshape(-1, 1)
-        kmeans = KMeans(n_clusters=bins, random_state=42, n_init=10)
-        labels = kmeans.fit_predict(values)
-        result = pd.Series([f"cluster_{l+1}" for l in labels], index=series.index)
-        return result
+        return self._transform_kmeans(series, self._fit_kmeans(series, bins))
+
+
+def _fit_bin_edges(frame: pd.DataFrame, method: str, bins: int, skip_binary: bool) -> dict:
+
+    fitters = {
+        "equal_width": Discretizer._fit_equal_width,
+        "equal_frequency": Discretizer._fit_equal_frequency,
+        "kmeans": Discretizer._fit_kmeans,
+    }
+
+    binary = _binary_columns(frame) if skip_binary else set()
+
+    bin_edges = {}
+    for column in frame.columns:
+
+        if column in binary:
+            continue
+
+        bin_edges[column] = fitters[method](frame[column], bins)
+    return bin_edges
+
+
+def _binary_columns(frame: pd.DataFrame) -> set:
+
+
+
+
+    numeric = frame.select_dtypes(include=[np.number])
+    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    mins = numeric.min().to_numpy(dtype=np.float64, na_value=np.nan)
+    maxs = numeric.max().to_numpy(dtype=np.float64, na_value=np.nan)
+    two_valued = ((values == mins) | (values == maxs) | np.isnan(values)).all(axis=0)
+
+    binary = set(numeric.columns[two_valued])
+    binary.update(column for column in frame.columns
+                  if column not in numeric.columns and frame[column].nunique() <= 2)
+    return binary
+
+
+def _fit_bin_edges_memoized(frame: pd.DataFrame, method: str, bins: int, skip_binary: bool) -> dict:
+
+    if frame.shape[1] == 0:
+        return {}
+
+    key = (method, bins, skip_binary, frame_fingerprint(frame))
+    with _fit_cache_lock:
+        if key in _fit_cache:
+            _fit_cache.move_to_end(key)
+            return _fit_cache[key]
+
+    bin_edges = _fit_bin_edges(frame, method, bins, skip_binary)
+    for info in bin_edges.values():
+        for value in info.values():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+
+    with _fit_cache_lock:
+        _fit_cache[key] = bin_edges
+        if len(_fit_cache) > FIT_CACHE_SIZE:
+            _fit_cache.popitem(last=False)
+    return bin_edges
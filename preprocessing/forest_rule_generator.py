@@ -5,22 +5,32 @@
 
 
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 import pandas as pd
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.preprocessing import OrdinalEncoder
 import numpy as np
 import logging
 import random
+import threading
+from collections import OrderedDict
 
 from core.models import Fact, Rule
+from preprocessing._fingerprint import frame_fingerprint
+
+if TYPE_CHECKING:
+    from sklearn.tree import DecisionTreeClassifier
 
 
 default_logger = logging.getLogger(__name__)
 
 
+RESULT_CACHE_SIZE = 16
+
+
 class ForestRuleGenerator:
 
+    _result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _result_cache_lock = threading.Lock()
+
 
 
 
@@ -35,7 +45,7 @@ class ForestRuleGenerator:
 
 
 
-    def __init__(self, n_estimators: int = 5, max_depth: int = 5, min_samples_leaf: int = 5, random_state: int = 42, logger: Optional[logging.Logger] = None, min_depth: int = 2):
+    def __init__(self, n_estimators: int = 5, max_depth: int = 5, min_samples_leaf: int = 5, random_state: int = 42, logger: Optional[logging.Logger] = None, min_depth: int = 2, n_jobs: Optional[int] = -1):
 
 
 
@@ -52,6 +62,7 @@ class ForestRuleGenerator:
         self.min_depth = min_depth
         self.min_samples_leaf = min_samples_leaf
         self.random_state = random_state
+        self.n_jobs = n_jobs
         self.encoder = None
         self.estimators_ = []
         self.feature_names = None
@@ -72,6 +83,38 @@ class ForestRuleGenerator:
 
 
 
+        key = (
+            frame_fingerprint(df), decision_column, self.n_estimators, self.min_depth, self.max_depth,
+            self.min_samples_leaf, self.random_state, hash(self.rng.getstate())
+        )
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+        if cached is not None:
+            (rules, estimators, self.encoder, feature_names, class_names,
+             self.rule_id_counter, rng_state) = cached
+            self.estimators_ = list(estimators)
+            self.feature_names = list(feature_names)
+            self.class_names = list(class_names)
+            self.decision_column = decision_column
+            self.rng.setstate(rng_state)
+            self.logger.debug(f"[FOREST] Reusing {len(rules)} cached rules for identical data and parameters")
+            return list(rules)
+
+        rules = self._generate(df, decision_column)
+        entry = (
+            tuple(rules), tuple(self.estimators_), self.encoder, tuple(self.feature_names),
+            tuple(self.class_names), self.rule_id_counter, self.rng.getstate()
+        )
+        with self._result_cache_lock:
+            self._result_cache[key] = entry
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return rules
+
+    def _generate(self, df: pd.DataFrame, decision_column: str) -> List[Rule]:
+
         self.decision_column = decision_column
         self.rule_id_counter = 0
 
@@ -83,6 +126,9 @@ class ForestRuleGenerator:
         self.class_names = y.unique().tolist()
 
 
+        from sklearn.preprocessing import OrdinalEncoder
+        from joblib import Parallel, delayed
+
         self.encoder = OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=-1)
         X_encoded = self.encoder.fit_transform(X)
 
@@ -91,23 +137,13 @@ class ForestRuleGenerator:
         self.logger.debug(f"[FOREST] Training on {len(X)} samples with {len(self.feature_names)} features")
 
 
-        self.estimators_ = []
-        all_rules = []
-
-        for i in range(1, self.n_estimators + 1):
-
-            current_depth = self.rng.randint(self.min_depth, self.max_depth)
-
-
-            tree = DecisionTreeClassifier(
-                max_depth=current_depth,
-                min_samples_leaf=self.min_samples_leaf,
-                max_features="sqrt",
-                random_state=self.random_state + i
-            )
-            tree.fit(X_encoded, y)
-            self.estimators_.append(tree)
+        depths = [self.rng.randint(self.min_depth, self.max_depth) for _ in range(self.n_estimators)]
+        self.estimators_ = Parallel(n_jobs=self.n_jobs if self.n_estimators > 1 else 1, prefer="threads")(
+            delayed(self._fit_one)(i, depth, X_encoded, y) for i, depth in enumerate(depths, start=1)
+        )
 
+        all_rules = []
+        for i, (tree, current_depth) in enumerate(zip(self.estimators_, depths), start=1):
 
             self.logger.debug(f"[FOREST] Tree {i}/{self.n_estimators} trained with max_depth={current_depth}")
 
@@ -128,79 +164,84 @@ class ForestRuleGenerator:
 
         return all_rules
 
-    def _extract_rules_from_single_tree(self, tree_model) -> List[Rule]:
-
-
-
+    def _fit_one(self, i: int, depth: int, X_encoded: np.ndarray, y: pd.Series) -> "DecisionTreeClassifier":
 
+        from sklearn.tree import DecisionTreeClassifier
 
+        tree = DecisionTreeClassifier(
+            max_depth=depth,
+            min_samples_leaf=self.min_samples_leaf,
+            max_features="sqrt",
+            random_state=self.random_state + i
+        )
+        return tree.fit(X_encoded, y)
 
+    def _extract_rules_from_single_tree(self, tree_model) -> List[Rule]:
 
 
 
-        tree = tree_model.tree_
-        feature = tree.feature
-        threshold = tree.threshold
-        value = tree.value
-
-        rules = []
-
-
-        def traverse(node_id: int, current_premises: List[Fact]):
-
 
 
-            if tree.children_left[node_id] == tree.children_right[node_id]:
 
 
-                class_counts = value[node_id][0]
-                predicted_class_idx = np.argmax(class_counts)
 
 
-                predicted_class = tree_model.classes_[predicted_class_idx]
+        tree = tree_model.tree_
+        left, right = tree.children_left, tree.children_right
+        internal = np.flatnonzero(left != right)
+        leaves = np.flatnonzero(left == right)
 
 
-                conclusion = Fact(self.decision_column, str(predicted_class))
 
 
-                if current_premises:
-                    rule = Rule(
-                        id=self.rule_id_counter,
-                        premises=current_premises.copy(),
-                        conclusion=conclusion
-                    )
-                    rules.append(rule)
-                    self.rule_id_counter += 1
+        parent = np.full(tree.node_count + 1, -1, dtype=np.intp)
+        parent[left[internal]] = internal
+        parent[right[internal]] = internal
+        reachable = np.ones(tree.node_count + 1, dtype=bool)
+        edge_premise: List[Optional[Fact]] = [None] * (tree.node_count + 1)
 
-                return
+        left_idx = np.floor(tree.threshold[internal]).astype(np.intp)
+        right_idx = np.ceil(tree.threshold[internal]).astype(np.intp)
+        for node, feature_idx, left_category_idx, right_category_idx in zip(
+            internal.tolist(), tree.feature[internal].tolist(), left_idx.tolist(), right_idx.tolist()
+        ):
+            categories = self.encoder.categories_[feature_idx]
+            feature_name = self.feature_names[feature_idx]
 
 
-            feature_idx = feature[node_id]
-            feature_name = self.feature_names[feature_idx]
-            threshold_value = threshold[node_id]
 
+            if left_category_idx < 0:
+                reachable[left[node]] = False
+            elif left_category_idx < len(categories):
+                edge_premise[left[node]] = Fact.intern(feature_name, str(categories[left_category_idx]))
 
+            if right_category_idx >= len(categories):
+                reachable[right[node]] = False
+            elif right_category_idx >= -len(categories):
+                edge_premise[right[node]] = Fact.intern(feature_name, str(categories[right_category_idx]))
 
-            left_category_idx = int(np.floor(threshold_value))
-            if left_category_idx >= 0:
-                try:
-                    left_category = self.encoder.categories_[feature_idx][left_category_idx]
-                    left_premise = Fact(feature_name, str(left_category))
-                    traverse(tree.children_left[node_id], current_premises + [left_premise])
-                except (IndexError, KeyError):
-                    traverse(tree.children_left[node_id], current_premises)
 
+        paths = np.empty((tree.max_depth + 1, len(leaves)), dtype=np.intp)
+        paths[0] = leaves
+        for depth in range(1, tree.max_depth + 1):
+            paths[depth] = parent[paths[depth - 1]]
+        complete = reachable[paths].all(axis=0)
 
-            right_category_idx = int(np.ceil(threshold_value))
-            if right_category_idx < len(self.encoder.categories_[feature_idx]):
-                try:
-                    right_category = self.encoder.categories_[feature_idx][right_category_idx]
-                    right_premise = Fact(feature_name, str(right_category))
-                    traverse(tree.children_right[node_id], current_premises + [right_premise])
-                except (IndexError, KeyError):
-                    traverse(tree.children_right[node_id], current_premises)
 
+        predicted = tree_model.classes_[np.argmax(tree.value[leaves, 0], axis=1)]
 
-        traverse(0, [])
+        rules = []
+        for column in np.flatnonzero(complete).tolist():
+            premises = [
+                edge_premise[node] for node in reversed(paths[:, column].tolist())
+                if edge_premise[node] is not None
+            ]
+            if premises:
+                rules.append(Rule(
+                    id=self.rule_id_counter,
+                    premises=premises,
+                    conclusion=Fact.intern(self.decision_column, str(predicted[column]))
+                ))
+                self.rule_id_counter += 1
 
         return rules
@@ -15,7 +15,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class ImputationReport:
 
 
@@ -65,8 +65,8 @@ class Imputer:
 
 
 
-        missing = df.isnull().sum()
-        return {col: count for col, count in missing.items() if count > 0}
+        missing = df.isna().sum(axis=0)
+        return {col: int(count) for col, count in missing.items() if count}
     
     def has_missing(self, df: pd.DataFrame) -> bool:
 
@@ -78,7 +78,7 @@ class Imputer:
 
 
 
-        return df.isnull().any().any()
+        return bool(df.isna().to_numpy().any())
     
     def impute(
         self,
@@ -113,7 +113,8 @@ class Imputer:
         if decision_column not in df.columns:
             raise ValueError(f"Kolumna decyzyjna '{decision_column}' nie istnieje w DataFrame")
         
-        if df[decision_column].isnull().any():
+        missing_info = self.check_missing(df)
+        if decision_column in missing_info:
             raise ValueError(
                 f"Kolumna decyzyjna '{decision_column}' zawiera brakujące wartości. "
                 "Usuń te wiersze przed imputacją."
@@ -122,9 +123,6 @@ class Imputer:
 
         result = df.copy()
         
-
-        missing_info = self.check_missing(df)
-        
         if not missing_info:
 
             report = ImputationReport(
@@ -146,59 +144,35 @@ class Imputer:
                                 if col != decision_column]
         
 
-        values_imputed = {}
         imputation_values = {}
-        
 
-        for col in columns_to_impute:
-            col_imputation_values = {}
-            
-
-            is_numeric = pd.api.types.is_numeric_dtype(df[col])
-            
-            if is_numeric:
-
-                if numeric_method == "mean":
-                    fill_values = df.groupby(decision_column)[col].transform('mean')
-                else:
-                    fill_values = df.groupby(decision_column)[col].transform('median')
-                
-
-                for cls in df[decision_column].unique():
-                    class_data = df[df[decision_column] == cls][col]
-                    if numeric_method == "mean":
-                        col_imputation_values[str(cls)] = class_data.mean()
-                    else:
-                        col_imputation_values[str(cls)] = class_data.median()
-                        
-            else:
-
-                def get_mode(x):
-                    mode_result = x.mode()
-                    if len(mode_result) > 0:
-                        return mode_result.iloc[0]
-                    return None
-                
-                fill_values = df.groupby(decision_column)[col].transform(
-                    lambda x: x.fillna(get_mode(x))
-                )
-                
-
-                for cls in df[decision_column].unique():
-                    class_data = df[df[decision_column] == cls][col]
-                    mode_val = class_data.mode()
-                    if len(mode_val) > 0:
-                        col_imputation_values[str(cls)] = mode_val.iloc[0]
-            
-
-            missing_count = result[col].isnull().sum()
-            
-
-            result[col] = result[col].fillna(fill_values)
-            
-
-            values_imputed[col] = missing_count
-            imputation_values[col] = col_imputation_values
+
+        numeric_columns = [col for col in columns_to_impute if pd.api.types.is_numeric_dtype(df[col])]
+        categorical_columns = [col for col in columns_to_impute if col not in numeric_columns]
+        class_codes, classes = pd.factorize(df[decision_column], sort=False)
+        class_names = [str(cls) for cls in classes]
+
+
+        if numeric_columns:
+
+            class_stats = df[numeric_columns].groupby(class_codes).agg(numeric_method)
+            fill_values = pd.DataFrame(
+                class_stats.to_numpy()[class_codes], index=df.index, columns=numeric_columns
+            )
+            result[numeric_columns] = result[numeric_columns].fillna(fill_values)
+            for col in numeric_columns:
+                imputation_values[col] = {class_names[code]: value for code, value in class_stats[col].items()}
+
+        if categorical_columns:
+
+            for col in categorical_columns:
+                class_modes = self._class_modes(df[col], class_codes, len(classes))
+                fill_values = pd.Series(class_codes, index=df.index).map(class_modes)
+                result[col] = result[col].fillna(fill_values)
+                imputation_values[col] = {class_names[code]: value for code, value in class_modes.items()}
+
+        values_imputed = {col: missing_info[col] for col in columns_to_impute}
+        imputation_values = {col: imputation_values[col] for col in columns_to_impute}
         
 
         report = ImputationReport(
@@ -212,6 +186,26 @@ class Imputer:
         self._last_report = report
         return result, report
     
+    @staticmethod
+    def _class_modes(values: pd.Series, class_codes: np.ndarray, n_classes: int) -> pd.Series:
+
+
+
+
+        value_codes, uniques = pd.factorize(values, sort=True)
+        if len(uniques) == 0:
+            return pd.Series(dtype=object)
+
+        present = value_codes >= 0
+        counts = np.bincount(
+            class_codes[present] * len(uniques) + value_codes[present],
+            minlength=n_classes * len(uniques)
+        ).reshape(n_classes, len(uniques))
+
+        has_mode = counts.any(axis=1)
+        mode_codes = counts.argmax(axis=1)[has_mode]
+        return pd.Series(uniques.take(mode_codes), index=np.flatnonzero(has_mode), dtype=object)
+
     def get_last_report(self) -> Optional[ImputationReport]:
 
 
@@ -1,10 +1,21 @@
 
 
+import copy
+import re
+from collections import OrderedDict
+
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Any, Optional, Set
 
 from core.models import Fact, Rule
+from preprocessing._fingerprint import frame_fingerprint
+
+
+RESULT_CACHE_SIZE = 16
+
+
+FACTORIZE_SAFE_DTYPES = frozenset({"string", "integer", "boolean"})
 
 
 class RuleGenerator:
@@ -20,6 +31,9 @@ class RuleGenerator:
     
 
     ID_PATTERNS = ["id", "index", "row", "nr", "number", "lp", "name", "unnamed"]
+    _ID_REGEX = re.compile("|".join(map(re.escape, ID_PATTERNS)))
+
+    _result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
     
     def __init__(self):
 
@@ -39,39 +53,69 @@ class RuleGenerator:
 
 
 
-        id_columns = []
-        
-        for col in df.columns:
+        columns = list(df.columns)
+        is_id = np.fromiter(
+            (self._ID_REGEX.search(str(col).lower()) is not None for col in columns),
+            dtype=bool, count=len(columns)
+        )
 
-            col_lower = col.lower()
-            if any(pattern in col_lower for pattern in self.ID_PATTERNS):
-                id_columns.append(col)
-                continue
-            
 
-            if pd.api.types.is_numeric_dtype(df[col]):
-                values = df[col].dropna()
+        dtypes = df.dtypes
+        numeric = [col for col, dtype in zip(columns, dtypes) if pd.api.types.is_numeric_dtype(dtype)]
+        exact = [col for col in numeric if self._fits_int64(dtypes[col])]
+        inexact = [col for col in numeric if isinstance(dtypes[col], np.dtype) and dtypes[col].kind == "f"]
+        sequential = set()
+        if exact:
+            mask = self._sequential_mask(df[exact].to_numpy(dtype=np.int64))
+            sequential.update(col for col, flagged in zip(exact, mask) if flagged)
+        if inexact:
+            mask = self._sequential_mask(df[inexact].to_numpy(dtype=np.float64))
+            sequential.update(col for col, flagged in zip(inexact, mask) if flagged)
+        vectorized = set(exact) | set(inexact)
+        sequential.update(
+            col for col in numeric if col not in vectorized and self._is_sequential(df[col])
+        )
 
 
-                if len(values) == len(values.unique()):
 
-                    sorted_vals = sorted(values)
-                    if len(sorted_vals) > 1:
-                        differences = [sorted_vals[i+1] - sorted_vals[i]
-                                      for i in range(len(sorted_vals)-1)]
-                        if all(d == 1 for d in differences):
-                            id_columns.append(col)
+        numeric_set = set(numeric)
+        other = [col for col in columns if col not in numeric_set]
+        high_cardinality = set()
+        if other:
+            counts = df[other].count()
+            ratios = df[other].nunique() / counts.where(counts > 0)
+            high_cardinality.update(ratios.index[(counts >= 20) & (ratios > 0.95)])
 
+        return [
+            col for col, flagged in zip(columns, is_id)
+            if flagged or col in sequential or col in high_cardinality
+        ]
 
+    @staticmethod
+    def _fits_int64(dtype) -> bool:
 
-            else:
-                values = df[col].dropna()
-                if len(values) >= 20:
-                    unique_ratio = len(values.unique()) / len(values)
-                    if unique_ratio > 0.95:
-                        id_columns.append(col)
-        
-        return id_columns
+        if not isinstance(dtype, np.dtype):
+            return False
+        return dtype.kind in "ib" or (dtype.kind == "u" and dtype.itemsize < 8)
+
+    @staticmethod
+    def _is_sequential(series: pd.Series) -> bool:
+
+        values = sorted(series.dropna().tolist())
+        return len(values) > 1 and all(b - a == 1 for a, b in zip(values, values[1:]))
+
+    @staticmethod
+    def _sequential_mask(values: np.ndarray) -> np.ndarray:
+
+
+
+
+        values = np.sort(values, axis=0)
+        steps = np.diff(values, axis=0)
+        if values.dtype.kind == "f":
+            present = np.count_nonzero(~np.isnan(values), axis=0)
+            return (present > 1) & ((steps == 1) | np.isnan(values[1:])).all(axis=0)
+        return (len(values) > 1) & (steps == 1).all(axis=0)
     
     def generate(
         self, 
@@ -103,7 +147,31 @@ class RuleGenerator:
 
         if decision_column not in df.columns:
             raise ValueError(f"Kolumna decyzyjna '{decision_column}' nie istnieje w DataFrame")
-        
+
+        key = (
+            frame_fingerprint(df), tuple(df.columns), decision_column,
+            tuple(exclude_columns) if exclude_columns else (), auto_exclude_id
+        )
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            rules, statistics = cached
+        else:
+            rules, statistics = self._generate(df, decision_column, exclude_columns, auto_exclude_id)
+            self._result_cache[key] = (tuple(rules), statistics)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+        self._statistics = copy.deepcopy(statistics)
+        return list(rules)
+
+    def _generate(
+        self,
+        df: pd.DataFrame,
+        decision_column: str,
+        exclude_columns: Optional[List[str]],
+        auto_exclude_id: bool
+    ) -> tuple:
 
         columns_to_exclude: Set[str] = set()
         
@@ -129,23 +197,48 @@ class RuleGenerator:
         df_unique = df[relevant_columns].drop_duplicates()
         
 
-        rules = []
-        for idx, row in df_unique.iterrows():
-            premises = [Fact(col, str(row[col])) for col in attribute_columns]
-            conclusion = Fact(decision_column, str(row[decision_column]))
-            rule = Rule(id=len(rules), premises=premises, conclusion=conclusion)
-            rules.append(rule)
+        values = df_unique.to_numpy()
+        fact_columns = [
+            self._column_facts(col, df_unique.iloc[:, position], values[:, position])
+            for position, col in enumerate(relevant_columns)
+        ]
+        *premise_columns, conclusions = fact_columns
+
+        rules = [
+            Rule(id=rule_id, premises=premises, conclusion=conclusion)
+            for rule_id, (premises, conclusion) in enumerate(zip(zip(*premise_columns), conclusions))
+        ]
         
 
-        self._statistics = {
+        statistics = {
             "total_rules": len(rules),
             "avg_premises": sum(len(r.premises) for r in rules) / len(rules) if rules else 0,
             "excluded_columns": list(columns_to_exclude - {decision_column}),
             "attribute_columns": attribute_columns
         }
         
-        return rules
+        return rules, statistics
     
+    @staticmethod
+    def _column_facts(column: str, series: pd.Series, values: np.ndarray) -> List[Fact]:
+
+
+
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            uniques = list(series.cat.categories) + [np.nan]
+        elif pd.api.types.infer_dtype(values, skipna=False) in FACTORIZE_SAFE_DTYPES:
+            codes, uniques = pd.factorize(values)
+        else:
+            labels = [str(value) for value in values]
+            facts = {label: Fact.intern(column, label) for label in dict.fromkeys(labels)}
+            return list(map(facts.__getitem__, labels))
+
+        facts = np.empty(len(uniques), dtype=object)
+        facts[:] = [Fact.intern(column, str(value)) for value in uniques]
+        return facts[codes].tolist()
+
     def get_statistics(self) -> Dict[str, Any]:
 
 
@@ -12,8 +12,6 @@
 
 from typing import List
 import pandas as pd
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.preprocessing import OrdinalEncoder
 import numpy as np
 
 from core.models import Fact, Rule
@@ -74,6 +72,9 @@ class TreeRuleGenerator:
         self.class_names = y.unique().tolist()
 
 
+        from sklearn.tree import DecisionTreeClassifier
+        from sklearn.preprocessing import OrdinalEncoder
+
         self.encoder = OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=-1)
         X_encoded = self.encoder.fit_transform(X)
 
@@ -118,14 +119,14 @@ class TreeRuleGenerator:
                 predicted_class = self.tree_model.classes_[predicted_class_idx]
 
 
-                conclusion = Fact(self.decision_column, str(predicted_class))
+                conclusion = Fact.intern(self.decision_column, str(predicted_class))
 
 
                 if current_premises:
                     nonlocal rule_id
                     rule = Rule(
                         id=rule_id,
-                        premises=current_premises.copy(),
+                        premises=current_premises,
                         conclusion=conclusion
                     )
                     rules.append(rule)
@@ -148,7 +149,7 @@ class TreeRuleGenerator:
                 try:
 
                     left_category = self.encoder.categories_[feature_idx][left_category_idx]
-                    left_premise = Fact(feature_name, str(left_category))
+                    left_premise = Fact.intern(feature_name, str(left_category))
                     traverse(tree.children_left[node_id], current_premises + [left_premise])
                 except (IndexError, KeyError):
 
@@ -159,7 +160,7 @@ class TreeRuleGenerator:
             if right_category_idx < len(self.encoder.categories_[feature_idx]):
                 try:
                     right_category = self.encoder.categories_[feature_idx][right_category_idx]
-                    right_premise = Fact(feature_name, str(right_category))
+                    right_premise = Fact.intern(feature_name, str(right_category))
                     traverse(tree.children_right[node_id], current_premises + [right_premise])
                 except (IndexError, KeyError):
 
@@ -1,12 +1,18 @@
 
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Union, Tuple
-from pathlib import Path
+from typing import IO, FrozenSet, List, Optional, Union, Tuple, Iterator
+import dataclasses
+import functools
+import itertools
 import os
+import stat
 import pandas as pd
 
 
+DETECT_SAMPLE_SIZE = 64 * 1024
+
+
 @dataclass
 class ValidationError:
 
@@ -24,8 +30,12 @@ class ValidationResult:
     infos: List[str] = field(default_factory=list)
     detected_config: Optional["CSVConfig"] = None
 
+    @property
+    def error_codes(self) -> FrozenSet[str]:
+        return frozenset(e.code for e in self.errors)
 
-def validate_file_path(path: Path) -> ValidationResult:
+
+def validate_file_path(path: Union[str, os.PathLike]) -> ValidationResult:
 
 
 
@@ -38,9 +48,13 @@ def validate_file_path(path: Path) -> ValidationResult:
 
 
     errors = []
+    path = os.fspath(path)
+    extension = os.path.splitext(path)[1]
     
 
-    if not path.exists():
+    try:
+        st = os.stat(path)
+    except OSError:
         errors.append(ValidationError(
             code="F01",
             message=f"Plik nie istnieje: {path}",
@@ -49,7 +63,7 @@ def validate_file_path(path: Path) -> ValidationResult:
         return ValidationResult(is_valid=False, errors=errors)
     
 
-    if path.is_dir():
+    if stat.S_ISDIR(st.st_mode):
         errors.append(ValidationError(
             code="F02",
             message=f"Ścieżka wskazuje na folder, nie plik: {path}",
@@ -67,7 +81,7 @@ def validate_file_path(path: Path) -> ValidationResult:
         return ValidationResult(is_valid=False, errors=errors)
     
 
-    if not path.suffix:
+    if extension in ("", "."):
         errors.append(ValidationError(
             code="F04",
             message=f"Plik nie ma rozszerzenia: {path}",
@@ -77,16 +91,16 @@ def validate_file_path(path: Path) -> ValidationResult:
     
 
     valid_extensions = {".csv", ".txt"}
-    if path.suffix.lower() not in valid_extensions:
+    if extension.lower() not in valid_extensions:
         errors.append(ValidationError(
             code="F05",
-            message=f"Niepoprawne rozszerzenie pliku: {path.suffix}. Dozwolone: .csv, .txt",
+            message=f"Niepoprawne rozszerzenie pliku: {extension}. Dozwolone: .csv, .txt",
             is_critical=True
         ))
         return ValidationResult(is_valid=False, errors=errors)
     
 
-    if path.stat().st_size == 0:
+    if st.st_size == 0:
         errors.append(ValidationError(
             code="F07",
             message=f"Plik jest pusty (0 bajtów): {path}",
@@ -97,7 +111,7 @@ def validate_file_path(path: Path) -> ValidationResult:
     return ValidationResult(is_valid=True, errors=[])
 
 
-def validate_file_content(path: Path, separator: str = ",", 
+def validate_file_content(path: Union[str, os.PathLike], separator: str = ",", 
                           has_header: bool = True,
                           encoding: str = "utf-8") -> ValidationResult:
 
@@ -111,22 +125,41 @@ def validate_file_content(path: Path, separator: str = ",",
 
 
 
-    errors = []
-    warnings = []
-    
-
     try:
-        content = path.read_text(encoding=encoding)
+        with open(path, "r", encoding=encoding) as f:
+            return _validate_lines(f, separator, has_header)
     except UnicodeDecodeError as e:
-        errors.append(ValidationError(
+        errors = [ValidationError(
             code="C02",
             message=f"Niepoprawne kodowanie pliku (oczekiwano {encoding}): {e}",
             is_critical=True
-        ))
+        )]
         return ValidationResult(is_valid=False, errors=errors)
+
+
+def validate_buffer_content(buffer: IO[str], separator: str = ",",
+                            has_header: bool = True) -> ValidationResult:
+
+
+
+
+    start = buffer.tell()
+    try:
+        return _validate_lines(buffer, separator, has_header)
+    finally:
+        buffer.seek(start)
+
+
+def _validate_lines(f: IO[str], separator: str, has_header: bool) -> ValidationResult:
+
+    errors = []
+    warnings = []
+
+    lines = _iter_content_lines(f)
+    first_line_text = next(lines, None)
     
 
-    if not content.strip():
+    if first_line_text is None:
         errors.append(ValidationError(
             code="C01",
             message="Plik zawiera tylko białe znaki",
@@ -135,10 +168,10 @@ def validate_file_content(path: Path, separator: str = ",",
         return ValidationResult(is_valid=False, errors=errors)
     
 
-    lines = content.strip().split('\n')
+    second_line_text = next(lines, None)
     
 
-    if has_header and len(lines) <= 1:
+    if has_header and second_line_text is None:
         errors.append(ValidationError(
             code="C04",
             message="Plik zawiera tylko nagłówki, brak wierszy z danymi",
@@ -147,7 +180,7 @@ def validate_file_content(path: Path, separator: str = ",",
         return ValidationResult(is_valid=False, errors=errors)
     
 
-    first_line = lines[0].split(separator)
+    first_line = first_line_text.split(separator)
     
 
     if len(first_line) < 2:
@@ -179,23 +212,23 @@ def validate_file_content(path: Path, separator: str = ",",
     
 
     expected_cols = len(first_line)
-    start_row = 1 if has_header else 0
-    
-    for i, line in enumerate(lines[start_row:], start=start_row):
-        cols = line.split(separator)
-        if len(cols) != expected_cols:
-            errors.append(ValidationError(
-                code="D01",
-                message=f"Niespójna liczba kolumn w wierszu {i+1}: oczekiwano {expected_cols}, znaleziono {len(cols)}",
-                is_critical=True
-            ))
-            break
     
+    if second_line_text is not None:
+        for i, line in enumerate(itertools.chain([second_line_text], lines), start=1):
+            cols = line.split(separator)
+            if len(cols) != expected_cols:
+                errors.append(ValidationError(
+                    code="D01",
+                    message=f"Niespójna liczba kolumn w wierszu {i+1}: oczekiwano {expected_cols}, znaleziono {len(cols)}",
+                    is_critical=True
+                ))
+                break
+
     is_valid = len(errors) == 0
     return ValidationResult(is_valid=is_valid, errors=errors, warnings=warnings)
 
 
-def detect_csv_config(path: Path) -> "CSVConfig":
+def _iter_content_lines(f) -> Iterator[str]:
 
 
 
@@ -204,9 +237,64 @@ def detect_csv_config(path: Path) -> "CSVConfig":
 
 
 
-    from preprocessing.data_loader import CSVConfig
+
+
+    previous = None
+    blank_lines = []
     
-    content = path.read_text(encoding="utf-8")
+    for raw_line in f:
+        line = raw_line.rstrip("\n")
+        
+        if not line.strip():
+            if previous is not None:
+                blank_lines.append(line)
+            continue
+        
+        if previous is None:
+            previous = line.lstrip()
+            continue
+        
+        yield previous
+        yield from blank_lines
+        blank_lines = []
+        previous = line
+    
+    if previous is not None:
+        yield previous.rstrip()
+
+
+def detect_csv_config(path: Union[str, os.PathLike, IO[str]]) -> "CSVConfig":
+
+
+
+
+
+
+
+
+    if hasattr(path, "read"):
+        start = path.tell()
+        content = path.read(DETECT_SAMPLE_SIZE)
+        path.seek(start)
+        return _detect_csv_config_from_sample(content)
+
+    path = os.fspath(path)
+    st = os.stat(path)
+    config = _detect_csv_config_cached(path, st.st_mtime_ns, st.st_size)
+    return dataclasses.replace(config, exclude_columns=[])
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_csv_config_cached(path: str, mtime_ns: int, size: int) -> "CSVConfig":
+
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read(DETECT_SAMPLE_SIZE)
+    return _detect_csv_config_from_sample(content)
+
+
+def _detect_csv_config_from_sample(content: str) -> "CSVConfig":
+    from preprocessing.data_loader import CSVConfig
+
     first_line = content.split('\n')[0]
     
 
@@ -308,12 +396,12 @@ def validate_decision_column(
             return df, ValidationResult(is_valid=False, errors=errors, warnings=warnings, infos=infos)
     
 
-    null_count = df[decision_column].isnull().sum()
+    null_mask = df[decision_column].isna().to_numpy()
+    null_count = int(null_mask.sum())
     if null_count > 0:
         if drop_missing:
-            original_len = len(df)
-            df = df.dropna(subset=[decision_column])
-            dropped = original_len - len(df)
+            df = df.loc[~null_mask]
+            dropped = null_count
             infos.append(f"DF02: Usunięto {dropped} wierszy z pustą kolumną decyzyjną '{decision_column}'")
         else:
             errors.append(ValidationError(
@@ -331,7 +419,8 @@ def validate_decision_column(
         ))
     
 
-    unique_classes = df[decision_column].nunique()
+    class_counts = df[decision_column].value_counts()
+    unique_classes = len(class_counts)
     if unique_classes < 2:
         errors.append(ValidationError(
             code="DC03",
@@ -341,10 +430,9 @@ def validate_decision_column(
     
 
     if len(df) > 0 and unique_classes >= 2:
-        class_counts = df[decision_column].value_counts(normalize=True)
-        max_class_ratio = class_counts.max()
+        max_class_ratio = class_counts.iat[0] / class_counts.sum()
         if max_class_ratio > imbalance_threshold:
-            dominant_class = class_counts.idxmax()
+            dominant_class = class_counts.index[0]
             warnings.append(f"DC04: Niezbalansowane klasy - '{dominant_class}' stanowi {max_class_ratio:.1%} danych (próg: {imbalance_threshold:.0%})")
     
     is_valid = len(errors) == 0
@@ -2,6 +2,7 @@
 
 
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Tuple, Dict, Optional, List
@@ -15,6 +16,9 @@ else:
 from preprocessing.rule_generator import RuleGenerator
 
 
+NA_VALUES = ['', 'NULL', 'null', 'N/A', 'n/a', 'NA', 'nan', 'NaN', 'None']
+
+
 class CSVLoadError(Exception):
 
     pass
@@ -93,7 +97,7 @@ def load_csv(
             header=0 if has_header else None,
             encoding=encoding,
             skipinitialspace=True,
-            na_values=['', 'NULL', 'null', 'N/A', 'n/a', 'NA', 'nan', 'NaN', 'None'],
+            na_values=NA_VALUES,
             keep_default_na=True
         )
     except UnicodeDecodeError:
@@ -106,7 +110,7 @@ def load_csv(
                 header=0 if has_header else None,
                 encoding='windows-1250',
                 skipinitialspace=True,
-                na_values=['', 'NULL', 'null', 'N/A', 'n/a', 'NA', 'nan', 'NaN', 'None'],
+                na_values=NA_VALUES,
                 keep_default_na=True
             )
             print(f"*  Plik wczytano z kodowaniem windows-1250")
@@ -156,24 +160,23 @@ def load_csv(
 
 
     effective_dec_idx = decision_column_index if decision_column_index >= 0 else len(df.columns) - 1
-    decision_col_name_before_drop = df.columns[effective_dec_idx]
 
 
-    detected_id_columns = [c for c in detected_id_columns if c != decision_col_name_before_drop]
+    keep_mask = ~df.columns.isin(detected_id_columns)
+    keep_mask[effective_dec_idx] = True
 
-    removed_id_columns = []
-    if detected_id_columns:
-        removed_id_columns = list(detected_id_columns)
-        df = df.drop(columns=detected_id_columns)
-        print(f"*  Automatycznie usunięto kolumny indeksowe: {detected_id_columns}")
+    removed_id_columns = df.columns[~keep_mask].tolist()
+    if removed_id_columns:
+        df = df.iloc[:, keep_mask]
+        print(f"*  Automatycznie usunięto kolumny indeksowe: {removed_id_columns}")
 
 
-        decision_column_index = df.columns.get_loc(decision_col_name_before_drop)
+        decision_column_index = int(np.count_nonzero(keep_mask[:effective_dec_idx + 1])) - 1
 
 
         if len(df.columns) < 2:
             raise CSVLoadError(
-                f"Po usunięciu kolumn indeksowych ({detected_id_columns}) zostało za mało kolumn: "
+                f"Po usunięciu kolumn indeksowych ({removed_id_columns}) zostało za mało kolumn: "
                 f"{len(df.columns)}. Wymagane minimum: 2 (1 warunkowa + 1 decyzyjna)"
             )
 
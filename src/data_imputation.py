@@ -3,11 +3,37 @@
 
 
 
+import functools
+import importlib.util
+import io
+import sys
+
 import pandas as pd
 import numpy as np
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, IO, Union
 from pathlib import Path
 
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+NUMBA_MIN_CELLS = 10_000
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_fill_kernel():
+
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _numba_fill(x, class_idx, means):
+        for i in prange(x.shape[0]):
+            c = class_idx[i]
+            for j in range(x.shape[1]):
+                if np.isnan(x[i, j]):
+                    x[i, j] = means[c, j]
+
+    return _numba_fill
+
 
 class ImputationError(Exception):
 
@@ -33,6 +59,8 @@ class ClassMeanImputer:
         self.decision_column_index = decision_column_index
         self.class_means_ = {}
         self.is_fitted_ = False
+        self._means_mat = np.empty((0, 0), dtype=np.float64)
+        self._class_to_row = {}
 
     def fit_transform(
         self,
@@ -52,25 +80,22 @@ class ClassMeanImputer:
         if df.empty:
             raise ImputationError("DataFrame jest pusty")
 
-        df_clean = df.copy()
-
-
         if self.decision_column_index == -1:
-            dec_col_idx = len(df_clean.columns) - 1
+            dec_col_idx = len(df.columns) - 1
         else:
             dec_col_idx = self.decision_column_index
 
-        if dec_col_idx < 0 or dec_col_idx >= len(df_clean.columns):
+        if dec_col_idx < 0 or dec_col_idx >= len(df.columns):
             raise ImputationError(
                 f"Nieprawidłowy indeks kolumny decyzyjnej: {self.decision_column_index}"
             )
 
-        decision_column = df_clean.columns[dec_col_idx]
+        decision_column = df.columns[dec_col_idx]
 
 
         report = {
             'decision_column': decision_column,
-            'rows_original': len(df_clean),
+            'rows_original': len(df),
             'rows_removed_missing_decision': 0,
             'rows_final': 0,
             'columns_imputed': {},
@@ -78,10 +103,9 @@ class ClassMeanImputer:
         }
 
 
-        rows_before = len(df_clean)
-        df_clean = df_clean[df_clean[decision_column].notna()]
-        rows_after = len(df_clean)
-        rows_removed = rows_before - rows_after
+        keep = df[decision_column].notna().to_numpy()
+        rows_removed = len(df) - int(keep.sum())
+        df_clean = df.take(np.flatnonzero(keep))
 
         report['rows_removed_missing_decision'] = rows_removed
 
@@ -94,7 +118,8 @@ class ClassMeanImputer:
             )
 
 
-        classes = df_clean[decision_column].unique()
+        decision = df_clean[decision_column].astype('category')
+        classes = decision.unique()
 
         if verbose:
             print(f"[INFO] Znaleziono {len(classes)} klas decyzyjnych: {list(classes)}")
@@ -107,11 +132,18 @@ class ClassMeanImputer:
 
 
 
-            try:
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+            if pd.api.types.is_numeric_dtype(df_clean[col]):
                 numeric_columns.append(col)
-            except Exception:
-                pass
+                continue
+
+            try:
+                df_clean[col] = df_clean[col].astype(np.float64)
+            except (ValueError, TypeError):
+                try:
+                    df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+                except Exception:
+                    continue
+            numeric_columns.append(col)
 
         if verbose:
             print(f"[INFO] Kolumny numeryczne do imputacji: {numeric_columns}")
@@ -119,48 +151,64 @@ class ClassMeanImputer:
 
         self.class_means_ = {}
 
-        for col in numeric_columns:
-            missing_count_before = df_clean[col].isna().sum()
+        block = df_clean[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        block_missing = np.isnan(block)
+        missing_before = dict(zip(numeric_columns, block_missing.sum(axis=0)))
+        impute_positions = np.flatnonzero(block_missing.any(axis=0))
+        columns_to_impute = [numeric_columns[i] for i in impute_positions]
 
-            if missing_count_before == 0:
-                if verbose:
+        if verbose:
+            for col in numeric_columns:
+                if missing_before[col] == 0:
                     print(f"[{col}] Brak wartości do imputacji")
-                continue
-
 
-            class_means_for_col = {}
+        grouped = df_clean[columns_to_impute].groupby(decision, sort=False, observed=True)
 
-            for cls in classes:
 
-                mask = df_clean[decision_column] == cls
-                class_data = df_clean.loc[mask, col]
+        global_means = df_clean[columns_to_impute].mean().fillna(0.0)
+        class_means = grouped.mean().fillna(global_means)
 
+        self._means_mat = class_means.to_numpy(dtype=np.float64)
+        self._class_to_row = {cls: i for i, cls in enumerate(class_means.index)}
 
-                valid_values = class_data.dropna()
+        values = block[:, impute_positions]
+        mask = block_missing[:, impute_positions]
 
-                if len(valid_values) > 0:
-                    mean_value = valid_values.mean()
-                    class_means_for_col[cls] = mean_value
-                else:
+        if columns_to_impute:
+            code_to_row = np.array(
+                [self._class_to_row[cls] for cls in decision.cat.categories], dtype=np.intp
+            )
+            class_idx = code_to_row[decision.cat.codes.to_numpy()]
 
-                    global_mean = df_clean[col].mean()
-                    class_means_for_col[cls] = global_mean if not np.isnan(global_mean) else 0.0
+            if NUMBA_AVAILABLE and values.size > NUMBA_MIN_CELLS:
+                _numba_fill_kernel()(values, class_idx, self._means_mat)
+            elif self._means_mat.shape[0] == 2:
+                mean_row0, mean_row1 = self._means_mat
+                fill = np.where((class_idx == 0)[:, None], mean_row0, mean_row1)
+                values = np.where(mask, fill, values)
+            else:
+                values[mask] = self._means_mat[class_idx][mask]
 
-            self.class_means_[col] = class_means_for_col
+            df_clean[columns_to_impute] = values
 
+        missing_after = dict(zip(columns_to_impute, np.isnan(values).sum(axis=0)))
 
-            for cls in classes:
-                mask = (df_clean[decision_column] == cls) & (df_clean[col].isna())
-                num_imputed = mask.sum()
+        if verbose:
+            missing_per_class = pd.DataFrame(
+                mask, index=df_clean.index, columns=columns_to_impute
+            ).groupby(decision, sort=False, observed=True).sum()
 
-                if num_imputed > 0:
-                    mean_val = class_means_for_col[cls]
-                    df_clean.loc[mask, col] = mean_val
+        for col in columns_to_impute:
+            class_means_for_col = class_means[col].to_dict()
+            self.class_means_[col] = class_means_for_col
 
-                    if verbose:
-                        print(f"[{col}] Klasa '{cls}': Uzupelniono {num_imputed} wartosci -> {mean_val:.2f}")
+            if verbose:
+                for cls, num_imputed in missing_per_class[col].items():
+                    if num_imputed > 0:
+                        print(f"[{col}] Klasa '{cls}': Uzupelniono {num_imputed} wartosci -> {class_means_for_col[cls]:.2f}")
 
-            missing_count_after = df_clean[col].isna().sum()
+            missing_count_before = missing_before[col]
+            missing_count_after = missing_after[col]
 
             report['columns_imputed'][col] = {
                 'missing_before': int(missing_count_before),
@@ -197,7 +245,7 @@ class ClassMeanImputer:
 
 
 def load_and_impute_csv(
-    filepath: str,
+    filepath: Union[str, Path, IO[str]],
     decision_column_index: int = -1,
     column_separator: str = ',',
     decimal_separator: str = '.',
@@ -223,17 +271,25 @@ def load_and_impute_csv(
 
 
 
-    filepath_obj = Path(filepath)
+    is_stream = hasattr(filepath, 'read')
 
+    if is_stream:
+        source_name = str(getattr(filepath, 'name', '<strumień>'))
+    else:
+        filepath_obj = Path(filepath)
 
-    if not filepath_obj.exists():
-        raise ImputationError(f"Plik nie istnieje: {filepath}")
 
-    if not filepath_obj.is_file():
-        raise ImputationError(f"Podana ścieżka nie jest plikiem: {filepath}")
+        if not filepath_obj.exists():
+            raise ImputationError(f"Plik nie istnieje: {filepath}")
 
-    try:
+        if not filepath_obj.is_file():
+            raise ImputationError(f"Podana ścieżka nie jest plikiem: {filepath}")
 
+        source_name = str(filepath)
+
+    filename = Path(source_name).name
+
+    try:
         df = pd.read_csv(
             filepath,
             sep=column_separator,
@@ -250,7 +306,7 @@ def load_and_impute_csv(
         raise ImputationError("Plik CSV jest pusty")
 
     if verbose:
-        print(f"[LOAD] Wczytano plik: {filepath_obj.name}")
+        print(f"[LOAD] Wczytano plik: {filename}")
         print(f"[LOAD] Rozmiar: {len(df)} wierszy, {len(df.columns)} kolumn")
 
 
@@ -258,8 +314,8 @@ def load_and_impute_csv(
     df_clean, report = imputer.fit_transform(df, verbose=verbose)
 
 
-    report['filepath'] = str(filepath)
-    report['filename'] = filepath_obj.name
+    report['filepath'] = source_name
+    report['filename'] = filename
     report['columns'] = list(df_clean.columns)
 
     return df_clean, report
@@ -272,30 +328,32 @@ def print_imputation_report(report: Dict) -> None:
 
 
 
-    print("\n" + "="*70)
-    print("RAPORT IMPUTACJI DANYCH")
-    print("="*70)
+    buf = io.StringIO()
+    buf.write("\n" + "="*70 + "\n")
+    buf.write("RAPORT IMPUTACJI DANYCH\n")
+    buf.write("="*70 + "\n")
 
     if 'filename' in report:
-        print(f"Plik: {report['filename']}")
+        buf.write(f"Plik: {report['filename']}\n")
 
-    print(f"Kolumna decyzyjna: '{report['decision_column']}'")
-    print(f"\nWiersze:")
-    print(f"  Początkowe:      {report['rows_original']}")
-    print(f"  Usunięte:        {report['rows_removed_missing_decision']} (brak wartości decyzyjnej)")
-    print(f"  Końcowe:         {report['rows_final']}")
+    buf.write(f"Kolumna decyzyjna: '{report['decision_column']}'\n")
+    buf.write("\nWiersze:\n")
+    buf.write(f"  Początkowe:      {report['rows_original']}\n")
+    buf.write(f"  Usunięte:        {report['rows_removed_missing_decision']} (brak wartości decyzyjnej)\n")
+    buf.write(f"  Końcowe:         {report['rows_final']}\n")
 
     if report['columns_imputed']:
-        print(f"\nImputacja wartości:")
+        buf.write("\nImputacja wartości:\n")
         for col, info in report['columns_imputed'].items():
-            print(f"\n  [{col}]")
-            print(f"    Brakujące przed: {info['missing_before']}")
-            print(f"    Brakujące po:    {info['missing_after']}")
-            print(f"    Uzupełniono:     {info['imputed_count']}")
-            print(f"    Średnie per klasa:")
+            buf.write(f"\n  [{col}]\n")
+            buf.write(f"    Brakujące przed: {info['missing_before']}\n")
+            buf.write(f"    Brakujące po:    {info['missing_after']}\n")
+            buf.write(f"    Uzupełniono:     {info['imputed_count']}\n")
+            buf.write("    Średnie per klasa:\n")
             for cls, mean_val in info['class_means'].items():
-                print(f"      {cls}: {mean_val:.2f}")
+                buf.write(f"      {cls}: {mean_val:.2f}\n")
     else:
-        print("\nBrak wartości do imputacji")
+        buf.write("\nBrak wartości do imputacji\n")
 
-    print("="*70 + "\n")
+    buf.write("="*70 + "\n\n")
+    sys.stdout.write(buf.getvalue())
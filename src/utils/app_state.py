@@ -8,11 +8,15 @@
 
 
 import json
+import logging
 import os
 from typing import Optional, Dict, List
 from datetime import datetime
 
 
+logger = logging.getLogger(__name__)
+
+
 class AppStateManager:
 
 
@@ -59,7 +63,7 @@ class AppStateManager:
             return {**default_state, **loaded_state}
 
         except Exception as e:
-            print(f"[WARNING] Nie można wczytać app_state.json: {e}")
+            logger.warning("[STATE] Nie można wczytać app_state.json: %s", e)
             return default_state
 
     def _save(self):
@@ -68,7 +72,7 @@ class AppStateManager:
             with open(self.state_file, 'w', encoding='utf-8') as f:
                 json.dump(self.state, f, indent=2, ensure_ascii=False)
         except Exception as e:
-            print(f"[ERROR] Nie można zapisać app_state.json: {e}")
+            logger.error("[STATE] Nie można zapisać app_state.json: %s", e)
 
 
 
@@ -100,14 +104,14 @@ class AppStateManager:
             'user_id': user_id
         }
         self._save()
-        print(f"[STATE] Zapisano logowanie: {username} (keep_logged_in={keep_logged_in})")
+        logger.debug("[STATE] Zapisano logowanie: %s (keep_logged_in=%s)", username, keep_logged_in)
 
     def clear_login(self):
 
         self.state['keep_logged_in'] = False
         self.state['last_user'] = None
         self._save()
-        print("[STATE] Wyczyszczono stan logowania")
+        logger.debug("[STATE] Wyczyszczono stan logowania")
 
 
 
@@ -153,7 +157,7 @@ class AppStateManager:
         self.state['recent_files'] = self.state['recent_files'][:5]
 
         self._save()
-        print(f"[STATE] Dodano do historii: {file_name}")
+        logger.debug("[STATE] Dodano do historii: %s", file_name)
 
     def remove_recent_file(self, file_path: str):
 
@@ -162,12 +166,12 @@ class AppStateManager:
 
 
 
-        self.state['recent_files'] = [
-            f for f in self.state['recent_files']
-            if f['path'] != file_path
-        ]
-        self._save()
-        print(f"[STATE] Usunięto z historii: {file_path}")
+        for i, f in enumerate(self.state['recent_files']):
+            if f['path'] == file_path:
+                del self.state['recent_files'][i]
+                self._save()
+                logger.debug("[STATE] Usunięto z historii: %s", file_path)
+                return
 
     def validate_recent_files(self) -> List[str]:
 
@@ -185,7 +189,7 @@ class AppStateManager:
                 valid_files.append(file_data)
             else:
                 removed.append(file_data['path'])
-                print(f"[STATE] Plik nie istnieje (usunięto z historii): {file_data['path']}")
+                logger.debug("[STATE] Plik nie istnieje (usunięto z historii): %s", file_data['path'])
 
 
         self.state['recent_files'] = valid_files
@@ -0,0 +1,25 @@
+import numpy as np  # noqa: F401
+import pandas as pd  # noqa: F401
+import pytest
+
+from preprocessing.dataset_preparer import DatasetPreparer
+from preprocessing.dataset_validator import DatasetReadinessValidator
+from preprocessing.rule_generator import RuleGenerator
+
+
+@pytest.fixture(scope="session")
+def preparer():
+
+    return DatasetPreparer()
+
+
+@pytest.fixture(scope="session")
+def validator():
+
+    return DatasetReadinessValidator()
+
+
+@pytest.fixture
+def rule_generator():
+
+    return RuleGenerator()
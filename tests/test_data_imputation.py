@@ -19,6 +19,7 @@
 
 
 
+import io
 import pytest
 import pandas as pd
 import numpy as np
@@ -41,7 +42,7 @@ from data_imputation import (
 
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_complete():
 
     return pd.DataFrame({
@@ -52,7 +53,7 @@ def sample_data_complete():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_with_missing():
 
     return pd.DataFrame({
@@ -63,7 +64,7 @@ def sample_data_with_missing():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_missing_decision():
 
     return pd.DataFrame({
@@ -74,7 +75,7 @@ def sample_data_missing_decision():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_with_text():
 
     return pd.DataFrame({
@@ -85,10 +86,7 @@ def sample_data_with_text():
     })
 
 
-@pytest.fixture
-def temp_csv_file():
-
-    content = """waga,wzrost,wiek,diagnoza
+CSV_CONTENT = """waga,wzrost,wiek,diagnoza
 70.5,180,25,zdrowy
 85.2,175,30,nadwaga
 ,165,22,zdrowy
@@ -96,8 +94,18 @@ def temp_csv_file():
 58.3,160,NaN,zdrowy
 102.0,185,40,nadwaga"""
 
+
+@pytest.fixture
+def csv_stream():
+
+    return io.StringIO(CSV_CONTENT)
+
+
+@pytest.fixture
+def temp_csv_file():
+
     with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-        f.write(content)
+        f.write(CSV_CONTENT)
         temp_path = f.name
 
     yield temp_path
@@ -306,7 +314,25 @@ def test_imputer_no_numeric_columns():
 
 
 
-def test_load_and_impute_csv_success(temp_csv_file):
+def test_load_and_impute_csv_success(csv_stream):
+
+    df_clean, report = load_and_impute_csv(
+        csv_stream,
+        decision_column_index=-1,
+        verbose=False
+    )
+
+    assert report['decision_column'] == 'diagnoza'
+    assert report['rows_final'] > 0
+    assert len(df_clean) == report['rows_final']
+
+
+    assert df_clean['waga'].isna().sum() == 0
+    assert df_clean['wzrost'].isna().sum() == 0
+    assert df_clean['wiek'].isna().sum() == 0
+
+
+def test_load_and_impute_csv_from_disk(temp_csv_file):
 
     df_clean, report = load_and_impute_csv(
         temp_csv_file,
@@ -325,6 +351,30 @@ def test_load_and_impute_csv_success(temp_csv_file):
     assert df_clean['wiek'].isna().sum() == 0
 
 
+def test_load_and_impute_csv_space_padded_fields(tmp_path):
+
+    csv_path = tmp_path / "dane.csv"
+    csv_path.write_text(
+        "waga, wzrost, diagnoza\n"
+        "70.5, 180, zdrowy\n"
+        "85.2, NA, nadwaga\n"
+        "62.0, 165, NA\n"
+        "95.5, 180, \n"
+        "58.3, 160, zdrowy\n"
+        "102.0, 185, nadwaga",
+        encoding='utf-8'
+    )
+
+    df_clean, report = load_and_impute_csv(str(csv_path), verbose=False)
+
+    assert list(df_clean.columns) == ['waga', 'wzrost', 'diagnoza']
+    assert report['rows_removed_missing_decision'] == 2
+    assert set(df_clean['diagnoza']) == {'zdrowy', 'nadwaga'}
+    assert df_clean['waga'].dtype == np.float64
+    assert df_clean['wzrost'].dtype == np.float64
+    assert df_clean['wzrost'].isna().sum() == 0
+
+
 def test_load_and_impute_csv_file_not_found():
 
     with pytest.raises(ImputationError, match="Plik nie istnieje"):
@@ -479,5 +529,32 @@ def test_imputation_preserves_data_integrity():
     assert not np.isnan(df_clean.loc[1, 'waga'])
 
 
+def test_imputation_does_not_modify_input(sample_data_with_text):
+
+    df_original = sample_data_with_text.copy()
+
+    imputer = ClassMeanImputer(decision_column_index=-1)
+    imputer.fit_transform(sample_data_with_text, verbose=False)
+
+    pd.testing.assert_frame_equal(sample_data_with_text, df_original)
+
+
+
+def test_imputation_large_frame_matches_class_means():
+
+    rng = np.random.default_rng(0)
+    n_rows = 6000
+    values = rng.normal(size=(n_rows, 3))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    df = pd.DataFrame(values, columns=['a', 'b', 'c'])
+    df['klasa'] = rng.choice(['x', 'y', 'z'], size=n_rows)
+
+    imputer = ClassMeanImputer(decision_column_index=-1)
+    df_clean, _ = imputer.fit_transform(df, verbose=False)
+
+    expected = df.fillna(df.groupby('klasa')[['a', 'b', 'c']].transform('mean'))
+    pd.testing.assert_frame_equal(df_clean, expected)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
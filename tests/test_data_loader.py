@@ -15,10 +15,11 @@
 
 
 
+import io
+
 import pytest
 import pandas as pd
 from pathlib import Path
-import tempfile
 import os
 import sys
 
@@ -35,10 +36,15 @@ from preprocessing.validators import (
 
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
+
+    return tmp_path
+
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+@pytest.fixture(scope="class")
+def loader():
+
+    return DataLoader()
 
 
 @pytest.fixture
@@ -77,28 +83,25 @@ class TestFilePathValidation:
         result = validate_file_path(path)
         
         assert result.is_valid == False
-        assert any(e.code == "F01" for e in result.errors)
+        assert "F01" in result.error_codes
     
     def test_f02_path_is_directory(self, temp_dir):
 
         result = validate_file_path(temp_dir)
         
         assert result.is_valid == False
-        assert any(e.code == "F02" for e in result.errors)
+        assert "F02" in result.error_codes
     
-    @pytest.mark.skipif(sys.platform == "win32", reason="os.chmod nie odbiera uprawnień odczytu na Windows")
-    def test_f03_no_read_permission(self, temp_dir):
+    def test_f03_no_read_permission(self, temp_dir, monkeypatch):
 
         path = temp_dir / "no_permission.csv"
         path.write_text("a,b\n1,2\n")
-        os.chmod(path, 0o000)
+        monkeypatch.setattr(os, "access", lambda p, mode=os.R_OK: False)
         
-        try:
-            result = validate_file_path(path)
-            assert result.is_valid == False
-            assert any(e.code == "F03" for e in result.errors)
-        finally:
-            os.chmod(path, 0o644)
+        result = validate_file_path(path)
+        
+        assert result.is_valid == False
+        assert "F03" in result.error_codes
     
     def test_f04_no_extension(self, temp_dir):
 
@@ -108,7 +111,7 @@ class TestFilePathValidation:
         result = validate_file_path(path)
         
         assert result.is_valid == False
-        assert any(e.code == "F04" for e in result.errors)
+        assert "F04" in result.error_codes
     
     def test_f05_invalid_extension(self, temp_dir):
 
@@ -118,7 +121,7 @@ class TestFilePathValidation:
         result = validate_file_path(path)
         
         assert result.is_valid == False
-        assert any(e.code == "F05" for e in result.errors)
+        assert "F05" in result.error_codes
     
     def test_f05_valid_extensions(self, temp_dir):
 
@@ -128,7 +131,7 @@ class TestFilePathValidation:
             
             result = validate_file_path(path)
             
-            assert not any(e.code == "F05" for e in result.errors)
+            assert not "F05" in result.error_codes
     
     def test_f06_normalize_extension_case(self, temp_dir):
 
@@ -139,7 +142,7 @@ class TestFilePathValidation:
             result = validate_file_path(path)
             
 
-            assert not any(e.code == "F05" for e in result.errors)
+            assert not "F05" in result.error_codes
     
     def test_f07_empty_file(self, temp_dir):
 
@@ -149,7 +152,7 @@ class TestFilePathValidation:
         result = validate_file_path(path)
         
         assert result.is_valid == False
-        assert any(e.code == "F07" for e in result.errors)
+        assert "F07" in result.error_codes
     
     def test_valid_file_path(self, valid_csv):
 
@@ -157,6 +160,13 @@ class TestFilePathValidation:
         
         assert result.is_valid == True
         assert len(result.errors) == 0
+    
+    def test_valid_file_path_as_string(self, valid_csv):
+
+        result = validate_file_path(str(valid_csv))
+        
+        assert result.is_valid == True
+        assert len(result.errors) == 0
 
 
 
@@ -173,7 +183,7 @@ class TestFileContentValidation:
         result = validate_file_content(path)
         
         assert result.is_valid == False
-        assert any(e.code == "C01" for e in result.errors)
+        assert "C01" in result.error_codes
     
     def test_c02_invalid_encoding(self, temp_dir):
 
@@ -184,7 +194,7 @@ class TestFileContentValidation:
         result = validate_file_content(path, encoding="utf-8")
         
         assert result.is_valid == False
-        assert any(e.code == "C02" for e in result.errors)
+        assert "C02" in result.error_codes
     
     def test_c03_single_column(self, temp_dir):
 
@@ -194,7 +204,7 @@ class TestFileContentValidation:
         result = validate_file_content(path, separator=",")
         
         assert result.is_valid == False
-        assert any(e.code == "C03" for e in result.errors)
+        assert "C03" in result.error_codes
     
     def test_c04_no_data_rows(self, temp_dir):
 
@@ -204,7 +214,7 @@ class TestFileContentValidation:
         result = validate_file_content(path, separator=",", has_header=True)
         
         assert result.is_valid == False
-        assert any(e.code == "C04" for e in result.errors)
+        assert "C04" in result.error_codes
     
     def test_valid_content(self, valid_csv):
 
@@ -226,7 +236,7 @@ class TestHeaderValidation:
         result = validate_file_content(path, separator=",", has_header=True)
         
         assert result.is_valid == False
-        assert any(e.code == "H02" for e in result.errors)
+        assert "H02" in result.error_codes
     
     def test_h03_empty_header(self, temp_dir):
 
@@ -236,7 +246,7 @@ class TestHeaderValidation:
         result = validate_file_content(path, separator=",", has_header=True)
         
         assert result.is_valid == False
-        assert any(e.code == "H03" for e in result.errors)
+        assert "H03" in result.error_codes
 
 
 
@@ -252,7 +262,7 @@ class TestDataConsistencyValidation:
         result = validate_file_content(path, separator=",", has_header=True)
         
         assert result.is_valid == False
-        assert any(e.code == "D01" for e in result.errors)
+        assert "D01" in result.error_codes
 
 
 
@@ -304,6 +314,24 @@ class TestAutoDetection:
         
         assert config.decimal == ","
         assert config.separator == ";"
+    
+    def test_detect_returns_independent_configs(self, valid_csv):
+
+        config1 = detect_csv_config(valid_csv)
+        config1.separator = ";"
+        
+        config2 = detect_csv_config(valid_csv)
+        
+        assert config2.separator == ","
+    
+    def test_detect_reflects_file_changes(self, temp_dir):
+
+        path = temp_dir / "changing.csv"
+        path.write_text("name,age\nAlice,30\n")
+        assert detect_csv_config(path).separator == ","
+        
+        path.write_text("name;age;city\nAlice;30;Warsaw\n")
+        assert detect_csv_config(path).separator == ";"
 
 
 
@@ -312,62 +340,93 @@ class TestDataLoader:
 
 
     
-    def test_load_valid_csv(self, valid_csv):
+    def test_load_valid_csv(self, loader, valid_csv):
 
-        loader = DataLoader()
         df = loader.load(valid_csv)
         
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 2
         assert list(df.columns) == ["name", "age", "city"]
     
-    def test_load_with_custom_config(self, valid_csv_semicolon):
+    def test_load_with_custom_config(self, loader, valid_csv_semicolon):
 
-        loader = DataLoader()
         config = CSVConfig(separator=";")
         df = loader.load(valid_csv_semicolon, config=config)
         
         assert len(df.columns) == 3
     
-    def test_load_with_autodetect(self, valid_csv_semicolon):
+    def test_load_with_autodetect(self, loader, valid_csv_semicolon):
 
-        loader = DataLoader()
         df = loader.load(valid_csv_semicolon, autodetect=True)
         
         assert len(df.columns) == 3
     
-    def test_load_nonexistent_raises_error(self, temp_dir):
+    def test_load_nonexistent_raises_error(self, loader, temp_dir):
 
-        loader = DataLoader()
-        
         with pytest.raises(FileNotFoundError):
             loader.load(temp_dir / "nonexistent.csv")
     
-    def test_load_invalid_content_raises_error(self, temp_dir):
+    def test_load_invalid_content_raises_error(self, loader, temp_dir):
 
         path = temp_dir / "single_col.csv"
         path.write_text("value\n1\n2\n")
         
-        loader = DataLoader()
-        
         with pytest.raises(ValueError):
             loader.load(path)
     
-    def test_validate_returns_validation_result(self, valid_csv):
+    def test_load_skips_excluded_columns(self, loader, valid_csv):
+
+        df = loader.load(valid_csv, config=CSVConfig(exclude_columns=["age"]))
+
+        assert list(df.columns) == ["name", "city"]
+
+    def test_load_with_autodetect_keeps_excluded_columns(self, loader, valid_csv_semicolon):
+
+        df = loader.load(valid_csv_semicolon, config=CSVConfig(exclude_columns=["age"]), autodetect=True)
+
+        assert list(df.columns) == ["name", "city"]
+
+    def test_load_from_buffer(self, loader):
+
+        buffer = io.StringIO("name;age;city\nAlice;30;Warsaw\nBob;25;Krakow\n")
+        df = loader.load(buffer, autodetect=True)
+
+        assert list(df.columns) == ["name", "age", "city"]
+        assert len(df) == 2
+
+    def test_load_invalid_buffer_raises_error(self, loader):
+
+        with pytest.raises(ValueError, match="C03"):
+            loader.load(io.StringIO("value\n1\n2\n"))
+
+    def test_validate_buffer_rewinds(self, loader):
+
+        buffer = io.StringIO("name,age\nAlice,30\n")
+        result = loader.validate(buffer)
+
+        assert result.is_valid
+        assert buffer.tell() == 0
+
+    def test_validate_returns_validation_result(self, loader, valid_csv):
 
-        loader = DataLoader()
         result = loader.validate(valid_csv)
         
         assert isinstance(result, ValidationResult)
         assert result.is_valid == True
     
-    def test_validate_invalid_file(self, temp_dir):
+    def test_validate_invalid_file(self, loader, temp_dir):
 
         path = temp_dir / "empty.csv"
         path.write_text("")
         
-        loader = DataLoader()
         result = loader.validate(path)
         
         assert result.is_valid == False
-        assert len(result.errors) > 0
\ No newline at end of file
+        assert len(result.errors) > 0
+    
+    def test_loader_keeps_no_state_between_calls(self, loader, valid_csv):
+
+        loader.load(valid_csv)
+        loader.validate(valid_csv)
+        
+        assert vars(loader) == {}
@@ -18,38 +18,92 @@ import numpy as np
 from preprocessing.dataset_preparer import PreparedDataset, DatasetPreparer
 
 
+def rep(seq, n, dtype=object):
+    return np.tile(np.asarray(seq, dtype=dtype), n)
+
+
+_TINY_DF = pd.DataFrame({'col1': [1, 2, 3]})
+
+
+@pytest.fixture(scope="module")
+def mini_df_with_qmark():
+
+    return pd.DataFrame({
+        'col1': ['1', '2', '?', '4'],
+        'class': ['A', 'B', 'A', 'B']
+    })
+
+
+@pytest.fixture(scope="module")
+def prepared_qmark(mini_df_with_qmark):
+
+    return DatasetPreparer().prepare(mini_df_with_qmark, 'class')
+
+
+@pytest.fixture(scope="module")
+def prepared_numeric_str():
+
+    df = pd.DataFrame({
+        'col1': ['1', '2', '3', '4', '5'],
+        'class': ['A', 'B', 'A', 'B', 'A']
+    })
+    return DatasetPreparer().prepare(df, 'class')
+
+
+@pytest.fixture(scope="module")
+def padded_str_df():
+
+    return pd.DataFrame({
+        'col1': ['  a  ', ' b', 'c '],
+        'class': ['A', 'B', 'A']
+    })
+
+
+@pytest.fixture(scope="module")
+def heart_like_df():
+
+    return pd.DataFrame({
+        'ca': rep(['0.0', '1.0', '2.0', '?', '3.0'], 20),
+        'thal': rep(['3.0', '7.0', '6.0', '?', '3.0'], 20),
+        'age': rep([50, 60, 55, 45, 70], 20, np.int64),
+        'class': rep(['0', '1', '0', '1', '0'], 20)
+    })
+
+
+@pytest.fixture(scope="module")
+def balanced_num_df():
+
+    return pd.DataFrame({
+        'num1': rep([1, 2, 3, 4, 5], 20, np.int64),
+        'num2': rep([6, 7, 8, 9, 10], 20, np.int64),
+        'class': pd.Categorical(rep(['A', 'B', 'A', 'B', 'A'], 20))
+    })
+
+
 class TestPreparedDataset:
 
 
 
     def test_create_prepared_dataset(self):
 
-        df = pd.DataFrame({'col1': [1, 2, 3]})
-        result = PreparedDataset(df=df, changes_log=["Change 1", "Change 2"])
+        result = PreparedDataset(df=_TINY_DF, changes_log=["Change 1", "Change 2"])
 
         assert len(result.df) == 3
         assert len(result.changes_log) == 2
 
     def test_empty_changes_log(self):
 
-        df = pd.DataFrame({'col1': [1, 2, 3]})
-        result = PreparedDataset(df=df)
+        result = PreparedDataset(df=_TINY_DF)
 
         assert len(result.changes_log) == 0
 
-    def test_print_summary_does_not_crash(self):
+    def test_print_summary_does_not_crash(self, capsys):
 
-        df = pd.DataFrame({'col1': [1, 2, 3]})
-        result = PreparedDataset(df=df, changes_log=["Converted 'col1' to numeric"])
+        result = PreparedDataset(df=_TINY_DF, changes_log=["Converted 'col1' to numeric"])
 
-        import io
-        import sys
-        captured = io.StringIO()
-        sys.stdout = captured
         result.print_summary()
-        sys.stdout = sys.__stdout__
 
-        output = captured.getvalue()
+        output = capsys.readouterr().out
         assert "DATASET PREPARATION SUMMARY" in output
 
 
@@ -57,19 +111,19 @@ class TestReplaceMissingMarkers:
 
 
 
-    def test_replaces_question_mark(self):
-
-        df = pd.DataFrame({
-            'col1': ['1', '2', '?', '4'],
-            'class': ['A', 'B', 'A', 'B']
-        })
-
-        preparer = DatasetPreparer()
-        result = preparer.prepare(df, 'class')
-
+    @pytest.mark.parametrize("check", [
+        pytest.param(
+            lambda r: int(np.count_nonzero(r.df['col1'].isna().to_numpy())) == 1,
+            id="marker_becomes_nan"
+        ),
+        pytest.param(
+            lambda r: sum(1 for c in r.changes_log if "missing markers" in c.lower()) == 1,
+            id="single_log_entry"
+        ),
+    ])
+    def test_replaces_question_mark(self, prepared_qmark, check):
 
-        assert result.df['col1'].isnull().sum() == 1
-        assert len([c for c in result.changes_log if "missing markers" in c.lower()]) == 1
+        assert check(prepared_qmark)
 
     def test_replaces_multiple_markers(self):
 
@@ -83,7 +137,7 @@ class TestReplaceMissingMarkers:
         result = preparer.prepare(df, 'class')
 
 
-        assert result.df['col1'].isnull().sum() == 4
+        assert int(np.count_nonzero(result.df['col1'].isna().to_numpy())) == 4
 
         assert pd.api.types.is_numeric_dtype(result.df['col1'])
 
@@ -97,20 +151,19 @@ class TestReplaceMissingMarkers:
         preparer = DatasetPreparer(missing_markers={'MISSING', 'UNKNOWN'})
         result = preparer.prepare(df, 'class')
 
-        assert result.df['col1'].isnull().sum() == 2
+        assert int(np.count_nonzero(result.df['col1'].isna().to_numpy())) == 2
 
-    def test_no_missing_markers(self):
+    def test_no_missing_markers(self, preparer):
 
         df = pd.DataFrame({
             'col1': ['1', '2', '3'],
             'class': ['A', 'B', 'A']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
-        assert result.df['col1'].isnull().sum() == 0
+        assert int(np.count_nonzero(result.df['col1'].isna().to_numpy())) == 0
         assert not any("missing markers" in c.lower() for c in result.changes_log)
 
 
@@ -118,41 +171,29 @@ class TestStripWhitespace:
 
 
 
-    def test_strips_leading_trailing_whitespace(self):
-
-        df = pd.DataFrame({
-            'col1': ['  a  ', ' b', 'c '],
-            'class': ['A', 'B', 'A']
-        })
+    def test_strips_leading_trailing_whitespace(self, preparer, padded_str_df):
 
-        preparer = DatasetPreparer()
-        result = preparer.prepare(df, 'class')
+        result = preparer.prepare(padded_str_df, 'class')
 
         assert result.df['col1'].tolist() == ['a', 'b', 'c']
         assert any("stripped" in c.lower() for c in result.changes_log)
 
-    def test_no_changes_when_no_whitespace(self):
+    def test_no_changes_when_no_whitespace(self, preparer):
 
         df = pd.DataFrame({
             'col1': ['a', 'b', 'c'],
             'class': ['A', 'B', 'A']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
         assert not any("stripped" in c.lower() for c in result.changes_log)
 
-    def test_can_disable_strip_whitespace(self):
-
-        df = pd.DataFrame({
-            'col1': ['  a  ', ' b', 'c '],
-            'class': ['A', 'B', 'A']
-        })
+    def test_can_disable_strip_whitespace(self, padded_str_df):
 
         preparer = DatasetPreparer(strip_whitespace=False)
-        result = preparer.prepare(df, 'class')
+        result = preparer.prepare(padded_str_df, 'class')
 
 
         assert result.df['col1'].iloc[0] == '  a  '
@@ -164,72 +205,41 @@ class TestConvertNumericAsString:
 
 
 
-    def test_converts_numeric_string_to_numeric(self):
+    @pytest.mark.parametrize("values,threshold,is_numeric,nulls", [
+        pytest.param(['1', '2', '3', '4', '5'], None, True, 0, id="numeric_strings"),
+        pytest.param(['1.0', '2.0', '?', '4.0', '5.0'], None, True, 1, id="with_missing_markers"),
+        pytest.param(['1', '2', 'a', 'b', 'c'], 0.8, False, 0, id="below_threshold"),
+        pytest.param(['1', '2', '3', 'a', 'b'], 0.5, True, 2, id="lower_threshold"),
+    ])
+    def test_numeric_conversion(self, preparer, values, threshold, is_numeric, nulls):
 
         df = pd.DataFrame({
-            'col1': ['1', '2', '3', '4', '5'],
+            'col1': values,
             'class': ['A', 'B', 'A', 'B', 'A']
         })
 
-        preparer = DatasetPreparer()
+        if threshold is not None:
+            preparer = DatasetPreparer(numeric_threshold=threshold)
         result = preparer.prepare(df, 'class')
 
 
-        assert pd.api.types.is_numeric_dtype(result.df['col1'])
-        assert any("converted" in c.lower() and "numeric" in c.lower() for c in result.changes_log)
+        assert pd.api.types.is_numeric_dtype(result.df['col1']) == is_numeric
+        assert int(np.count_nonzero(result.df['col1'].isna().to_numpy())) == nulls
 
-    def test_converts_with_missing_markers(self):
-
-        df = pd.DataFrame({
-            'col1': ['1.0', '2.0', '?', '4.0', '5.0'],
-            'class': ['A', 'B', 'A', 'B', 'A']
-        })
-
-        preparer = DatasetPreparer()
-        result = preparer.prepare(df, 'class')
-
-
-        assert pd.api.types.is_numeric_dtype(result.df['col1'])
-        assert result.df['col1'].isnull().sum() == 1
-
-    def test_respects_numeric_threshold(self):
-
-        df = pd.DataFrame({
-
-            'col1': ['1', '2', 'a', 'b', 'c'],
-            'class': ['A', 'B', 'A', 'B', 'A']
-        })
-
-        preparer = DatasetPreparer(numeric_threshold=0.8)
-        result = preparer.prepare(df, 'class')
+    def test_logs_numeric_conversion(self, prepared_numeric_str):
 
+        assert any(
+            "converted" in c.lower() and "numeric" in c.lower()
+            for c in prepared_numeric_str.changes_log
+        )
 
-        assert result.df['col1'].dtype == 'object'
-
-    def test_converts_with_lower_threshold(self):
-
-        df = pd.DataFrame({
-
-            'col1': ['1', '2', '3', 'a', 'b'],
-            'class': ['A', 'B', 'A', 'B', 'A']
-        })
-
-        preparer = DatasetPreparer(numeric_threshold=0.5)
-        result = preparer.prepare(df, 'class')
-
-
-        assert pd.api.types.is_numeric_dtype(result.df['col1'])
-
-        assert result.df['col1'].isnull().sum() == 2
-
-    def test_does_not_convert_true_categorical(self):
+    def test_does_not_convert_true_categorical(self, preparer):
 
         df = pd.DataFrame({
             'col1': ['red', 'blue', 'green', 'yellow', 'red'],
             'class': ['A', 'B', 'A', 'B', 'A']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
@@ -241,7 +251,7 @@ class TestRemoveConstantColumns:
 
 
 
-    def test_removes_constant_column(self):
+    def test_removes_constant_column(self, preparer):
 
         df = pd.DataFrame({
             'const1': [5, 5, 5, 5],
@@ -249,7 +259,6 @@ class TestRemoveConstantColumns:
             'class': ['A', 'B', 'A', 'B']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
@@ -257,7 +266,7 @@ class TestRemoveConstantColumns:
         assert 'var1' in result.df.columns
         assert any("removed" in c.lower() and "constant" in c.lower() for c in result.changes_log)
 
-    def test_removes_multiple_constant_columns(self):
+    def test_removes_multiple_constant_columns(self, preparer):
 
         df = pd.DataFrame({
             'const1': [5, 5, 5],
@@ -266,7 +275,6 @@ class TestRemoveConstantColumns:
             'class': ['A', 'B', 'A']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
@@ -274,14 +282,13 @@ class TestRemoveConstantColumns:
         assert 'const2' not in result.df.columns
         assert 'var1' in result.df.columns
 
-    def test_does_not_remove_decision_column_even_if_constant(self):
+    def test_does_not_remove_decision_column_even_if_constant(self, preparer):
 
         df = pd.DataFrame({
             'var1': [1, 2, 3],
             'class': ['A', 'A', 'A']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
@@ -306,7 +313,7 @@ class TestIntegration:
 
 
 
-    def test_full_prepare_all_fixes(self):
+    def test_full_prepare_all_fixes(self, preparer):
 
         df = pd.DataFrame({
             'col1': ['  1  ', ' 2 ', '?'],
@@ -315,12 +322,11 @@ class TestIntegration:
             'class': ['A', 'B', 'A']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
         assert pd.api.types.is_numeric_dtype(result.df['col1'])
-        assert result.df['col1'].isnull().sum() == 1
+        assert int(np.count_nonzero(result.df['col1'].isna().to_numpy())) == 1
 
 
         assert 'col2' not in result.df.columns
@@ -331,51 +337,38 @@ class TestIntegration:
 
         assert len(result.changes_log) >= 3
 
-    def test_heart_disease_like_dataset(self):
+    @pytest.mark.slow
+    def test_heart_disease_like_dataset(self, preparer, heart_like_df):
 
-        df = pd.DataFrame({
-            'ca': ['0.0', '1.0', '2.0', '?', '3.0'] * 20,
-            'thal': ['3.0', '7.0', '6.0', '?', '3.0'] * 20,
-            'age': [50, 60, 55, 45, 70] * 20,
-            'class': ['0', '1', '0', '1', '0'] * 20
-        })
-
-        preparer = DatasetPreparer()
-        result = preparer.prepare(df, 'class')
+        result = preparer.prepare(heart_like_df, 'class')
 
 
         assert pd.api.types.is_numeric_dtype(result.df['ca'])
         assert pd.api.types.is_numeric_dtype(result.df['thal'])
 
 
-        assert result.df['ca'].isnull().sum() == 20
-        assert result.df['thal'].isnull().sum() == 20
+        assert int(np.count_nonzero(result.df['ca'].isna().to_numpy())) == 20
+        assert int(np.count_nonzero(result.df['thal'].isna().to_numpy())) == 20
 
 
         assert pd.api.types.is_numeric_dtype(result.df['age'])
 
-    def test_prepare_empty_changes_when_already_clean(self):
+    @pytest.mark.slow
+    def test_prepare_empty_changes_when_already_clean(self, preparer, balanced_num_df):
 
-        df = pd.DataFrame({
-            'num1': [1, 2, 3, 4, 5] * 20,
-            'num2': [6, 7, 8, 9, 10] * 20,
-            'class': ['A', 'B', 'A', 'B', 'A'] * 20
-        })
-
-        preparer = DatasetPreparer()
-        result = preparer.prepare(df, 'class')
+        result = preparer.prepare(balanced_num_df, 'class')
 
 
         assert len(result.changes_log) == 0
 
-    def test_prepare_with_validation(self):
+    @pytest.mark.slow
+    def test_prepare_with_validation(self, preparer):
 
         df = pd.DataFrame({
-            'col1': ['1', '2', '?', '4', '5'] * 20,
-            'class': ['A', 'B', 'A', 'B', 'A'] * 20
+            'col1': rep(['1', '2', '?', '4', '5'], 20),
+            'class': rep(['A', 'B', 'A', 'B', 'A'], 20)
         })
 
-        preparer = DatasetPreparer()
         prepared, report = preparer.prepare_with_validation(df, 'class')
 
 
@@ -386,19 +379,18 @@ class TestIntegration:
 
         assert pd.api.types.is_numeric_dtype(prepared.df['col1'])
 
-    def test_raises_error_when_decision_column_not_found(self):
+    def test_raises_error_when_decision_column_not_found(self, preparer):
 
         df = pd.DataFrame({
             'col1': [1, 2, 3],
             'col2': [4, 5, 6]
         })
 
-        preparer = DatasetPreparer()
 
         with pytest.raises(ValueError, match="Decision column 'nonexistent' not found"):
             preparer.prepare(df, 'nonexistent')
 
-    def test_preserves_original_dataframe(self):
+    def test_preserves_original_dataframe(self, preparer):
 
         original_df = pd.DataFrame({
             'col1': ['1', '2', '?'],
@@ -406,13 +398,14 @@ class TestIntegration:
         })
 
 
-        original_copy = original_df.copy()
+        hash_before = int(pd.util.hash_pandas_object(original_df, index=True).sum())
+        dtypes_before = original_df.dtypes.tolist()
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(original_df, 'class')
 
 
-        pd.testing.assert_frame_equal(original_df, original_copy)
+        assert int(pd.util.hash_pandas_object(original_df, index=True).sum()) == hash_before
+        assert original_df.dtypes.tolist() == dtypes_before
 
 
         assert not original_df.equals(result.df)
@@ -422,7 +415,7 @@ class TestEdgeCases:
 
 
 
-    def test_all_nan_column(self):
+    def test_all_nan_column(self, preparer):
 
         df = pd.DataFrame({
             'col1': [np.nan, np.nan, np.nan],
@@ -430,27 +423,25 @@ class TestEdgeCases:
             'class': ['A', 'B', 'A']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
         assert 'col1' not in result.df.columns
         assert any("removed" in c.lower() and "constant" in c.lower() for c in result.changes_log)
 
-    def test_single_row_dataset(self):
+    def test_single_row_dataset(self, preparer):
 
         df = pd.DataFrame({
             'col1': ['1'],
             'class': ['A']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
         assert len(result.df) == 1
 
-    def test_numeric_column_unchanged(self):
+    def test_numeric_column_unchanged(self, preparer):
 
         df = pd.DataFrame({
             'col1': [1, 2, 3],
@@ -458,7 +449,6 @@ class TestEdgeCases:
             'class': ['A', 'B', 'A']
         })
 
-        preparer = DatasetPreparer()
         result = preparer.prepare(df, 'class')
 
 
@@ -27,47 +27,71 @@ from preprocessing.dataset_validator import (
 )
 
 
-class TestReadinessIssue:
-
+def rep(seq, n, dtype=object):
+    return np.tile(np.asarray(seq, dtype=dtype), n)
 
 
-    def test_create_critical_issue(self):
+@pytest.fixture(scope="session")
+def reports(validator):
 
-        issue = ReadinessIssue(
-            level="CRITICAL",
-            code="CAT_DOM",
-            message="Too many categorical columns",
-            impact="Expected 0% accuracy",
-            recommendation="Convert to numeric"
-        )
+    frames = {
+        'missing_decision': pd.DataFrame({
+            'num1': [1, 2, 3, 4],
+            'class': ['A', 'B', None, 'A']
+        }),
+        'missing_features': pd.DataFrame({
+            'num1': [1, np.nan, 3, 4],
+            'num2': [5, 6, np.nan, 8],
+            'class': ['A', 'B', 'A', 'B']
+        }),
+        'clean': pd.DataFrame({
+            'num1': [1, 2, 3, 4],
+            'num2': [5, 6, 7, 8],
+            'class': ['A', 'B', 'A', 'B']
+        }),
+        'constant_column': pd.DataFrame({
+            'const1': [5, 5, 5, 5],
+            'num1': [1, 2, 3, 4],
+            'class': ['A', 'B', 'A', 'B']
+        }),
+        'one_class': pd.DataFrame({
+            'num1': [1, 2, 3, 4],
+            'class': ['A', 'A', 'A', 'A']
+        }),
+        'imbalanced': pd.DataFrame({
+            'num1': np.arange(100, dtype=np.int64),
+            'class': np.repeat(np.array(['A', 'B'], dtype=object), [95, 5])
+        }),
+        'balanced': pd.DataFrame({
+            'num1': np.arange(100, dtype=np.int64),
+            'class': pd.Categorical(rep(['A', 'B'], 50))
+        }),
+    }
+    return {key: validator.validate(df, 'class') for key, df in frames.items()}
 
-        assert issue.level == "CRITICAL"
-        assert issue.code == "CAT_DOM"
-        assert "categorical" in issue.message.lower()
 
-    def test_create_warning_issue(self):
+class TestReadinessIssue:
 
-        issue = ReadinessIssue(
-            level="WARNING",
-            code="NUM_STR",
-            message="Numeric as strings",
-            impact="Won't be discretized",
-            recommendation="Convert to numeric"
-        )
 
-        assert issue.level == "WARNING"
 
-    def test_create_info_issue(self):
+    @pytest.mark.parametrize("level,code,message", [
+        ("CRITICAL", "CAT_DOM", "Too many categorical columns"),
+        ("WARNING", "NUM_STR", "Numeric as strings"),
+        ("INFO", "MISS_INFO", "Missing values detected"),
+    ])
+    def test_create_issue(self, level, code, message):
 
         issue = ReadinessIssue(
-            level="INFO",
-            code="MISS_INFO",
-            message="Missing values detected",
-            impact="Will be imputed",
-            recommendation="Automatic"
+            level=level,
+            code=code,
+            message=message,
+            impact="Expected impact",
+            recommendation="Convert to numeric"
         )
 
-        assert issue.level == "INFO"
+        assert issue.level == level
+        assert issue.code == code
+        assert issue.message == message
 
 
 class TestReadinessReport:
@@ -83,7 +107,12 @@ class TestReadinessReport:
         assert len(report.passed_checks) == 0
         assert report.verdict == "RECOMMENDED"
 
-    def test_get_critical_issues(self):
+    @pytest.mark.parametrize("getter,level,expected_count", [
+        ("get_critical_issues", "CRITICAL", 2),
+        ("get_warning_issues", "WARNING", 2),
+        ("get_info_issues", "INFO", 1),
+    ])
+    def test_get_issues_by_level(self, getter, level, expected_count):
 
         report = ReadinessReport(
             score=0,
@@ -91,128 +120,94 @@ class TestReadinessReport:
                 ReadinessIssue("CRITICAL", "C1", "c1", "i1", "r1"),
                 ReadinessIssue("WARNING", "W1", "w1", "i2", "r2"),
                 ReadinessIssue("CRITICAL", "C2", "c2", "i3", "r3"),
+                ReadinessIssue("INFO", "I1", "i1", "i4", "r4"),
+                ReadinessIssue("WARNING", "W2", "w2", "i5", "r5"),
             ]
         )
 
-        critical = report.get_critical_issues()
-        assert len(critical) == 2
-        assert all(i.level == "CRITICAL" for i in critical)
-
-    def test_get_warning_issues(self):
-
-        report = ReadinessReport(
-            score=50,
-            issues=[
-                ReadinessIssue("WARNING", "W1", "w1", "i1", "r1"),
-                ReadinessIssue("INFO", "I1", "i1", "i2", "r2"),
-                ReadinessIssue("WARNING", "W2", "w2", "i3", "r3"),
-            ]
-        )
-
-        warnings = report.get_warning_issues()
-        assert len(warnings) == 2
-
-    def test_get_info_issues(self):
-
-        report = ReadinessReport(
-            score=90,
-            issues=[
-                ReadinessIssue("INFO", "I1", "i1", "i1", "r1"),
-                ReadinessIssue("WARNING", "W1", "w1", "i2", "r2"),
-            ]
-        )
-
-        infos = report.get_info_issues()
-        assert len(infos) == 1
-        assert infos[0].level == "INFO"
+        issues = getattr(report, getter)()
+        assert len(issues) == expected_count
+        assert all(i.level == level for i in issues)
 
 
 class TestCategoricalDominance:
 
 
 
-    def test_critical_over_50_percent_categorical(self):
-
-        df = pd.DataFrame({
-            'cat1': ['a', 'b', 'c'] * 5,
-            'cat2': ['x', 'y', 'z'] * 5,
-            'cat3': ['p', 'q', 'r'] * 5,
-            'num1': [1, 2, 3] * 5,
-            'class': ['A', 'B', 'A'] * 5
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-
-        assert report.score == 0
-        assert report.verdict == "NOT_RECOMMENDED"
-        critical = report.get_critical_issues()
-        assert len(critical) == 1
-        assert critical[0].code == "CAT_DOM"
-
-    def test_warning_30_to_50_percent_categorical(self):
-
-        df = pd.DataFrame({
-            'cat1': ['a', 'b', 'c'] * 50,
-            'cat2': ['x', 'y', 'z'] * 50,
-            'num1': [1, 2, 3] * 50,
-            'num2': [4, 5, 6] * 50,
-            'num3': [7, 8, 9] * 50,
-            'class': ['A', 'B', 'A'] * 50
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-
-        assert report.score == 70
-        assert report.verdict == "CAUTION"
-        warnings = report.get_warning_issues()
-        assert any(w.code == "CAT_WARN" for w in warnings)
-
-    def test_ok_less_than_30_percent_categorical(self):
-
-        df = pd.DataFrame({
-            'cat1': ['a', 'b', 'c'] * 5,
-            'num1': [1, 2, 3] * 5,
-            'num2': [4, 5, 6] * 5,
-            'num3': [7, 8, 9] * 5,
-            'num4': [10, 11, 12] * 5,
-            'class': ['A', 'B', 'A'] * 5
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-
-        assert report.score >= 80
-        passed_text = ' '.join(report.passed_checks)
-        assert 'acceptable' in passed_text.lower() or 'categorical' in passed_text.lower()
-
-    def test_fully_numeric_dataset(self):
-
-        df = pd.DataFrame({
-            'num1': [1, 2, 3] * 5,
-            'num2': [4, 5, 6] * 5,
-            'num3': [7, 8, 9] * 5,
-            'class': ['A', 'B', 'A'] * 5
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        assert report.score >= 90
+    @pytest.mark.parametrize("df_builder,expected_score,expected_verdict,level,expected_code", [
+        pytest.param(
+            lambda: pd.DataFrame({
+                'cat1': rep(['a', 'b', 'c'], 5),
+                'cat2': rep(['x', 'y', 'z'], 5),
+                'cat3': rep(['p', 'q', 'r'], 5),
+                'num1': rep([1, 2, 3], 5, np.int64),
+                'class': pd.Categorical(rep(['A', 'B', 'A'], 5))
+            }),
+            0, "NOT_RECOMMENDED", "CRITICAL", "CAT_DOM",
+            id="critical_over_50_percent_categorical"
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({
+                'cat1': rep(['a', 'b', 'c'], 50),
+                'cat2': rep(['x', 'y', 'z'], 50),
+                'num1': rep([1, 2, 3], 50, np.int64),
+                'num2': rep([4, 5, 6], 50, np.int64),
+                'num3': rep([7, 8, 9], 50, np.int64),
+                'class': pd.Categorical(rep(['A', 'B', 'A'], 50))
+            }),
+            70, "CAUTION", "WARNING", "CAT_WARN",
+            id="warning_30_to_50_percent_categorical"
+        ),
+    ])
+    def test_categorical_share_issue(self, validator, df_builder, expected_score,
+                                     expected_verdict, level, expected_code):
+
+        report = validator.validate(df_builder(), 'class')
+
+
+        assert report.score == expected_score
+        assert report.verdict == expected_verdict
+        assert [i.code for i in report.issues if i.level == level] == [expected_code]
+
+    @pytest.mark.parametrize("df_builder,min_score,keywords", [
+        pytest.param(
+            lambda: pd.DataFrame({
+                'cat1': rep(['a', 'b', 'c'], 5),
+                'num1': rep([1, 2, 3], 5, np.int64),
+                'num2': rep([4, 5, 6], 5, np.int64),
+                'num3': rep([7, 8, 9], 5, np.int64),
+                'num4': rep([10, 11, 12], 5, np.int64),
+                'class': pd.Categorical(rep(['A', 'B', 'A'], 5))
+            }),
+            80, ('acceptable', 'categorical'),
+            id="ok_less_than_30_percent_categorical"
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({
+                'num1': rep([1, 2, 3], 5, np.int64),
+                'num2': rep([4, 5, 6], 5, np.int64),
+                'num3': rep([7, 8, 9], 5, np.int64),
+                'class': pd.Categorical(rep(['A', 'B', 'A'], 5))
+            }),
+            90, ('numeric',),
+            id="fully_numeric_dataset"
+        ),
+    ])
+    def test_categorical_share_passes(self, validator, df_builder, min_score, keywords):
+
+        report = validator.validate(df_builder(), 'class')
+
+
+        assert report.score >= min_score
         assert report.verdict == "RECOMMENDED"
-        passed_text = ' '.join(report.passed_checks)
-        assert 'numeric' in passed_text.lower()
+        assert any(k in c.lower() for c in report.passed_checks for k in keywords)
 
 
 class TestNumericAsStrings:
 
 
 
-    def test_detects_numeric_as_string_with_missing_markers(self):
+    def test_detects_numeric_as_string_with_missing_markers(self, validator):
 
         df = pd.DataFrame({
             'col1': ['1.0', '2.0', '3.0', '?', '5.0'],
@@ -220,7 +215,6 @@ class TestNumericAsStrings:
             'class': ['A', 'B', 'A', 'B', 'A']
         })
 
-        validator = DatasetReadinessValidator()
         report = validator.validate(df, 'class')
 
         warnings = report.get_warning_issues()
@@ -228,7 +222,7 @@ class TestNumericAsStrings:
         assert len(num_str_warnings) == 1
         assert 'col1' in num_str_warnings[0].message
 
-    def test_no_warning_for_true_categorical(self):
+    def test_no_warning_for_true_categorical(self, validator):
 
         df = pd.DataFrame({
             'cat1': ['red', 'blue', 'green', 'red', 'blue'],
@@ -236,14 +230,12 @@ class TestNumericAsStrings:
             'class': ['A', 'B', 'A', 'B', 'A']
         })
 
-        validator = DatasetReadinessValidator()
         report = validator.validate(df, 'class')
 
         warnings = report.get_warning_issues()
-        num_str_warnings = [w for w in warnings if w.code == "NUM_STR"]
-        assert len(num_str_warnings) == 0
+        assert sum(1 for w in warnings if w.code == "NUM_STR") == 0
 
-    def test_detects_multiple_numeric_as_string_columns(self):
+    def test_detects_multiple_numeric_as_string_columns(self, validator):
 
         df = pd.DataFrame({
             'col1': ['1', '2', '3'],
@@ -252,265 +244,177 @@ class TestNumericAsStrings:
             'class': ['A', 'B', 'A']
         })
 
-        validator = DatasetReadinessValidator()
         report = validator.validate(df, 'class')
 
         warnings = report.get_warning_issues()
-        num_str_warnings = [w for w in warnings if w.code == "NUM_STR"]
-        assert len(num_str_warnings) == 2
+        assert sum(1 for w in warnings if w.code == "NUM_STR") == 2
 
 
 class TestDatasetSize:
 
 
 
-    def test_critical_below_min_samples(self):
+    @pytest.mark.parametrize("n_samples,expected_score,level,expected_code", [
+        pytest.param(3, 0, "CRITICAL", "SIZE_MIN", id="critical_below_min_samples"),
+        pytest.param(50, 90, "WARNING", "SIZE_SMALL", id="warning_below_100_samples"),
+    ])
+    def test_dataset_size_issue(self, n_samples, expected_score, level, expected_code):
 
         df = pd.DataFrame({
-            'num1': [1, 2, 3],
-            'class': ['A', 'B', 'A']
+            'num1': np.arange(n_samples, dtype=np.int64),
+            'class': pd.Categorical(np.resize(np.array(['A', 'B'], dtype=object), n_samples))
         })
 
         validator = DatasetReadinessValidator(min_samples=10)
         report = validator.validate(df, 'class')
 
 
-        assert report.score == 0
-        assert report.verdict == "NOT_RECOMMENDED"
-        critical = report.get_critical_issues()
-        assert any(c.code == "SIZE_MIN" for c in critical)
-
-    def test_warning_below_100_samples(self):
-
-        df = pd.DataFrame({
-            'num1': range(50),
-            'class': ['A', 'B'] * 25
-        })
-
-        validator = DatasetReadinessValidator(min_samples=10)
-        report = validator.validate(df, 'class')
-
-
-        warnings = report.get_warning_issues()
-        assert any(w.code == "SIZE_SMALL" for w in warnings)
+        assert report.score == expected_score
+        assert any(i.level == level and i.code == expected_code for i in report.issues)
 
-    def test_ok_above_100_samples(self):
+    @pytest.mark.slow
+    def test_ok_above_100_samples(self, validator):
 
         df = pd.DataFrame({
-            'num1': range(150),
-            'class': ['A', 'B'] * 75
+            'num1': np.arange(150, dtype=np.int64),
+            'class': pd.Categorical(rep(['A', 'B'], 75))
         })
 
-        validator = DatasetReadinessValidator()
         report = validator.validate(df, 'class')
 
 
-        passed_text = ' '.join(report.passed_checks)
-        assert 'size' in passed_text.lower() or '150' in passed_text
+        assert any('size' in c.lower() or '150' in c for c in report.passed_checks)
 
 
 class TestMissingValues:
 
 
 
-    def test_warning_missing_in_decision_column(self):
+    def test_warning_missing_in_decision_column(self, reports):
 
-        df = pd.DataFrame({
-            'num1': [1, 2, 3, 4],
-            'class': ['A', 'B', None, 'A']
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        warnings = report.get_warning_issues()
+        warnings = reports['missing_decision'].get_warning_issues()
         assert any(w.code == "MISS_DEC" for w in warnings)
 
-    def test_info_missing_in_features(self):
+    def test_info_missing_in_features(self, reports):
 
-        df = pd.DataFrame({
-            'num1': [1, np.nan, 3, 4],
-            'num2': [5, 6, np.nan, 8],
-            'class': ['A', 'B', 'A', 'B']
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        infos = report.get_info_issues()
+        infos = reports['missing_features'].get_info_issues()
         assert any(i.code == "MISS_INFO" for i in infos)
 
-    def test_passed_no_missing_values(self):
-
-        df = pd.DataFrame({
-            'num1': [1, 2, 3, 4],
-            'num2': [5, 6, 7, 8],
-            'class': ['A', 'B', 'A', 'B']
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
+    def test_passed_no_missing_values(self, reports):
 
-        passed_text = ' '.join(report.passed_checks)
-        assert 'missing' in passed_text.lower()
+        assert any('missing' in c.lower() for c in reports['clean'].passed_checks)
 
 
 class TestClassBalance:
 
 
 
-    def test_critical_only_one_class(self):
-
-        df = pd.DataFrame({
-            'num1': [1, 2, 3, 4],
-            'class': ['A', 'A', 'A', 'A']
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        assert report.score == 0
-        critical = report.get_critical_issues()
-        assert any(c.code == "BAL_ONE" for c in critical)
+    @pytest.mark.parametrize("report_key,expected_score,level,expected_code", [
+        pytest.param('one_class', 0, "CRITICAL", "BAL_ONE", id="critical_only_one_class"),
+        pytest.param('imbalanced', 90, "WARNING", "BAL_IMB", id="warning_imbalanced_over_10x"),
+    ])
+    def test_class_balance_issue(self, reports, report_key, expected_score, level, expected_code):
 
-    def test_warning_imbalanced_over_10x(self):
+        report = reports[report_key]
 
-        df = pd.DataFrame({
-            'num1': range(100),
-            'class': ['A'] * 95 + ['B'] * 5
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        warnings = report.get_warning_issues()
-        assert any(w.code == "BAL_IMB" for w in warnings)
-
-    def test_ok_balanced_classes(self):
-
-        df = pd.DataFrame({
-            'num1': range(100),
-            'class': ['A', 'B'] * 50
-        })
+        assert report.score == expected_score
+        assert any(i.level == level and i.code == expected_code for i in report.issues)
 
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
+    def test_ok_balanced_classes(self, reports):
 
-        passed_text = ' '.join(report.passed_checks)
-        assert 'balance' in passed_text.lower() or 'ratio' in passed_text.lower()
+        passed_checks = reports['balanced'].passed_checks
+        assert any('balance' in c.lower() or 'ratio' in c.lower() for c in passed_checks)
 
 
 class TestConstantColumns:
 
 
 
-    def test_info_constant_column_detected(self):
+    def test_info_constant_column_detected(self, reports):
 
-        df = pd.DataFrame({
-            'const1': [5, 5, 5, 5],
-            'num1': [1, 2, 3, 4],
-            'class': ['A', 'B', 'A', 'B']
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        infos = report.get_info_issues()
+        infos = reports['constant_column'].get_info_issues()
         assert any(i.code == "CONST_COL" for i in infos)
-        const_issue = [i for i in infos if i.code == "CONST_COL"][0]
+        const_issue = next(i for i in infos if i.code == "CONST_COL")
         assert 'const1' in const_issue.message
 
-    def test_passed_no_constant_columns(self):
+    def test_passed_no_constant_columns(self, reports):
 
-        df = pd.DataFrame({
-            'num1': [1, 2, 3, 4],
-            'num2': [5, 6, 7, 8],
-            'class': ['A', 'B', 'A', 'B']
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        passed_text = ' '.join(report.passed_checks)
-        assert 'constant' in passed_text.lower()
+        assert any('constant' in c.lower() for c in reports['clean'].passed_checks)
 
 
 class TestScoringAndVerdict:
 
 
 
-    def test_verdict_recommended_score_80_to_100(self):
-
-        df = pd.DataFrame({
-            'num1': [1, 2, 3, 4, 5] * 30,
-            'num2': [6, 7, 8, 9, 10] * 30,
-            'class': ['A', 'B'] * 75
-        })
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        assert report.score >= 80
-        assert report.verdict == "RECOMMENDED"
-
-    def test_verdict_caution_score_50_to_79(self):
-
-        df = pd.DataFrame({
-            'cat1': ['a', 'b', 'c'] * 50,
-            'cat2': ['x', 'y', 'z'] * 50,
-            'num1': [1, 2, 3] * 50,
-            'num2': [4, 5, 6] * 50,
-            'num3': [7, 8, 9] * 50,
-            'class': ['A', 'B'] * 75
-        })
-
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        assert 50 <= report.score < 80
-        assert report.verdict == "CAUTION"
-
-    def test_verdict_not_recommended_score_0_to_49(self):
-
-        df = pd.DataFrame({
-            'cat1': ['a', 'b', 'c'] * 50,
-            'cat2': ['x', 'y', 'z'] * 50,
-            'cat3': ['p', 'q', 'r'] * 50,
-            'num1': [1, 2, 3] * 50,
-            'class': ['A', 'B'] * 75
-        })
-
-
-        validator = DatasetReadinessValidator()
-        report = validator.validate(df, 'class')
-
-        assert report.score < 50
-        assert report.verdict == "NOT_RECOMMENDED"
+    @pytest.mark.slow
+    @pytest.mark.parametrize("df_builder,score_min,score_max,expected_verdict", [
+        pytest.param(
+            lambda: pd.DataFrame({
+                'num1': rep([1, 2, 3, 4, 5], 30, np.int64),
+                'num2': rep([6, 7, 8, 9, 10], 30, np.int64),
+                'class': pd.Categorical(rep(['A', 'B'], 75))
+            }),
+            80, 100, "RECOMMENDED",
+            id="recommended_score_80_to_100"
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({
+                'cat1': rep(['a', 'b', 'c'], 50),
+                'cat2': rep(['x', 'y', 'z'], 50),
+                'num1': rep([1, 2, 3], 50, np.int64),
+                'num2': rep([4, 5, 6], 50, np.int64),
+                'num3': rep([7, 8, 9], 50, np.int64),
+                'class': pd.Categorical(rep(['A', 'B'], 75))
+            }),
+            50, 79, "CAUTION",
+            id="caution_score_50_to_79"
+        ),
+        pytest.param(
+            lambda: pd.DataFrame({
+                'cat1': rep(['a', 'b', 'c'], 50),
+                'cat2': rep(['x', 'y', 'z'], 50),
+                'cat3': rep(['p', 'q', 'r'], 50),
+                'num1': rep([1, 2, 3], 50, np.int64),
+                'class': pd.Categorical(rep(['A', 'B'], 75))
+            }),
+            0, 49, "NOT_RECOMMENDED",
+            id="not_recommended_score_0_to_49"
+        ),
+    ])
+    def test_verdict_matches_score(self, validator, df_builder, score_min, score_max, expected_verdict):
+
+        report = validator.validate(df_builder(), 'class')
+
+        assert score_min <= report.score <= score_max
+        assert report.verdict == expected_verdict
 
 
 class TestIntegration:
 
 
 
-    def test_perfect_dataset(self):
+    @pytest.mark.slow
+    def test_perfect_dataset(self, validator, subtests):
 
         df = pd.DataFrame({
-            'num1': range(200),
-            'num2': range(200, 400),
-            'num3': range(400, 600),
-            'class': ['A', 'B', 'C', 'D'] * 50
+            'num1': np.arange(200, dtype=np.int64),
+            'num2': np.arange(200, 400, dtype=np.int64),
+            'num3': np.arange(400, 600, dtype=np.int64),
+            'class': pd.Categorical(rep(['A', 'B', 'C', 'D'], 50))
         })
 
-        validator = DatasetReadinessValidator()
         report = validator.validate(df, 'class')
 
-        assert report.score == 100
-        assert report.verdict == "RECOMMENDED"
-        assert len(report.get_critical_issues()) == 0
-        assert len(report.passed_checks) > 0
+        with subtests.test("score"):
+            assert report.score == 100
+        with subtests.test("verdict"):
+            assert report.verdict == "RECOMMENDED"
+        with subtests.test("no_critical_issues"):
+            assert len(report.get_critical_issues()) == 0
+        with subtests.test("passed_checks"):
+            assert len(report.passed_checks) > 0
 
-    def test_problematic_dataset(self):
+    def test_problematic_dataset(self, subtests):
 
         df = pd.DataFrame({
             'cat1': ['a', 'b', 'c', 'd', 'e'],
@@ -526,44 +430,42 @@ class TestIntegration:
 
 
 
-        assert report.score == 0
-        assert report.verdict == "NOT_RECOMMENDED"
-        assert len(report.get_critical_issues()) >= 1
+        with subtests.test("score"):
+            assert report.score == 0
+        with subtests.test("verdict"):
+            assert report.verdict == "NOT_RECOMMENDED"
+        with subtests.test("critical_issues"):
+            assert len(report.get_critical_issues()) >= 1
 
-    def test_decision_column_not_found(self):
+    def test_decision_column_not_found(self, validator, subtests):
 
         df = pd.DataFrame({
             'num1': [1, 2, 3],
             'num2': [4, 5, 6]
         })
 
-        validator = DatasetReadinessValidator()
         report = validator.validate(df, 'nonexistent_column')
 
-        assert report.score == 0
-        assert report.verdict == "NOT_RECOMMENDED"
-        critical = report.get_critical_issues()
-        assert len(critical) == 1
-        assert critical[0].code == "DC_NOT_FOUND"
+        with subtests.test("score"):
+            assert report.score == 0
+        with subtests.test("verdict"):
+            assert report.verdict == "NOT_RECOMMENDED"
+        with subtests.test("critical_issue"):
+            assert [i.code for i in report.get_critical_issues()] == ["DC_NOT_FOUND"]
 
-    def test_print_report_does_not_crash(self):
+    @pytest.mark.slow
+    def test_print_report_does_not_crash(self, validator, capsys):
 
         df = pd.DataFrame({
-            'num1': [1, 2, 3, 4, 5] * 30,
-            'class': ['A', 'B'] * 75
+            'num1': rep([1, 2, 3, 4, 5], 30, np.int64),
+            'class': pd.Categorical(rep(['A', 'B'], 75))
         })
 
-        validator = DatasetReadinessValidator()
         report = validator.validate(df, 'class')
 
 
-        import io
-        import sys
-        captured = io.StringIO()
-        sys.stdout = captured
         report.print_report()
-        sys.stdout = sys.__stdout__
 
-        output = captured.getvalue()
+        output = capsys.readouterr().out
         assert "DATASET READINESS REPORT" in output
         assert "Score:" in output
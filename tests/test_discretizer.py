@@ -73,6 +73,39 @@ class TestDiscretizerEqualWidth:
         result = discretizer.discretize(df, method="equal_width", bins=2)
         
         assert result["value"].nunique() == 2
+    
+    def test_equal_width_matches_pandas_cut(self):
+
+        rng = np.random.default_rng(0)
+        train_df = pd.DataFrame({"value": rng.normal(size=200)})
+        test_df = pd.DataFrame({"value": np.r_[rng.uniform(-5, 5, 50), np.nan]})
+        
+        discretizer = Discretizer()
+        discretizer.fit(train_df, method="equal_width", bins=4)
+        _, edges = pd.cut(train_df["value"], bins=4, retbins=True)
+        expected = pd.cut(
+            test_df["value"], bins=edges, labels=["bin_1", "bin_2", "bin_3", "bin_4"],
+            include_lowest=True
+        ).astype(str)
+        
+        np.testing.assert_array_equal(discretizer._bin_edges["value"]["edges"], edges)
+        pd.testing.assert_series_equal(discretizer.transform(test_df)["value"], expected)
+
+    def test_equal_width_large_frame_matches_pandas_cut(self):
+
+        rng = np.random.default_rng(1)
+        train_df = pd.DataFrame({"a": rng.normal(size=500), "b": rng.uniform(0, 100, 500)})
+        test_df = pd.DataFrame({"a": rng.uniform(-5, 5, 20_000), "b": rng.uniform(-10, 110, 20_000)})
+
+        discretizer = Discretizer()
+        discretizer.fit(train_df, method="equal_width", bins=7)
+        result = discretizer.transform(test_df)
+
+        labels = [f"bin_{i}" for i in range(1, 8)]
+        for column in ["a", "b"]:
+            _, edges = pd.cut(train_df[column], bins=7, retbins=True)
+            expected = pd.cut(test_df[column], bins=edges, labels=labels, include_lowest=True).astype(str)
+            pd.testing.assert_series_equal(result[column], expected)
 
 
 class TestDiscretizerEqualFrequency:
@@ -88,6 +121,17 @@ class TestDiscretizerEqualFrequency:
 
         value_counts = result["value"].value_counts()
         assert all(20 <= count <= 30 for count in value_counts)
+
+    def test_bin_counts_match_transformed_labels(self):
+
+        df = pd.DataFrame({"value": list(range(100)) + [np.nan, 500.0]})
+
+        discretizer = Discretizer().fit(df.iloc[:100], method="equal_frequency", bins=4)
+        counts = discretizer.bin_counts(df)["value"]
+        expected = discretizer.transform(df)["value"].value_counts()
+
+        assert counts.tolist() == [25, 25, 25, 25]
+        assert counts.tolist() == [expected[f"bin_{i}"] for i in range(1, 5)]
     
     def test_equal_frequency_handles_duplicates(self):
 
@@ -109,6 +153,20 @@ class TestDiscretizerEqualFrequency:
         
 
         assert result["value"].nunique() == 2
+    
+    def test_equal_frequency_matches_pandas_qcut(self):
+
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"value": np.r_[rng.integers(0, 6, 80), np.nan]})
+        
+        discretizer = Discretizer()
+        result = discretizer.fit_transform(df, method="equal_frequency", bins=5)
+        _, edges = pd.qcut(df["value"], q=5, retbins=True, duplicates="drop")
+        labels = [f"bin_{i+1}" for i in range(len(edges) - 1)]
+        expected = pd.qcut(df["value"], q=5, labels=labels, duplicates="drop").astype(str)
+        
+        np.testing.assert_array_equal(discretizer._bin_edges["value"]["edges"], edges)
+        pd.testing.assert_series_equal(result["value"], expected)
 
 
 class TestDiscretizerKMeans:
@@ -136,6 +194,15 @@ class TestDiscretizerKMeans:
 
         assert result["value"].iloc[3] == result["value"].iloc[4] == result["value"].iloc[5]
 
+    def test_kmeans_clusters_numbered_by_center(self):
+
+        df = pd.DataFrame({"value": [200, 1, 101, 201, 2, 102, 202, 3, 100]})
+
+        discretizer = Discretizer()
+        result = discretizer.discretize(df, method="kmeans", bins=3)
+
+        assert list(result["value"]) == ["cluster_3", "cluster_1", "cluster_2"] * 3
+
 
 class TestDiscretizerGeneral:
 
@@ -246,6 +313,27 @@ class TestDiscretizerLabels:
         labels = result["value"].unique()
         assert len(labels) == 2
 
+    def test_categorical_output_matches_object_labels(self):
+
+        df = pd.DataFrame({"value": [1.0, 5.0, np.nan, 10.0, 15.0, 20.0]})
+
+        plain = Discretizer().fit_transform(df, method="equal_width", bins=3)
+        categorical = Discretizer(categorical=True).fit_transform(df, method="equal_width", bins=3)
+
+        assert isinstance(categorical["value"].dtype, pd.CategoricalDtype)
+        assert list(categorical["value"].cat.categories) == ["bin_1", "bin_2", "bin_3", "nan"]
+        assert categorical["value"].astype(object).equals(plain["value"])
+
+    def test_editing_output_leaves_shared_labels_intact(self):
+
+        df = pd.DataFrame({"value": [1.0, 5.0, 10.0, 15.0, 20.0]})
+
+        first = Discretizer().discretize(df, method="equal_width", bins=3)
+        first.loc[0, "value"] = "edited"
+        second = Discretizer().discretize(df, method="equal_width", bins=3)
+
+        assert second["value"].iloc[0] == "bin_1"
+
 class TestDiscretizerSkipBinary:
 
 
@@ -453,4 +541,39 @@ class TestDiscretizerFitTransform:
 
 
         assert len(result) == 5
-        assert result["value"].nunique() == 2
\ No newline at end of file
+        assert result["value"].nunique() == 2
+    def test_refit_on_identical_data_reuses_bin_edges(self):
+
+        train_df = pd.DataFrame({"value": [1, 2, 3, 100, 101, 102]})
+
+        first = Discretizer().fit(train_df, method="kmeans", bins=2)
+        second = Discretizer().fit(train_df.copy(), method="kmeans", bins=2)
+        other = Discretizer().fit(train_df + 1, method="kmeans", bins=2)
+
+        assert second._bin_edges["value"]["centers"] is first._bin_edges["value"]["centers"]
+        assert other._bin_edges["value"]["centers"] is not first._bin_edges["value"]["centers"]
+
+    def test_shared_bin_edges_are_read_only(self):
+
+        train_df = pd.DataFrame({"value": list(range(100))})
+
+        first = Discretizer().fit(train_df, method="equal_frequency", bins=4)
+        expected = first._bin_edges["value"]["edges"].copy()
+
+        with pytest.raises(ValueError):
+            first._bin_edges["value"]["edges"][0] = -1.0
+
+        second = Discretizer().fit(train_df, method="equal_frequency", bins=4)
+        np.testing.assert_array_equal(second._bin_edges["value"]["edges"], expected)
+        assert second.transform(train_df).equals(first.transform(train_df))
+
+    def test_fit_with_disk_memory(self, tmp_path):
+
+        train_df = pd.DataFrame({"value": list(range(100))})
+
+        first = Discretizer(memory=str(tmp_path)).fit(train_df, method="equal_frequency", bins=4)
+        second = Discretizer(memory=str(tmp_path)).fit(train_df, method="equal_frequency", bins=4)
+
+        np.testing.assert_array_equal(first._bin_edges["value"]["edges"], second._bin_edges["value"]["edges"])
+        assert second.transform(train_df).equals(first.transform(train_df))
+        assert any(tmp_path.iterdir())
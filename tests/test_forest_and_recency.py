@@ -18,6 +18,8 @@
 
 
 
+
+from collections import OrderedDict
 
 import pytest
 import pandas as pd
@@ -270,6 +272,59 @@ def test_seeding_produces_identical_rules_with_same_seed():
         )
 
 
+def test_cached_generate_replays_uncached_runs(monkeypatch):
+
+    df = pd.DataFrame({
+        'attr1': ['a', 'b', 'c', 'a', 'b', 'c'] * 10,
+        'attr2': ['x', 'y', 'y', 'x', 'x', 'y'] * 10,
+        'class': ['yes', 'no', 'yes', 'no', 'no', 'yes'] * 10
+    })
+    monkeypatch.setattr(ForestRuleGenerator, "_result_cache", OrderedDict())
+
+    def run_twice():
+        gen = ForestRuleGenerator(n_estimators=4, min_depth=1, max_depth=5, min_samples_leaf=1, random_state=7)
+        runs = [gen.generate(df, decision_column='class') for _ in range(2)]
+        return [[(r.id, r.premises, r.conclusion) for r in rules] for rules in runs], gen.rng.getstate()
+
+    uncached_runs, uncached_state = run_twice()
+    cached_runs, cached_state = run_twice()
+
+    assert cached_runs == uncached_runs
+    assert cached_state == uncached_state
+
+
+def test_cached_generate_returns_independent_containers(monkeypatch):
+
+    df = pd.DataFrame({
+        'attr1': ['a', 'b', 'c', 'a', 'b', 'c'] * 10,
+        'attr2': ['x', 'y', 'y', 'x', 'x', 'y'] * 10,
+        'class': ['yes', 'no', 'yes', 'no', 'no', 'yes'] * 10
+    })
+    monkeypatch.setattr(ForestRuleGenerator, "_result_cache", OrderedDict())
+
+    first = ForestRuleGenerator(n_estimators=4, min_depth=1, max_depth=5, min_samples_leaf=1, random_state=7)
+    rules = first.generate(df, decision_column='class')
+    expected = list(rules)
+    rules.clear()
+    first.feature_names.clear()
+    first.class_names.clear()
+    first.estimators_.clear()
+
+    second = ForestRuleGenerator(n_estimators=4, min_depth=1, max_depth=5, min_samples_leaf=1, random_state=7)
+    again = second.generate(df, decision_column='class')
+
+    assert again == expected
+    assert second.feature_names == ['attr1', 'attr2']
+    assert sorted(second.class_names) == ['no', 'yes']
+    assert len(second.estimators_) == 4
+
+    again.clear()
+    second.feature_names.append('extra')
+    third = ForestRuleGenerator(n_estimators=4, min_depth=1, max_depth=5, min_samples_leaf=1, random_state=7)
+    assert third.generate(df, decision_column='class') == expected
+    assert third.feature_names == ['attr1', 'attr2']
+
+
 def test_seeding_produces_different_rules_with_different_seed():
 
 
@@ -19,6 +19,7 @@
 
 import pytest
 import pandas as pd
+import numpy as np
 import tempfile
 from pathlib import Path
 
@@ -28,7 +29,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from csv_loader import load_csv, CSVLoadError
-from preprocessing.rule_generator import RuleGenerator
 
 
 
@@ -52,7 +52,7 @@ def _write_csv(temp_dir, filename, content):
 class TestDetectUnnamedPattern:
 
 
-    def test_detect_unnamed_0(self):
+    def test_detect_unnamed_0(self, rule_generator):
 
         df = pd.DataFrame({
             "Unnamed: 0": [0, 1, 2],
@@ -60,12 +60,11 @@ class TestDetectUnnamedPattern:
             "class": ["A", "B", "C"]
         })
 
-        generator = RuleGenerator()
-        id_columns = generator.detect_id_columns(df)
+        id_columns = rule_generator.detect_id_columns(df)
 
         assert "Unnamed: 0" in id_columns
 
-    def test_detect_unnamed_1(self):
+    def test_detect_unnamed_1(self, rule_generator):
 
         df = pd.DataFrame({
             "Unnamed: 1": [10, 20, 30],
@@ -73,12 +72,11 @@ class TestDetectUnnamedPattern:
             "class": ["A", "B", "C"]
         })
 
-        generator = RuleGenerator()
-        id_columns = generator.detect_id_columns(df)
+        id_columns = rule_generator.detect_id_columns(df)
 
         assert "Unnamed: 1" in id_columns
 
-    def test_detect_unnamed_case_insensitive(self):
+    def test_detect_unnamed_case_insensitive(self, rule_generator):
 
         df = pd.DataFrame({
             "UNNAMED_col": [1, 2, 3],
@@ -86,8 +84,7 @@ class TestDetectUnnamedPattern:
             "class": ["A", "B", "C"]
         })
 
-        generator = RuleGenerator()
-        id_columns = generator.detect_id_columns(df)
+        id_columns = rule_generator.detect_id_columns(df)
 
         assert "UNNAMED_col" in id_columns
 
@@ -219,3 +216,38 @@ class TestLoadCsvRemovesIdColumns:
 
         assert "age" in df.columns
         assert meta['removed_id_columns'] == []
+
+    def test_decision_column_in_middle_keeps_index_after_removal(self, temp_dir):
+
+        path = _write_csv(temp_dir, "middle_decision.csv",
+            "Id,color,class,size\n1,red,A,big\n2,blue,B,small\n"
+            "3,green,A,big\n4,red,B,small\n5,blue,A,big\n"
+            "6,green,B,small\n7,red,A,big\n8,blue,B,small\n"
+            "9,green,A,big\n10,red,B,small\n")
+
+        df, meta = load_csv(path, decision_column_index=2)
+
+        assert list(df.columns) == ['color', 'class', 'size']
+        assert meta['decision_column_index'] == 1
+        assert meta['decision_column_name'] == 'class'
+
+
+class TestLoadCsvSpacePaddedFields:
+
+
+    def test_space_padded_na_markers_are_missing(self, temp_dir):
+
+        path = _write_csv(temp_dir, "padded.csv",
+            "weight, height, class\n70.5, 180, A\n85.2, NA, B\n"
+            "62.0, NULL, A\n95.5, 172, \n58.3, 160, B\n102.0, 185, A\n"
+            "70.5, 172, B\n85.2, 160, A\n62.0, 180, B\n95.5, 185, A\n"
+            "58.3, 172, B\n102.0, 160, A\n70.5, 185, B\n")
+
+        df, meta = load_csv(path)
+
+        assert list(df.columns) == ['weight', 'height', 'class']
+        assert meta['rows_final'] == 10
+        assert meta['dropped_rows'] == 3
+        assert set(df['class']) == {'A', 'B'}
+        assert df['weight'].dtype == np.float64
+        assert df['height'].dtype == np.float64
@@ -20,6 +20,8 @@
 
 
 
+
+import re
 
 import pytest
 import pandas as pd
@@ -27,6 +29,18 @@ import numpy as np
 from preprocessing.imputer import Imputer, ImputationReport
 
 
+_ERR_NO_COLUMN = re.compile("nie istnieje")
+_ERR_MISSING_DECISION = re.compile("brakujące wartości")
+
+
+@pytest.fixture(params=["object", "category"])
+def df_mean_by_class(request):
+    return pd.DataFrame({
+        "Value": np.array([10.0, np.nan, 30.0, 100.0, np.nan, 300.0]),
+        "Class": pd.Series(["A", "A", "A", "B", "B", "B"], dtype=request.param)
+    })
+
+
 class TestImputerCheckMissing:
 
     
@@ -100,17 +114,10 @@ class TestImputerNumericMean:
 
 
     
-    def test_mean_imputation_by_class(self):
+    def test_mean_imputation_by_class(self, df_mean_by_class):
 
-        df = pd.DataFrame({
-            "Value": [10.0, np.nan, 30.0, 100.0, np.nan, 300.0],
-            "Class": ["A", "A", "A", "B", "B", "B"]
-        })
-
-
-        
         imputer = Imputer()
-        result, report = imputer.impute(df, decision_column="Class", numeric_method="mean")
+        result, report = imputer.impute(df_mean_by_class, decision_column="Class", numeric_method="mean")
         
 
         assert result.loc[1, "Value"] == 20.0
@@ -187,6 +194,20 @@ class TestImputerCategoricalMode:
         
         assert result.loc[1, "Color"] == "red"
 
+    def test_mode_tie_picks_smallest_value(self):
+
+        df = pd.DataFrame({
+            "Color": ["red", "blue", None, "green", "green", None],
+            "Class": ["A", "A", "A", "B", "B", "B"]
+        })
+
+        imputer = Imputer()
+        result, report = imputer.impute(df, decision_column="Class")
+
+        assert result.loc[2, "Color"] == "blue"
+        assert result.loc[5, "Color"] == "green"
+        assert report.imputation_values["Color"] == {"A": "blue", "B": "green"}
+
 
 class TestImputerMixedTypes:
 
@@ -229,7 +250,7 @@ class TestImputerValidation:
         df = pd.DataFrame({"A": [1, 2, 3]})
         imputer = Imputer()
         
-        with pytest.raises(ValueError, match="nie istnieje"):
+        with pytest.raises(ValueError, match=_ERR_NO_COLUMN):
             imputer.impute(df, decision_column="NonExistent")
     
     def test_missing_values_in_decision_column_raises_error(self):
@@ -240,7 +261,7 @@ class TestImputerValidation:
         })
         imputer = Imputer()
         
-        with pytest.raises(ValueError, match="brakujące wartości"):
+        with pytest.raises(ValueError, match=_ERR_MISSING_DECISION):
             imputer.impute(df, decision_column="Class")
 
 
@@ -323,6 +344,24 @@ class TestImputerReport:
         assert report is not None
         assert report.total_missing == 1
 
+    def test_report_skips_unused_categorical_classes(self):
+
+        df = pd.DataFrame({
+            "Value": [10.0, np.nan, 30.0, 100.0, np.nan],
+            "Color": ["red", np.nan, "red", "blue", np.nan],
+            "Class": pd.Categorical(["A", "A", "A", "B", "B"], categories=["A", "B", "C"])
+        })
+
+        imputer = Imputer()
+        result, report = imputer.impute(df, decision_column="Class")
+
+        assert list(result["Value"]) == [10.0, 20.0, 30.0, 100.0, 100.0]
+        assert list(result["Color"]) == ["red", "red", "red", "blue", "blue"]
+        assert report.imputation_values == {
+            "Value": {"A": 20.0, "B": 100.0},
+            "Color": {"A": "red", "B": "blue"},
+        }
+
 
 class TestImputerDropMissing:
 
@@ -356,9 +395,23 @@ class TestImputerDropMissing:
         
         imputer = Imputer()
         result = imputer.drop_missing(df, threshold=0.5)
-        
+
         assert len(result) == 2
-    
+
+    def test_threshold_is_required_fraction_of_present_values(self):
+
+        df = pd.DataFrame({
+            "A": [1, np.nan, np.nan],
+            "B": [1, 2, np.nan],
+            "C": [1, 2, 3],
+            "D": [1, np.nan, 4]
+        })
+
+        imputer = Imputer()
+        result = imputer.drop_missing(df, threshold=0.75)
+
+        assert list(result.index) == [0]
+
     def test_drop_from_specific_columns(self):
 
         df = pd.DataFrame({
@@ -394,6 +447,19 @@ class TestImputerEdgeCases:
         assert not pd.isna(result.loc[0, "Value"])
         assert not pd.isna(result.loc[1, "Value"])
 
+    def test_all_categorical_values_missing_for_one_class(self):
+
+        df = pd.DataFrame({
+            "Color": [np.nan, np.nan, "red", "red", "blue"],
+            "Class": ["A", "A", "B", "B", "B"]
+        })
+
+        imputer = Imputer()
+        result, _ = imputer.impute(df, decision_column="Class")
+
+        assert result["Color"].iloc[:2].isna().all()
+        assert list(result["Color"].iloc[2:]) == ["red", "red", "blue"]
+
     
     def test_single_row_per_class(self):
 
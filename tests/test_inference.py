@@ -23,9 +23,25 @@
 import pytest
 from core.models import Fact, Rule, KnowledgeBase
 from core.strategies import FirstStrategy, RandomStrategy, SpecificityStrategy, RecencyStrategy
+from core._greedy_kernel import greedy_rounds
 from core.inference import ForwardChaining, GreedyForwardChaining, BackwardChaining, InferenceResult
 
 
+@pytest.fixture(scope="module")
+def rule_ab():
+    return Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
+
+
+@pytest.fixture(scope="module")
+def rule_bc():
+    return Rule(id=2, premises=[Fact("b", "2")], conclusion=Fact("c", "3"))
+
+
+@pytest.fixture(scope="module")
+def rule_cd():
+    return Rule(id=3, premises=[Fact("c", "3")], conclusion=Fact("d", "4"))
+
+
 class TestInferenceResult:
 
 
@@ -125,18 +141,26 @@ class TestForwardChainingBasic:
 
         assert result.rules_fired.count(rule) == 1
 
+    def test_repeated_premise_is_counted_once(self):
+
+        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
+        rule2 = Rule(id=2, premises=[Fact("b", "2"), Fact("b", "2")], conclusion=Fact("c", "3"))
+        kb = KnowledgeBase(rules=[rule1, rule2], facts={Fact("a", "1")})
+        engine = ForwardChaining(FirstStrategy())
+
+        result = engine.run(kb)
+
+        assert result.rules_fired == [rule1, rule2]
+
 
 class TestForwardChainingChain:
 
 
     
-    def test_chain_of_two_rules(self):
+    def test_chain_of_two_rules(self, rule_ab, rule_bc):
 
-        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
-        rule2 = Rule(id=2, premises=[Fact("b", "2")], conclusion=Fact("c", "3"))
-        
         kb = KnowledgeBase(
-            rules=[rule1, rule2],
+            rules=[rule_ab, rule_bc],
             facts={Fact("a", "1")}
         )
         strategy = FirstStrategy()
@@ -149,14 +173,10 @@ class TestForwardChainingChain:
         assert len(result.new_facts) == 2
         assert result.iterations == 3
     
-    def test_chain_of_three_rules(self):
+    def test_chain_of_three_rules(self, rule_ab, rule_bc, rule_cd):
 
-        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
-        rule2 = Rule(id=2, premises=[Fact("b", "2")], conclusion=Fact("c", "3"))
-        rule3 = Rule(id=3, premises=[Fact("c", "3")], conclusion=Fact("d", "4"))
-        
         kb = KnowledgeBase(
-            rules=[rule1, rule2, rule3],
+            rules=[rule_ab, rule_bc, rule_cd],
             facts={Fact("a", "1")}
         )
         strategy = FirstStrategy()
@@ -172,13 +192,10 @@ class TestForwardChainingWithGoal:
 
 
     
-    def test_stops_when_goal_reached(self):
+    def test_stops_when_goal_reached(self, rule_ab, rule_bc):
 
-        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
-        rule2 = Rule(id=2, premises=[Fact("b", "2")], conclusion=Fact("c", "3"))
-        
         kb = KnowledgeBase(
-            rules=[rule1, rule2],
+            rules=[rule_ab, rule_bc],
             facts={Fact("a", "1")}
         )
         strategy = FirstStrategy()
@@ -191,12 +208,10 @@ class TestForwardChainingWithGoal:
         assert Fact("b", "2") in result.facts
         assert Fact("c", "3") not in result.facts
     
-    def test_returns_failure_when_goal_not_reachable(self):
+    def test_returns_failure_when_goal_not_reachable(self, rule_ab):
 
-        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
-        
         kb = KnowledgeBase(
-            rules=[rule1],
+            rules=[rule_ab],
             facts={Fact("a", "1")}
         )
         strategy = FirstStrategy()
@@ -207,12 +222,10 @@ class TestForwardChainingWithGoal:
         
         assert result.success == False
     
-    def test_success_true_when_no_goal(self):
+    def test_success_true_when_no_goal(self, rule_ab):
 
-        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
-        
         kb = KnowledgeBase(
-            rules=[rule1],
+            rules=[rule_ab],
             facts={Fact("a", "1")}
         )
         strategy = FirstStrategy()
@@ -282,13 +295,10 @@ class TestForwardChainingMetrics:
         assert result.execution_time_ms >= 0
         assert isinstance(result.execution_time_ms, float)
     
-    def test_iterations_count_is_correct(self):
+    def test_iterations_count_is_correct(self, rule_ab, rule_bc):
 
-        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
-        rule2 = Rule(id=2, premises=[Fact("b", "2")], conclusion=Fact("c", "3"))
-        
         kb = KnowledgeBase(
-            rules=[rule1, rule2],
+            rules=[rule_ab, rule_bc],
             facts={Fact("a", "1")}
         )
         strategy = FirstStrategy()
@@ -347,6 +357,17 @@ class TestGreedyForwardChaining:
 
         assert greedy_result.iterations < normal_result.iterations
 
+    def test_compiled_rounds_match_mask_rounds(self, rule_ab, rule_bc, rule_cd):
+
+        rule_dup = Rule(id=4, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
+        rules = [rule_ab, rule_bc, rule_cd, rule_dup]
+        facts = {Fact("a", "1")}
+
+        compiled = list(greedy_rounds(rules, facts))
+
+        assert compiled == list(GreedyForwardChaining._mask_rounds(rules, facts))
+        assert compiled == [[0, 3], [1], [2], []]
+
 
 
 
@@ -431,13 +452,10 @@ class TestBackwardChainingRecursion:
 
 
     
-    def test_chain_of_two_rules(self):
+    def test_chain_of_two_rules(self, rule_ab, rule_bc):
 
-        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
-        rule2 = Rule(id=2, premises=[Fact("b", "2")], conclusion=Fact("c", "3"))
-        
         kb = KnowledgeBase(
-            rules=[rule1, rule2],
+            rules=[rule_ab, rule_bc],
             facts={Fact("a", "1")}
         )
         strategy = FirstStrategy()
@@ -449,14 +467,10 @@ class TestBackwardChainingRecursion:
         assert Fact("b", "2") in result.facts
         assert Fact("c", "3") in result.facts
     
-    def test_chain_of_three_rules(self):
+    def test_chain_of_three_rules(self, rule_ab, rule_bc, rule_cd):
 
-        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
-        rule2 = Rule(id=2, premises=[Fact("b", "2")], conclusion=Fact("c", "3"))
-        rule3 = Rule(id=3, premises=[Fact("c", "3")], conclusion=Fact("d", "4"))
-        
         kb = KnowledgeBase(
-            rules=[rule1, rule2, rule3],
+            rules=[rule_ab, rule_bc, rule_cd],
             facts={Fact("a", "1")}
         )
         strategy = FirstStrategy()
@@ -581,6 +595,22 @@ class TestBackwardChainingCycleDetection:
         
         assert result.success == False
 
+    def test_goal_cut_by_cycle_is_retried_later(self):
+
+        rules = [
+            Rule(id=1, premises=[Fact("g", "1"), Fact("p", "1")], conclusion=Fact("t", "1")),
+            Rule(id=2, premises=[Fact("p", "1"), Fact("q", "1")], conclusion=Fact("g", "1")),
+            Rule(id=3, premises=[Fact("r", "1")], conclusion=Fact("g", "1")),
+            Rule(id=4, premises=[Fact("g", "1")], conclusion=Fact("p", "1")),
+        ]
+        kb = KnowledgeBase(rules=rules, facts={Fact("r", "1")})
+        engine = BackwardChaining(FirstStrategy())
+
+        result = engine.run(kb, goal=Fact("t", "1"))
+
+        assert result.success == True
+        assert [r.id for r in result.rules_fired] == [3, 4, 1]
+
 
 class TestBackwardChainingMetrics:
 
@@ -597,13 +627,10 @@ class TestBackwardChainingMetrics:
         assert result.execution_time_ms >= 0
         assert isinstance(result.execution_time_ms, float)
     
-    def test_rules_fired_recorded(self):
+    def test_rules_fired_recorded(self, rule_ab, rule_bc):
 
-        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
-        rule2 = Rule(id=2, premises=[Fact("b", "2")], conclusion=Fact("c", "3"))
-        
         kb = KnowledgeBase(
-            rules=[rule1, rule2],
+            rules=[rule_ab, rule_bc],
             facts={Fact("a", "1")}
         )
         strategy = FirstStrategy()
@@ -612,8 +639,67 @@ class TestBackwardChainingMetrics:
         result = engine.run(kb, goal=Fact("c", "3"))
         
         assert len(result.rules_fired) == 2
-        assert rule1 in result.rules_fired
-        assert rule2 in result.rules_fired
+        assert rule_ab in result.rules_fired
+        assert rule_bc in result.rules_fired
+
+    def test_failed_subgoal_is_not_proven_again(self):
+
+        rules = [
+            Rule(id=1, premises=[Fact("x", "1"), Fact("y", "1")], conclusion=Fact("d", "1")),
+            Rule(id=2, premises=[Fact("x", "1"), Fact("z", "1")], conclusion=Fact("d", "1")),
+            Rule(id=3, premises=[Fact("w", "1")], conclusion=Fact("x", "1")),
+        ]
+        kb = KnowledgeBase(rules=rules, facts=set())
+        engine = BackwardChaining(FirstStrategy())
+
+        result = engine.run(kb, goal=Fact("d", "1"))
+
+        assert result.success == False
+        assert result.rules_activated == 3
+
+    def test_proved_subgoal_is_reused(self):
+
+        rules = [
+            Rule(id=1, premises=[Fact("x", "1"), Fact("y", "1")], conclusion=Fact("d", "1")),
+            Rule(id=2, premises=[Fact("w", "1")], conclusion=Fact("x", "1")),
+            Rule(id=3, premises=[Fact("x", "1")], conclusion=Fact("y", "1")),
+        ]
+        kb = KnowledgeBase(rules=rules, facts={Fact("w", "1")})
+        engine = BackwardChaining(FirstStrategy())
+
+        result = engine.run(kb, goal=Fact("d", "1"))
+
+        assert result.success == True
+        assert [r.id for r in result.rules_fired] == [2, 3, 1]
+        assert result.new_facts == [Fact("x", "1"), Fact("y", "1"), Fact("d", "1")]
+        assert result.rules_activated == 3
+
+    def test_rules_evaluated_counts_every_rule_per_goal(self):
+
+        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
+        rule2 = Rule(id=2, premises=[Fact("b", "2")], conclusion=Fact("c", "3"))
+        rule3 = Rule(id=3, premises=[Fact("x", "1")], conclusion=Fact("y", "2"))
+
+        kb = KnowledgeBase(
+            rules=[rule1, rule2, rule3],
+            facts={Fact("a", "1")}
+        )
+        engine = BackwardChaining(FirstStrategy())
+
+        result = engine.run(kb, goal=Fact("c", "3"))
+
+        assert result.rules_evaluated == 6
+        assert result.rules_activated == 2
+
+    def test_rule_added_after_first_run_is_used(self):
+
+        kb = KnowledgeBase(rules=[], facts={Fact("a", "1")})
+        engine = BackwardChaining(FirstStrategy())
+        assert engine.run(kb, goal=Fact("b", "2")).success is False
+
+        kb.rules.append(Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2")))
+
+        assert engine.run(kb, goal=Fact("b", "2")).success is True
 
 
 class TestBackwardChainingStrategy:
@@ -237,6 +237,7 @@ def test_execution_time_is_positive():
 
         result = engine.run(kb)
         assert result.execution_time_ms > 0, f"{engine_class.__name__} execution_time_ms must be > 0"
+        assert result.execution_time_ms == result.execution_time_ns / 1_000_000
 
 
 if __name__ == "__main__":
@@ -12,6 +12,8 @@
 
 
 
+import io
+
 import pytest
 import pandas as pd
 from pathlib import Path
@@ -24,15 +26,7 @@ from core.strategies import FirstStrategy, SpecificityStrategy, RandomStrategy
 from core.inference import ForwardChaining, GreedyForwardChaining
 
 
-class TestIrisPipeline:
-
-
-    
-    @pytest.fixture
-    def iris_df(self, tmp_path):
-
-
-        data = """Id,SepalLengthCm,SepalWidthCm,PetalLengthCm,PetalWidthCm,Species
+IRIS_CSV = """Id,SepalLengthCm,SepalWidthCm,PetalLengthCm,PetalWidthCm,Species
 1,5.1,3.5,1.4,0.2,Iris-setosa
 2,4.9,3.0,1.4,0.2,Iris-setosa
 3,4.7,3.2,1.3,0.2,Iris-setosa
@@ -43,10 +37,43 @@ class TestIrisPipeline:
 8,5.8,2.7,5.1,1.9,Iris-virginica
 9,7.1,3.0,5.9,2.1,Iris-virginica
 10,6.5,3.0,5.8,2.2,Iris-virginica"""
-        
-        path = tmp_path / "iris.csv"
-        path.write_text(data)
-        return path
+
+
+@pytest.fixture
+def iris_df():
+
+    return io.StringIO(IRIS_CSV)
+
+
+@pytest.fixture(scope="module")
+def iris_rules():
+
+    loader = DataLoader()
+    df = loader.load(io.StringIO(IRIS_CSV), config=CSVConfig(exclude_columns=["Id"]))
+
+    discretizer = Discretizer()
+    df_disc = discretizer.discretize(df, method="equal_width", bins=3)
+
+    generator = RuleGenerator()
+    rules = generator.generate(df_disc, decision_column="Species")
+    return df_disc, rules
+
+
+class TestIrisPipeline:
+
+
+    
+    @pytest.fixture
+    def initial_facts(self, iris_rules):
+
+        df_disc, _ = iris_rules
+        first_row = df_disc.iloc[0]
+        return {
+            Fact("SepalLengthCm", str(first_row["SepalLengthCm"])),
+            Fact("SepalWidthCm", str(first_row["SepalWidthCm"])),
+            Fact("PetalLengthCm", str(first_row["PetalLengthCm"])),
+            Fact("PetalWidthCm", str(first_row["PetalWidthCm"]))
+        }
     
     def test_full_pipeline_loads_csv(self, iris_df):
 
@@ -59,10 +86,7 @@ class TestIrisPipeline:
     def test_full_pipeline_discretizes(self, iris_df):
 
         loader = DataLoader()
-        df = loader.load(iris_df)
-        
-
-        df = df.drop(columns=["Id"])
+        df = loader.load(iris_df, config=CSVConfig(exclude_columns=["Id"]))
         
 
         discretizer = Discretizer()
@@ -77,17 +101,9 @@ class TestIrisPipeline:
         assert df_disc["SepalLengthCm"].dtype == object
         assert df_disc["Species"].iloc[0] == "Iris-setosa"
     
-    def test_full_pipeline_generates_rules(self, iris_df):
+    def test_full_pipeline_generates_rules(self, iris_rules):
 
-        loader = DataLoader()
-        df = loader.load(iris_df)
-        df = df.drop(columns=["Id"])
-        
-        discretizer = Discretizer()
-        df_disc = discretizer.discretize(df, method="equal_width", bins=3)
-        
-        generator = RuleGenerator()
-        rules = generator.generate(df_disc, decision_column="Species")
+        _, rules = iris_rules
         
 
         assert len(rules) > 0
@@ -99,27 +115,10 @@ class TestIrisPipeline:
         conclusions = {r.conclusion.value for r in rules}
         assert "Iris-setosa" in conclusions
     
-    def test_full_pipeline_inference(self, iris_df):
+    def test_full_pipeline_inference(self, iris_rules, initial_facts):
 
 
-        loader = DataLoader()
-        df = loader.load(iris_df)
-        df = df.drop(columns=["Id"])
-        
-        discretizer = Discretizer()
-        df_disc = discretizer.discretize(df, method="equal_width", bins=3)
-        
-        generator = RuleGenerator()
-        rules = generator.generate(df_disc, decision_column="Species")
-        
-
-        first_row = df_disc.iloc[0]
-        initial_facts = {
-            Fact("SepalLengthCm", str(first_row["SepalLengthCm"])),
-            Fact("SepalWidthCm", str(first_row["SepalWidthCm"])),
-            Fact("PetalLengthCm", str(first_row["PetalLengthCm"])),
-            Fact("PetalWidthCm", str(first_row["PetalWidthCm"]))
-        }
+        _, rules = iris_rules
         
 
         kb = KnowledgeBase(rules=rules, facts=initial_facts)
@@ -136,26 +135,9 @@ class TestIrisPipeline:
         species_facts = [f for f in result.facts if f.attribute == "Species"]
         assert len(species_facts) > 0
     
-    def test_full_pipeline_with_goal(self, iris_df):
+    def test_full_pipeline_with_goal(self, iris_rules, initial_facts):
 
-        loader = DataLoader()
-        df = loader.load(iris_df)
-        df = df.drop(columns=["Id"])
-        
-        discretizer = Discretizer()
-        df_disc = discretizer.discretize(df, method="equal_width", bins=3)
-        
-        generator = RuleGenerator()
-        rules = generator.generate(df_disc, decision_column="Species")
-        
-
-        first_row = df_disc.iloc[0]
-        initial_facts = {
-            Fact("SepalLengthCm", str(first_row["SepalLengthCm"])),
-            Fact("SepalWidthCm", str(first_row["SepalWidthCm"])),
-            Fact("PetalLengthCm", str(first_row["PetalLengthCm"])),
-            Fact("PetalWidthCm", str(first_row["PetalWidthCm"]))
-        }
+        _, rules = iris_rules
         
         kb = KnowledgeBase(rules=rules, facts=initial_facts)
         
@@ -167,25 +149,9 @@ class TestIrisPipeline:
         
         assert result.success == True
     
-    def test_compare_strategies(self, iris_df):
+    def test_compare_strategies(self, iris_rules, initial_facts):
 
-        loader = DataLoader()
-        df = loader.load(iris_df)
-        df = df.drop(columns=["Id"])
-        
-        discretizer = Discretizer()
-        df_disc = discretizer.discretize(df, method="equal_width", bins=3)
-        
-        generator = RuleGenerator()
-        rules = generator.generate(df_disc, decision_column="Species")
-        
-        first_row = df_disc.iloc[0]
-        initial_facts = {
-            Fact("SepalLengthCm", str(first_row["SepalLengthCm"])),
-            Fact("SepalWidthCm", str(first_row["SepalWidthCm"])),
-            Fact("PetalLengthCm", str(first_row["PetalLengthCm"])),
-            Fact("PetalWidthCm", str(first_row["PetalWidthCm"]))
-        }
+        _, rules = iris_rules
         
         strategies = [
             ("First", FirstStrategy()),
@@ -193,9 +159,10 @@ class TestIrisPipeline:
             ("Random", RandomStrategy())
         ]
         
+        base_kb = KnowledgeBase(rules=rules, facts=initial_facts)
         results = {}
         for name, strategy in strategies:
-            kb = KnowledgeBase(rules=rules.copy(), facts=initial_facts.copy())
+            kb = base_kb.clone_facts_only()
             engine = ForwardChaining(strategy)
             result = engine.run(kb)
             results[name] = {
@@ -205,10 +172,4 @@ class TestIrisPipeline:
             }
         
 
-        assert all(r["new_facts"] > 0 for r in results.values())
-        
-
-        print("\n=== Porównanie strategii ===")
-        for name, stats in results.items():
-            print(f"{name}: iterations={stats['iterations']}, "
-                  f"new_facts={stats['new_facts']}, time={stats['time']:.3f}ms")
\ No newline at end of file
+        assert all(r["new_facts"] > 0 for r in results.values())
\ No newline at end of file
@@ -15,6 +15,8 @@
 
 
 
+import pickle
+
 import pytest
 from core.models import Fact, Rule, KnowledgeBase
 
@@ -73,6 +75,47 @@ class TestFact:
         with pytest.raises(ValueError):
             Fact("kolor", "")
 
+    def test_intern_returns_same_instance(self):
+
+        fact1 = Fact.intern("kolor", "czerwony")
+        fact2 = Fact.intern("kolor", "czerwony")
+        assert fact1 is fact2
+        assert fact1 == Fact("kolor", "czerwony")
+
+    def test_constructor_returns_interned_instance(self):
+
+        fact = Fact("kolor", "czerwony")
+        assert Fact("kolor", "czerwony") is fact
+        assert Fact.intern("kolor", "czerwony") is fact
+        assert Fact("kolor", "zielony") is not fact
+
+    def test_intern_empty_value_raises_error(self):
+
+        with pytest.raises(ValueError):
+            Fact.intern("kolor", "")
+
+    def test_fact_has_no_instance_dict(self):
+
+        fact = Fact("kolor", "czerwony")
+        assert not hasattr(fact, "__dict__")
+        assert hash(fact) == hash(Fact("kolor", "czerwony"))
+
+    def test_pickled_fact_keeps_equality_and_hash(self):
+
+        fact = Fact.intern("kolor", "czerwony")
+        restored = pickle.loads(pickle.dumps(fact))
+        assert restored == fact
+        assert hash(restored) == hash(fact)
+        assert restored in {fact}
+
+    def test_fact_strings_are_interned(self):
+
+        attribute = "".join(["ko", "lor"])
+        value = "".join(["czer", "wony"])
+        fact = Fact(attribute, value)
+        assert fact.attribute is Fact("kolor", "czerwony").attribute
+        assert fact.value is Fact("kolor", "czerwony").value
+
 
 
 
@@ -118,6 +161,15 @@ class TestRule:
         rule = Rule(id=1, premises=premises, conclusion=conclusion)
         
         assert len(rule) == 3
+
+    def test_rule_premises_are_detached_tuple(self):
+
+        premises = [Fact("a", "1"), Fact("b", "2")]
+        rule = Rule(id=1, premises=premises, conclusion=Fact("c", "3"))
+        premises.append(Fact("x", "9"))
+
+        assert rule.premises == (Fact("a", "1"), Fact("b", "2"))
+        assert len(rule) == 2
     
     def test_rule_repr_contains_premises_and_conclusion(self):
 
@@ -217,3 +269,81 @@ class TestKnowledgeBase:
         
         applicable = kb.get_applicable_rules()
         assert len(applicable) == 0
+
+    def test_get_applicable_rules_follows_added_facts(self):
+
+        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
+        rule2 = Rule(id=2, premises=[Fact("b", "2"), Fact("c", "3")], conclusion=Fact("d", "4"))
+
+        kb = KnowledgeBase(rules=[rule1, rule2], facts={Fact("a", "1")})
+        assert kb.get_applicable_rules() == [rule1]
+
+        kb.add_facts([Fact("b", "2"), Fact("c", "3")])
+        assert kb.get_applicable_rules() == [rule2]
+
+    def test_clone_facts_only_shares_rules_and_copies_facts(self):
+
+        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
+        kb = KnowledgeBase(rules=[rule1], facts={Fact("a", "1")})
+
+        clone = kb.clone_facts_only()
+        clone.add_fact(Fact("c", "3"))
+
+        assert clone.rules is kb.rules
+        assert clone.facts == {Fact("a", "1"), Fact("c", "3")}
+        assert kb.facts == {Fact("a", "1")}
+
+    def test_frozen_facts_are_copied_on_first_add(self):
+
+        initial = frozenset({Fact("a", "1")})
+        kb = KnowledgeBase(rules=[], facts=initial)
+        assert kb.facts is initial
+
+        kb.add_fact(Fact("b", "2"))
+
+        assert kb.facts == {Fact("a", "1"), Fact("b", "2")}
+        assert initial == {Fact("a", "1")}
+
+    def test_get_applicable_rules_sees_direct_mutations(self):
+
+        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
+        kb = KnowledgeBase(rules=[], facts=set())
+        assert kb.get_applicable_rules() == []
+
+        kb.rules.append(rule1)
+        kb.facts.add(Fact("a", "1"))
+        assert kb.get_applicable_rules() == [rule1]
+
+    def test_get_applicable_rules_after_facts_replaced(self):
+
+        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
+        kb = KnowledgeBase(rules=[rule1], facts={Fact("a", "1")})
+        assert kb.get_applicable_rules() == [rule1]
+
+        kb.facts = {Fact("x", "9")}
+
+        assert kb.get_applicable_rules() == []
+
+    def test_get_applicable_rules_after_same_size_swap(self):
+
+        rule1 = Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2"))
+        rule2 = Rule(id=2, premises=[Fact("y", "1")], conclusion=Fact("z", "2"))
+        kb = KnowledgeBase(rules=[rule1, rule2], facts={Fact("a", "1")})
+        assert kb.get_applicable_rules() == [rule1]
+
+        kb.facts.discard(Fact("a", "1"))
+        kb.facts.add(Fact("y", "1"))
+
+        assert kb.get_applicable_rules() == [rule2]
+
+    def test_add_fact_after_direct_discard_keeps_network_consistent(self):
+
+        rule1 = Rule(id=1, premises=[Fact("a", "1"), Fact("c", "3")], conclusion=Fact("b", "2"))
+        kb = KnowledgeBase(rules=[rule1], facts={Fact("a", "1")})
+        assert kb.get_applicable_rules() == []
+
+        kb.facts.discard(Fact("a", "1"))
+        kb.add_fact(Fact("a", "1"))
+        kb.add_fact(Fact("c", "3"))
+
+        assert kb.get_applicable_rules() == [rule1]
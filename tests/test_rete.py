@@ -0,0 +1,49 @@
+import pytest
+from core.models import Fact, Rule
+from core.rete import PremiseNetwork
+
+
+@pytest.fixture
+def rules():
+    return [
+        Rule(id=1, premises=[Fact("a", "1")], conclusion=Fact("b", "2")),
+        Rule(id=2, premises=[Fact("b", "2"), Fact("c", "3")], conclusion=Fact("d", "4")),
+        Rule(id=3, premises=[Fact("b", "2"), Fact("b", "2")], conclusion=Fact("e", "5")),
+    ]
+
+
+class TestPremiseNetwork:
+
+
+
+    def test_rules_satisfied_by_initial_facts_are_activated(self, rules):
+
+        network = PremiseNetwork(rules, {Fact("a", "1")})
+
+        assert network.take_activated() == {0}
+        assert network.unmet == [0, 2, 1]
+
+    def test_asserted_fact_activates_only_completed_rules(self, rules):
+
+        network = PremiseNetwork(rules, {Fact("a", "1")})
+        network.take_activated()
+
+        network.assert_fact(Fact("b", "2"))
+
+        assert network.take_activated() == {2}
+        assert network.unmet == [0, 1, 0]
+
+    def test_take_activated_clears_agenda(self, rules):
+
+        network = PremiseNetwork(rules, {Fact("b", "2"), Fact("c", "3")})
+
+        assert network.take_activated() == {1, 2}
+        assert network.take_activated() == set()
+
+    def test_unknown_fact_is_ignored(self, rules):
+
+        network = PremiseNetwork(rules, [])
+        network.assert_facts([Fact("x", "9")])
+
+        assert network.take_activated() == set()
+        assert network.unmet == [1, 2, 1]
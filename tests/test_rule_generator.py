@@ -17,59 +17,78 @@
 
 import pytest
 import pandas as pd
+import numpy as np
 
 from preprocessing.rule_generator import RuleGenerator
 from core.models import Fact, Rule
 
 
+@pytest.fixture(scope="module")
+def df_colors():
+    return pd.DataFrame({
+        "color": ["red", "blue"],
+        "size": ["big", "small"],
+        "class": ["A", "B"]
+    })
+
+
+@pytest.fixture(scope="module")
+def df_single_row():
+    return pd.DataFrame({
+        "color": ["red"],
+        "size": ["big"],
+        "class": ["A"]
+    })
+
+
+@pytest.fixture(scope="module")
+def df_ids():
+    return pd.DataFrame({
+        "Id": [1, 2, 3],
+        "color": ["red", "blue", "green"],
+        "class": ["A", "B", "C"]
+    })
+
+
+@pytest.fixture(scope="module")
+def df_many_premises():
+    return pd.DataFrame({
+        "a": ["1"],
+        "b": ["2"],
+        "c": ["3"],
+        "d": ["4"],
+        "e": ["5"],
+        "class": ["X"]
+    })
+
+
 class TestRuleGeneratorBasic:
 
     
-    def test_generates_rules_from_dataframe(self):
+    def test_generates_rules_from_dataframe(self, df_colors, rule_generator):
 
-        df = pd.DataFrame({
-            "color": ["red", "blue"],
-            "size": ["big", "small"],
-            "class": ["A", "B"]
-        })
-        
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df_colors, decision_column="class")
         
         assert len(rules) == 2
         assert all(isinstance(r, Rule) for r in rules)
     
-    def test_rule_has_correct_premises(self):
+    def test_rule_has_correct_premises(self, df_single_row, rule_generator):
 
-        df = pd.DataFrame({
-            "color": ["red"],
-            "size": ["big"],
-            "class": ["A"]
-        })
-        
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df_single_row, decision_column="class")
         
         rule = rules[0]
         assert len(rule.premises) == 2
         assert Fact("color", "red") in rule.premises
         assert Fact("size", "big") in rule.premises
     
-    def test_rule_has_correct_conclusion(self):
+    def test_rule_has_correct_conclusion(self, df_single_row, rule_generator):
 
-        df = pd.DataFrame({
-            "color": ["red"],
-            "size": ["big"],
-            "class": ["A"]
-        })
-        
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df_single_row, decision_column="class")
         
         rule = rules[0]
         assert rule.conclusion == Fact("class", "A")
     
-    def test_rules_have_unique_ids(self):
+    def test_rules_have_unique_ids(self, rule_generator):
 
         df = pd.DataFrame({
             "a": ["1", "2", "3"],
@@ -77,8 +96,7 @@ class TestRuleGeneratorBasic:
             "class": ["A", "B", "C"]
         })
         
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df, decision_column="class")
         
         ids = [r.id for r in rules]
         assert len(ids) == len(set(ids))
@@ -88,7 +106,7 @@ class TestRuleGeneratorDuplicates:
 
 
     
-    def test_removes_duplicate_rows(self):
+    def test_removes_duplicate_rows(self, rule_generator):
 
         df = pd.DataFrame({
             "color": ["red", "red", "blue"],
@@ -96,13 +114,12 @@ class TestRuleGeneratorDuplicates:
             "class": ["A", "A", "B"]
         })
         
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df, decision_column="class")
         
 
         assert len(rules) == 2
     
-    def test_keeps_different_conclusions_for_same_premises(self):
+    def test_keeps_different_conclusions_for_same_premises(self, rule_generator):
 
 
         df = pd.DataFrame({
@@ -111,8 +128,7 @@ class TestRuleGeneratorDuplicates:
             "class": ["A", "B"]
         })
         
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df, decision_column="class")
         
 
         assert len(rules) == 2
@@ -122,73 +138,56 @@ class TestRuleGeneratorEdgeCases:
 
 
     
-    def test_single_premise(self):
+    def test_single_premise(self, rule_generator):
 
         df = pd.DataFrame({
             "color": ["red", "blue"],
             "class": ["A", "B"]
         })
         
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df, decision_column="class")
         
         assert len(rules) == 2
         assert len(rules[0].premises) == 1
     
-    def test_many_premises(self):
+    def test_many_premises(self, df_many_premises, rule_generator):
 
-        df = pd.DataFrame({
-            "a": ["1"],
-            "b": ["2"],
-            "c": ["3"],
-            "d": ["4"],
-            "e": ["5"],
-            "class": ["X"]
-        })
-        
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df_many_premises, decision_column="class")
         
         assert len(rules[0].premises) == 5
     
-    def test_empty_dataframe_raises_error(self):
+    def test_empty_dataframe_raises_error(self, rule_generator):
 
         df = pd.DataFrame(columns=["a", "b", "class"])
         
-        generator = RuleGenerator()
-        
         with pytest.raises(ValueError):
-            generator.generate(df, decision_column="class")
+            rule_generator.generate(df, decision_column="class")
     
-    def test_missing_decision_column_raises_error(self):
+    def test_missing_decision_column_raises_error(self, rule_generator):
 
         df = pd.DataFrame({
             "a": ["1"],
             "b": ["2"]
         })
         
-        generator = RuleGenerator()
-        
         with pytest.raises(ValueError):
-            generator.generate(df, decision_column="class")
+            rule_generator.generate(df, decision_column="class")
     
-    def test_only_decision_column_raises_error(self):
+    def test_only_decision_column_raises_error(self, rule_generator):
 
         df = pd.DataFrame({
             "class": ["A", "B"]
         })
         
-        generator = RuleGenerator()
-        
         with pytest.raises(ValueError):
-            generator.generate(df, decision_column="class")
+            rule_generator.generate(df, decision_column="class")
 
 
 class TestRuleGeneratorDataTypes:
 
 
     
-    def test_converts_numeric_to_string(self):
+    def test_converts_numeric_to_string(self, rule_generator):
 
         df = pd.DataFrame({
             "age": [25, 30],
@@ -196,31 +195,53 @@ class TestRuleGeneratorDataTypes:
             "class": ["A", "B"]
         })
         
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df, decision_column="class")
         
 
         for rule in rules:
             for premise in rule.premises:
                 assert isinstance(premise.value, str)
     
-    def test_handles_float_values(self):
+    def test_handles_float_values(self, rule_generator):
 
         df = pd.DataFrame({
             "value": [1.5, 2.7],
             "class": ["A", "B"]
         })
         
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df, decision_column="class")
         
         assert len(rules) == 2
 
+    def test_equal_values_with_different_text_stay_distinct(self, rule_generator):
+
+        df = pd.DataFrame({
+            "value": pd.Series([1, 1.0, True], dtype=object),
+            "class": ["A", "B", "C"]
+        })
+
+        rules = rule_generator.generate(df, decision_column="class")
+
+        assert [r.premises[0].value for r in rules] == ["1", "1.0", "True"]
+
+
+    def test_categorical_columns_use_category_labels(self, rule_generator):
+
+        df = pd.DataFrame({
+            "size": pd.Categorical(["big", None, "small"], categories=["big", "small", "tiny"]),
+            "class": pd.Categorical(["A", "B", "A"])
+        })
+
+        rules = rule_generator.generate(df, decision_column="class")
+
+        assert [r.premises[0] for r in rules] == [Fact("size", "big"), Fact("size", "nan"), Fact("size", "small")]
+        assert [r.conclusion.value for r in rules] == ["A", "B", "A"]
+
 
 class TestRuleGeneratorStatistics:
 
     
-    def test_get_statistics(self):
+    def test_get_statistics(self, rule_generator):
 
         df = pd.DataFrame({
             "a": ["1", "2", "3"],
@@ -228,150 +249,119 @@ class TestRuleGeneratorStatistics:
             "class": ["A", "B", "A"]
         })
         
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
-        stats = generator.get_statistics()
+        rules = rule_generator.generate(df, decision_column="class")
+        stats = rule_generator.get_statistics()
         
         assert "total_rules" in stats
         assert "avg_premises" in stats
         assert stats["total_rules"] == 3
         assert stats["avg_premises"] == 2.0
 
+    def test_repeated_generate_reuses_rules(self):
+
+        df = pd.DataFrame({
+            "a": ["1", "2", "3"],
+            "b": ["x", "y", "z"],
+            "class": ["A", "B", "A"]
+        })
 
+        first = RuleGenerator()
+        rules = first.generate(df, decision_column="class")
+        rules.clear()
+        first.get_statistics()["attribute_columns"].clear()
 
-class TestRuleGeneratorExcludeColumns:
+        second = RuleGenerator()
+        again = second.generate(df.copy(), decision_column="class")
 
+        assert len(again) == 3
+        assert second.get_statistics()["attribute_columns"] == ["a", "b"]
+        assert [r.conclusion for r in again] == [Fact("class", "A"), Fact("class", "B"), Fact("class", "A")]
 
-    
-    def test_exclude_single_column(self):
+    def test_generate_distinguishes_excluded_columns(self, rule_generator):
 
         df = pd.DataFrame({
-            "Id": [1, 2, 3],
-            "color": ["red", "blue", "green"],
-            "class": ["A", "B", "C"]
+            "a": ["1", "2"],
+            "b": ["x", "y"],
+            "class": ["A", "B"]
         })
-        
-        generator = RuleGenerator()
-        rules = generator.generate(
-            df, 
-            decision_column="class",
-            exclude_columns=["Id"]
-        )
-        
 
-        for rule in rules:
-            attributes = [p.attribute for p in rule.premises]
-            assert "Id" not in attributes
-        
+        both = rule_generator.generate(df, decision_column="class")
+        only_a = rule_generator.generate(df, decision_column="class", exclude_columns=["b"])
+
+        assert all(len(r.premises) == 2 for r in both)
+        assert all(len(r.premises) == 1 for r in only_a)
+
+
+
+class TestRuleGeneratorExcludeColumns:
 
-        assert all(len(r.premises) == 1 for r in rules)
-    
-    def test_exclude_multiple_columns(self):
 
-        df = pd.DataFrame({
-            "Id": [1, 2],
-            "row_number": [100, 200],
-            "color": ["red", "blue"],
-            "class": ["A", "B"]
-        })
-        
-        generator = RuleGenerator()
-        rules = generator.generate(
-            df,
-            decision_column="class",
-            exclude_columns=["Id", "row_number"]
-        )
-        
-        for rule in rules:
-            attributes = [p.attribute for p in rule.premises]
-            assert "Id" not in attributes
-            assert "row_number" not in attributes
     
-    def test_exclude_nonexistent_column_ignored(self):
+    @pytest.mark.parametrize("exclude,expected_attributes", [
+        (["Id"], ["row_number", "color"]),
+        (["Id", "row_number"], ["color"]),
+        (["nonexistent"], ["Id", "row_number", "color"]),
+    ], ids=["single", "multiple", "nonexistent_ignored"])
+    def test_exclude_columns(self, rule_generator, exclude, expected_attributes):
 
         df = pd.DataFrame({
-            "color": ["red", "blue"],
-            "class": ["A", "B"]
+            "Id": [1, 2, 3],
+            "row_number": [100, 200, 300],
+            "color": ["red", "blue", "green"],
+            "class": ["A", "B", "C"]
         })
         
-        generator = RuleGenerator()
-
-        rules = generator.generate(
+        rules = rule_generator.generate(
             df,
             decision_column="class",
-            exclude_columns=["nonexistent"]
+            exclude_columns=exclude
         )
         
-        assert len(rules) == 2
+        assert len(rules) == 3
+        for rule in rules:
+            assert [p.attribute for p in rule.premises] == expected_attributes
 
 
 class TestRuleGeneratorAutoDetectId:
 
 
     
-    def test_detect_column_named_id(self):
+    @pytest.mark.parametrize("col_name,col_data,expected", [
+        ("Id", [1, 2, 3], True),
+        ("row_index", [1, 2, 3], True),
+        ("row_nr", [1, 2, 3, 4, 5], True),
+        ("age", [25, 30, 25, 40, 30], False),
+    ], ids=["named_id", "named_index", "sequential_unique", "normal_numeric"])
+    def test_detect_id_column(self, rule_generator, col_name, col_data, expected):
 
         df = pd.DataFrame({
-            "Id": [1, 2, 3],
-            "color": ["red", "blue", "green"],
-            "class": ["A", "B", "C"]
+            col_name: col_data,
+            "color": ["red", "blue", "green", "red", "blue"][:len(col_data)],
+            "class": ["A", "B", "C", "A", "B"][:len(col_data)]
         })
         
-        generator = RuleGenerator()
-        id_columns = generator.detect_id_columns(df)
+        id_columns = rule_generator.detect_id_columns(df)
         
-        assert "Id" in id_columns
-    
-    def test_detect_column_named_index(self):
+        assert (col_name in id_columns) == expected
 
-        df = pd.DataFrame({
-            "row_index": [1, 2, 3],
-            "color": ["red", "blue", "green"],
-            "class": ["A", "B", "C"]
-        })
-        
-        generator = RuleGenerator()
-        id_columns = generator.detect_id_columns(df)
-        
-        assert "row_index" in id_columns
-    
-    def test_detect_sequential_unique_column(self):
+    def test_detect_id_columns_with_nullable_dtypes(self, rule_generator):
 
         df = pd.DataFrame({
-            "row_nr": [1, 2, 3, 4, 5],
-            "color": ["red", "blue", "green", "red", "blue"],
-            "class": ["A", "B", "C", "A", "B"]
+            "seq": pd.array([1, 2, pd.NA, 3], dtype="Int64"),
+            "age": pd.array([25, pd.NA, 25, 40], dtype="Int64"),
+            "flag": pd.array([True, pd.NA, False, True], dtype="boolean"),
+            "big": np.array([2**63 + 1, 2**63 + 2, 2**63 + 3, 2**63 + 4], dtype=np.uint64),
+            "class": ["A", "B", "A", "B"]
         })
-        
-        generator = RuleGenerator()
-        id_columns = generator.detect_id_columns(df)
-        
-        assert "row_nr" in id_columns
-    
-    def test_does_not_detect_normal_numeric_column(self):
 
-        df = pd.DataFrame({
-            "age": [25, 30, 25, 40, 30],
-            "color": ["red", "blue", "green", "red", "blue"],
-            "class": ["A", "B", "C", "A", "B"]
-        })
-        
-        generator = RuleGenerator()
-        id_columns = generator.detect_id_columns(df)
-        
-        assert "age" not in id_columns
-    
-    def test_auto_exclude_id_columns(self):
+        id_columns = rule_generator.detect_id_columns(df)
 
-        df = pd.DataFrame({
-            "Id": [1, 2, 3],
-            "color": ["red", "blue", "green"],
-            "class": ["A", "B", "C"]
-        })
-        
-        generator = RuleGenerator()
-        rules = generator.generate(
-            df,
+        assert id_columns == ["seq", "big"]
+
+    def test_auto_exclude_id_columns(self, df_ids, rule_generator):
+
+        rules = rule_generator.generate(
+            df_ids,
             decision_column="class",
             auto_exclude_id=True
         )
@@ -381,16 +371,9 @@ class TestRuleGeneratorAutoDetectId:
             attributes = [p.attribute for p in rule.premises]
             assert "Id" not in attributes
     
-    def test_auto_exclude_disabled_by_default(self):
+    def test_auto_exclude_disabled_by_default(self, df_ids, rule_generator):
 
-        df = pd.DataFrame({
-            "Id": [1, 2, 3],
-            "color": ["red", "blue", "green"],
-            "class": ["A", "B", "C"]
-        })
-        
-        generator = RuleGenerator()
-        rules = generator.generate(df, decision_column="class")
+        rules = rule_generator.generate(df_ids, decision_column="class")
         
 
         all_attributes = []
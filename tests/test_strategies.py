@@ -193,6 +193,23 @@ class TestRecencyStrategy:
         
         assert selected.id == 1
 
+    def test_select_sees_facts_added_between_calls(self):
+
+        fact1 = Fact("a", "1")
+        fact2 = Fact("b", "2")
+
+        rule1 = Rule(id=1, premises=[fact1], conclusion=Fact("x", "1"))
+        rule2 = Rule(id=2, premises=[fact2], conclusion=Fact("x", "2"))
+
+        facts_with_recency = {fact1: 1}
+
+        strategy = RecencyStrategy()
+        assert strategy.select([rule1], facts_with_recency).id == 1
+
+        facts_with_recency[fact2] = 2
+        assert strategy.select([rule1, rule2], facts_with_recency).id == 2
+        assert strategy.select([rule1, rule2], {fact1: 3, fact2: 2}).id == 1
+
 
 class TestStrategyInterface:
 
@@ -31,15 +31,15 @@ def test_random_strategy_with_seed_is_deterministic():
         Rule(4, [Fact("A", "1")], Fact("E", "1")),
         Rule(5, [Fact("A", "1")], Fact("F", "1"))
     ]
-    facts = {Fact("A", "1")}
+    facts = frozenset({Fact("A", "1")})
 
 
-    kb1 = KnowledgeBase(rules=rules, facts=facts.copy())
+    kb1 = KnowledgeBase(rules=rules, facts=facts)
     engine1 = ForwardChaining(RandomStrategy(seed=42))
     result1 = engine1.run(kb1)
 
 
-    kb2 = KnowledgeBase(rules=rules, facts=facts.copy())
+    kb2 = KnowledgeBase(rules=rules, facts=facts)
     engine2 = ForwardChaining(RandomStrategy(seed=42))
     result2 = engine2.run(kb2)
 
@@ -64,15 +64,15 @@ def test_random_strategy_with_different_seeds():
         Rule(i, [Fact("A", "1")], Fact(f"Out{i}", "1"))
         for i in range(1, 11)
     ]
-    facts = {Fact("A", "1")}
+    facts = frozenset({Fact("A", "1")})
 
 
-    kb1 = KnowledgeBase(rules=rules, facts=facts.copy())
+    kb1 = KnowledgeBase(rules=rules, facts=facts)
     engine1 = ForwardChaining(RandomStrategy(seed=42))
     result1 = engine1.run(kb1)
 
 
-    kb2 = KnowledgeBase(rules=rules, facts=facts.copy())
+    kb2 = KnowledgeBase(rules=rules, facts=facts)
     engine2 = ForwardChaining(RandomStrategy(seed=999))
     result2 = engine2.run(kb2)
 
@@ -231,15 +231,15 @@ def test_inference_with_seeded_random_is_reproducible():
         Rule(i, [Fact("A", "1")], Fact(f"Out{i}", "1"))
         for i in range(1, 21)
     ]
-    facts = {Fact("A", "1")}
+    facts = frozenset({Fact("A", "1")})
 
 
-    kb1 = KnowledgeBase(rules=rules, facts=facts.copy())
+    kb1 = KnowledgeBase(rules=rules, facts=facts)
     engine1 = ForwardChaining(RandomStrategy(seed=12345))
     result1 = engine1.run(kb1)
 
 
-    kb2 = KnowledgeBase(rules=rules, facts=facts.copy())
+    kb2 = KnowledgeBase(rules=rules, facts=facts)
     engine2 = ForwardChaining(RandomStrategy(seed=12345))
     result2 = engine2.run(kb2)
 
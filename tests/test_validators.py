@@ -312,3 +312,17 @@ class TestValidateDecisionColumn:
         error_codes = {err.code for err in validation.errors}
         assert "DF01" in error_codes
         assert "DC03" in error_codes
+
+
+class TestValidationResult:
+
+    def test_error_codes_reflect_later_errors(self):
+
+        result = ValidationResult(is_valid=True)
+        assert result.error_codes == frozenset()
+
+        result.errors.append(ValidationError("F01", "Plik nie istnieje", True))
+        assert result.error_codes == frozenset({"F01"})
+
+        result.errors = [ValidationError("C01", "Nieprawidłowy separator", True)]
+        assert result.error_codes == frozenset({"C01"})